@@ -0,0 +1,55 @@
+"""weekly volume rollup
+
+Revision ID: 0dd3fbbeee93
+Revises: de0d0f31ae1d
+Create Date: 2026-10-17 10:12:41.381204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0dd3fbbeee93'
+down_revision: Union[str, Sequence[str], None] = 'de0d0f31ae1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # id is part of a composite primary key, so it was created without a default and reports couldn't be inserted
+    op.execute('ALTER TABLE workout_report ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY')
+    op.create_table('weekly_volume',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('exercise_id', sa.Integer(), nullable=False),
+    sa.Column('week_start', sa.Date(), nullable=False),
+    sa.Column('total_sets', sa.Integer(), nullable=False),
+    sa.Column('total_reps', sa.Integer(), nullable=False),
+    sa.Column('tonnage', sa.Float(), nullable=False),
+    sa.Column('top_weight', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercise.id'], name='fk_weekly_volume_exercise'),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], name='fk_weekly_volume_user'),
+    sa.PrimaryKeyConstraint('user_id', 'exercise_id', 'week_start')
+    )
+    # Backfill from the set reports already recorded, same as src.commands.rebuild_weekly_volume
+    op.execute("""
+        INSERT INTO weekly_volume (user_id, exercise_id, week_start, total_sets, total_reps, tonnage, top_weight)
+        SELECT wp.user_id, ssr.exercise_id, CAST(date_trunc('week', wr.report_date) AS DATE), count(*),
+               sum(r.reps), sum(ssr.weight * r.reps), max(ssr.weight)
+        FROM split_set_report ssr
+        JOIN workout_report wr ON wr.id = ssr.workout_report_id
+        JOIN workout_plan wp ON wp.id = wr.workout_plan_id
+        CROSS JOIN LATERAL (
+            SELECT CASE WHEN btrim(ssr.reps) ~ '^[0-9]+$' THEN CAST(btrim(ssr.reps) AS INTEGER) ELSE 0 END AS reps
+        ) r
+        GROUP BY wp.user_id, ssr.exercise_id, CAST(date_trunc('week', wr.report_date) AS DATE)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('weekly_volume')
+    op.execute('ALTER TABLE workout_report ALTER COLUMN id DROP IDENTITY')
@@ -0,0 +1,48 @@
+"""partial indexes on live catalog rows
+
+Revision ID: 6b1e4f7a9c20
+Revises: 0dd3fbbeee93
+Create Date: 2026-10-17 11:02:17.508813
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b1e4f7a9c20'
+down_revision: Union[str, Sequence[str], None] = '0dd3fbbeee93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text('NOT deleted')
+
+INDEXES = [
+    ('idx_muscle_group_live', 'muscle_group', ['user_id', 'group_name']),
+    ('idx_muscle_live_group', 'muscle', ['group_name', 'muscle_name']),
+    ('idx_muscle_live_user', 'muscle', ['user_id', 'muscle_name']),
+    ('idx_exercise_live', 'exercise', ['user_id', 'exercise_name']),
+    ('idx_equipment_live_user', 'equipment', ['user_id', 'equipment_name']),
+    ('idx_equipment_live_group', 'equipment', ['group_name']),
+    ('idx_workout_plan_live', 'workout_plan', ['user_id', 'workout_plan_name']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so the tables stay writable, which can't happen inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_where=LIVE_ROWS, postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
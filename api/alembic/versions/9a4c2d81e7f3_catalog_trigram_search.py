@@ -0,0 +1,53 @@
+"""trigram search over catalog names
+
+Revision ID: 9a4c2d81e7f3
+Revises: 6b1e4f7a9c20
+Create Date: 2026-10-17 14:36:52.118904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4c2d81e7f3'
+down_revision: Union[str, Sequence[str], None] = '6b1e4f7a9c20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('idx_exercise_name_search', 'exercise', 'exercise_name'),
+    ('idx_equipment_name_search', 'equipment', 'equipment_name'),
+    ('idx_muscle_name_search', 'muscle', 'muscle_name'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+    # unaccent() is only STABLE, the wrapper pins its dictionary so it can be indexed
+    op.execute("""
+        CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+    """)
+
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.create_index(
+                name, table, [sa.text(f'lower(f_unaccent({column})) gin_trgm_ops')], unique=False,
+                postgresql_using='gin', postgresql_where=sa.text('NOT deleted'),
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+    op.execute('DROP FUNCTION IF EXISTS f_unaccent(text)')
@@ -0,0 +1,37 @@
+"""personal record report dates
+
+Revision ID: a7c4e9d2b816
+Revises: f3b8c1d6a472
+Create Date: 2026-10-18 15:32:07.418236
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c4e9d2b816'
+down_revision: Union[str, Sequence[str], None] = 'f3b8c1d6a472'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RECORDS = ('max_weight', 'best_one_rep_max', 'best_set_volume')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for record in RECORDS:
+        op.add_column('personal_record', sa.Column(f'{record}_report_date', sa.Date(), nullable=True))
+        # Reports already detached are left NULL, the rebuild treats them as archived
+        op.execute(f"""
+            UPDATE personal_record pr SET {record}_report_date = wr.report_date
+            FROM workout_report wr WHERE wr.id = pr.{record}_report_id
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for record in RECORDS:
+        op.drop_column('personal_record', f'{record}_report_date')
@@ -0,0 +1,58 @@
+"""change versions for the delta sync
+
+Revision ID: c4f81a6d2e95
+Revises: b7d3e5a2c418
+Create Date: 2026-10-17 16:21:07.903355
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f81a6d2e95'
+down_revision: Union[str, Sequence[str], None] = 'b7d3e5a2c418'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['muscle_group', 'muscle', 'equipment', 'exercise', 'workout_plan', 'workout_split', 'split_exercise']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Set to the ID of the writing transaction, see src.models.change_tracking
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_change_version() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$ BEGIN NEW.change_version := pg_current_xact_id()::text::bigint; RETURN NEW; END $$
+    """)
+
+    for table in TABLES:
+        # A constant default doesn't rewrite the table, existing rows start at version 0
+        op.add_column(table, sa.Column('change_version', sa.BigInteger(), server_default=sa.text('0'), nullable=False))
+        op.execute(
+            f'CREATE TRIGGER {table}_change_version BEFORE INSERT OR UPDATE ON {table} '
+            'FOR EACH ROW EXECUTE FUNCTION set_change_version()'
+        )
+
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(
+                f'idx_{table}_change_version', table, ['change_version'], unique=False,
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.drop_index(f'idx_{table}_change_version', table_name=table, postgresql_concurrently=True, if_exists=True)
+
+    for table in reversed(TABLES):
+        op.execute(f'DROP TRIGGER IF EXISTS {table}_change_version ON {table}')
+        op.drop_column(table, 'change_version')
+
+    op.execute('DROP FUNCTION IF EXISTS set_change_version()')
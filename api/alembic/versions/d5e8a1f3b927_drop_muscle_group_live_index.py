@@ -0,0 +1,34 @@
+"""drop the live muscle group index
+
+Revision ID: d5e8a1f3b927
+Revises: a7c4e9d2b816
+Create Date: 2026-10-18 17:05:41.209374
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e8a1f3b927'
+down_revision: Union[str, Sequence[str], None] = 'a7c4e9d2b816'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Same columns in the same order as the primary key, which already serves every lookup and page
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_muscle_group_live', table_name='muscle_group', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_muscle_group_live', 'muscle_group', ['user_id', 'group_name'], unique=False,
+            postgresql_where=sa.text('NOT deleted'), postgresql_concurrently=True, if_not_exists=True,
+        )
@@ -0,0 +1,77 @@
+"""personal records
+
+Revision ID: e2a9b4c7d150
+Revises: c4f81a6d2e95
+Create Date: 2026-10-17 22:41:18.206514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a9b4c7d150'
+down_revision: Union[str, Sequence[str], None] = 'c4f81a6d2e95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('personal_record',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('exercise_id', sa.Integer(), nullable=False),
+    sa.Column('max_weight', sa.Float(), nullable=False),
+    sa.Column('max_weight_reps', sa.Integer(), nullable=False),
+    sa.Column('max_weight_report_id', sa.Integer(), nullable=False),
+    sa.Column('best_one_rep_max', sa.Float(), nullable=False),
+    sa.Column('best_one_rep_max_weight', sa.Float(), nullable=False),
+    sa.Column('best_one_rep_max_reps', sa.Integer(), nullable=False),
+    sa.Column('best_one_rep_max_report_id', sa.Integer(), nullable=False),
+    sa.Column('best_set_volume', sa.Float(), nullable=False),
+    sa.Column('best_set_volume_weight', sa.Float(), nullable=False),
+    sa.Column('best_set_volume_reps', sa.Integer(), nullable=False),
+    sa.Column('best_set_volume_report_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercise.id'], name='fk_personal_record_exercise'),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], name='fk_personal_record_user'),
+    sa.PrimaryKeyConstraint('user_id', 'exercise_id')
+    )
+    # Backfill from the set reports already recorded with the default Epley formula,
+    # same as src.commands.rebuild_personal_records
+    op.execute("""
+        WITH sets AS (
+            SELECT wp.user_id, ssr.exercise_id, ssr.workout_report_id AS report_id, ssr.weight, r.reps,
+                   CASE WHEN r.reps = 1 THEN ssr.weight ELSE ssr.weight * (1 + r.reps / 30.0) END AS one_rep_max,
+                   ssr.weight * r.reps AS set_volume
+            FROM split_set_report ssr
+            JOIN workout_report wr ON wr.id = ssr.workout_report_id
+            JOIN workout_plan wp ON wp.id = wr.workout_plan_id
+            CROSS JOIN LATERAL (
+                SELECT CASE WHEN btrim(ssr.reps) ~ '^[0-9]+$' THEN CAST(btrim(ssr.reps) AS INTEGER) ELSE 0 END AS reps
+            ) r
+            WHERE r.reps >= 1
+        )
+        INSERT INTO personal_record
+        SELECT w.user_id, w.exercise_id, w.weight, w.reps, w.report_id,
+               o.one_rep_max, o.weight, o.reps, o.report_id,
+               v.set_volume, v.weight, v.reps, v.report_id
+        FROM (
+            SELECT DISTINCT ON (user_id, exercise_id) * FROM sets
+            ORDER BY user_id, exercise_id, weight DESC, report_id
+        ) w
+        JOIN (
+            SELECT DISTINCT ON (user_id, exercise_id) * FROM sets
+            ORDER BY user_id, exercise_id, one_rep_max DESC, report_id
+        ) o USING (user_id, exercise_id)
+        JOIN (
+            SELECT DISTINCT ON (user_id, exercise_id) * FROM sets
+            ORDER BY user_id, exercise_id, set_volume DESC, report_id
+        ) v USING (user_id, exercise_id)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('personal_record')
@@ -0,0 +1,51 @@
+"""drop the unused live catalog indexes and uq_exercise
+
+Revision ID: e9f2b6c4a813
+Revises: d5e8a1f3b927
+Create Date: 2026-10-18 18:12:09.337512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9f2b6c4a813'
+down_revision: Union[str, Sequence[str], None] = 'd5e8a1f3b927'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text('NOT deleted')
+
+# No query filters these tables on these columns, the catalog is read by id, change_version or trigram
+INDEXES = [
+    ('idx_muscle_live_group', 'muscle', ['group_name', 'muscle_name']),
+    ('idx_muscle_live_user', 'muscle', ['user_id', 'muscle_name']),
+    ('idx_exercise_live', 'exercise', ['user_id', 'exercise_name']),
+    ('idx_equipment_live_user', 'equipment', ['user_id', 'equipment_name']),
+    ('idx_equipment_live_group', 'equipment', ['group_name']),
+    ('idx_workout_plan_live', 'workout_plan', ['user_id', 'workout_plan_name']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 6b1e4f7a9c20 no longer creates it: it failed on duplicate exercises, and with user_id NULL it
+    # didn't keep the global catalog unique anyway
+    op.execute('ALTER TABLE exercise DROP CONSTRAINT IF EXISTS uq_exercise')
+
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in reversed(INDEXES):
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_where=LIVE_ROWS, postgresql_concurrently=True, if_not_exists=True,
+            )
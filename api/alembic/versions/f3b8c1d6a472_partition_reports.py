@@ -0,0 +1,192 @@
+"""partition the report tables by month
+
+Revision ID: f3b8c1d6a472
+Revises: e2a9b4c7d150
+Create Date: 2026-10-18 09:14:52.630117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8c1d6a472'
+down_revision: Union[str, Sequence[str], None] = 'e2a9b4c7d150'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+SET_REPORT_COLUMNS = 'workout_report_id, exercise_id, split, execution_order, set_number, reps, weight, notes'
+
+
+def create_report_tables(partitioned: bool) -> None:
+    """workout_report and split_set_report, partitioned by month on report_date or as they were before."""
+    if partitioned:
+        report_keys = [sa.UniqueConstraint('id', 'report_date', name='uq_workout_report_id')]
+        set_report_date = [sa.Column('report_date', sa.Date(), nullable=False)]
+        set_report_keys = [
+            sa.ForeignKeyConstraint(
+                ['workout_report_id', 'report_date'], ['workout_report.id', 'workout_report.report_date'],
+                name='fk_set_report_workout_report',
+            ),
+            sa.PrimaryKeyConstraint('workout_report_id', 'exercise_id', 'split', 'set_number', 'report_date'),
+        ]
+        options = {'postgresql_partition_by': 'RANGE (report_date)'}
+    else:
+        report_keys = [sa.UniqueConstraint('id')]
+        set_report_date = []
+        set_report_keys = [
+            sa.ForeignKeyConstraint(['workout_report_id'], ['workout_report.id'], name='fk_set_report_workout_report'),
+            sa.PrimaryKeyConstraint('workout_report_id', 'exercise_id', 'split', 'set_number'),
+        ]
+        options = {}
+
+    op.create_table('workout_report',
+    sa.Column('report_date', sa.Date(), nullable=False),
+    sa.Column('id', sa.Integer(), sa.Identity(always=False), nullable=False),
+    sa.Column('workout_plan_id', sa.Integer(), nullable=False),
+    sa.Column('split', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['split', 'workout_plan_id'], ['workout_split.split', 'workout_split.workout_plan_id'], name='fk_workout_report_workout_plan'),
+    sa.PrimaryKeyConstraint('report_date', 'id', 'workout_plan_id'),
+    *report_keys,
+    **options,
+    )
+    op.create_table('split_set_report',
+    sa.Column('workout_report_id', sa.Integer(), nullable=False),
+    sa.Column('exercise_id', sa.Integer(), nullable=False),
+    sa.Column('split', sa.String(), nullable=False),
+    sa.Column('execution_order', sa.Integer(), nullable=False),
+    sa.Column('set_number', sa.Integer(), nullable=False),
+    sa.Column('reps', sa.String(), nullable=False),
+    sa.Column('weight', sa.Float(), nullable=False),
+    sa.Column('notes', sa.String(), nullable=True),
+    *set_report_date,
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercise.id'], name='fk_set_report_exercise'),
+    *set_report_keys,
+    **options,
+    )
+
+
+def rename_report_tables(suffix: str) -> None:
+    """Move the current report tables aside, with the names of their constraints and identity sequence."""
+    op.execute(f'ALTER TABLE split_set_report RENAME CONSTRAINT split_set_report_pkey TO split_set_report_{suffix}_pkey')
+    op.rename_table('split_set_report', f'split_set_report_{suffix}')
+    op.execute(f'ALTER TABLE workout_report RENAME CONSTRAINT workout_report_pkey TO workout_report_{suffix}_pkey')
+    op.execute(f'ALTER SEQUENCE workout_report_id_seq RENAME TO workout_report_{suffix}_id_seq')
+    op.rename_table('workout_report', f'workout_report_{suffix}')
+
+
+def copy_reports(source: str, partitioned: bool) -> None:
+    op.execute(f"""
+        INSERT INTO workout_report (report_date, id, workout_plan_id, split)
+        SELECT report_date, id, workout_plan_id, split FROM workout_report_{source}
+    """)
+    if partitioned:
+        op.execute(f"""
+            INSERT INTO split_set_report ({SET_REPORT_COLUMNS}, report_date)
+            SELECT {', '.join(f'ssr.{column}' for column in SET_REPORT_COLUMNS.split(', '))}, wr.report_date
+            FROM split_set_report_{source} ssr
+            JOIN workout_report_{source} wr ON wr.id = ssr.workout_report_id
+        """)
+    else:
+        op.execute(f"""
+            INSERT INTO split_set_report ({SET_REPORT_COLUMNS})
+            SELECT {SET_REPORT_COLUMNS} FROM split_set_report_{source}
+        """)
+
+    op.execute("SELECT setval(pg_get_serial_sequence('workout_report', 'id'), max(id)) FROM workout_report")
+    op.drop_table(f'split_set_report_{source}')
+    op.drop_table(f'workout_report_{source}')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Same as src.models.partitioning.CREATE_REPORT_PARTITIONS
+    op.execute("""
+        CREATE OR REPLACE FUNCTION create_report_partitions(first_month date, months integer) RETURNS integer
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            month_start date;
+            month_end date;
+            suffix text;
+            has_rows boolean;
+            created integer := 0;
+        BEGIN
+            PERFORM pg_advisory_xact_lock(hashtext('create_report_partitions'));
+
+            FOR i IN 0 .. months - 1 LOOP
+                month_start := (date_trunc('month', first_month) + make_interval(months => i))::date;
+                month_end := (month_start + interval '1 month')::date;
+                suffix := to_char(month_start, '"y"YYYY"m"MM');
+                CONTINUE WHEN to_regclass('workout_report_' || suffix) IS NOT NULL;
+
+                SELECT EXISTS (
+                    SELECT FROM workout_report_default WHERE report_date >= month_start AND report_date < month_end
+                ) INTO has_rows;
+
+                IF has_rows THEN
+                    EXECUTE format(
+                        'CREATE TEMP TABLE moved_workout_report AS SELECT * FROM workout_report_default '
+                        'WHERE report_date >= %L AND report_date < %L', month_start, month_end
+                    );
+                    EXECUTE format(
+                        'CREATE TEMP TABLE moved_split_set_report AS SELECT * FROM split_set_report_default '
+                        'WHERE report_date >= %L AND report_date < %L', month_start, month_end
+                    );
+                    DELETE FROM split_set_report_default WHERE report_date >= month_start AND report_date < month_end;
+                    DELETE FROM workout_report_default WHERE report_date >= month_start AND report_date < month_end;
+                END IF;
+
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF workout_report FOR VALUES FROM (%L) TO (%L)',
+                    'workout_report_' || suffix, month_start, month_end
+                );
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF split_set_report FOR VALUES FROM (%L) TO (%L)',
+                    'split_set_report_' || suffix, month_start, month_end
+                );
+
+                IF has_rows THEN
+                    EXECUTE 'INSERT INTO workout_report SELECT * FROM moved_workout_report';
+                    EXECUTE 'INSERT INTO split_set_report SELECT * FROM moved_split_set_report';
+                    DROP TABLE moved_workout_report, moved_split_set_report;
+                END IF;
+
+                created := created + 1;
+            END LOOP;
+
+            RETURN created;
+        END $$
+    """)
+
+    # A table can't be partitioned in place, the reports are copied into new partitioned tables
+    op.execute('ALTER TABLE workout_report RENAME CONSTRAINT workout_report_id_key TO workout_report_unpartitioned_id_key')
+    rename_report_tables('unpartitioned')
+    create_report_tables(partitioned=True)
+    op.execute('CREATE TABLE workout_report_default PARTITION OF workout_report DEFAULT')
+    op.execute('CREATE TABLE split_set_report_default PARTITION OF split_set_report DEFAULT')
+
+    # Partitions for the months that have reports and the upcoming ones, before copying so rows go straight to them
+    op.execute("""
+        SELECT create_report_partitions(month, 1)
+        FROM (SELECT DISTINCT date_trunc('month', report_date)::date AS month FROM workout_report_unpartitioned) months
+    """)
+    op.execute(f'SELECT create_report_partitions(current_date, {MONTHS_AHEAD + 1})')
+
+    copy_reports('unpartitioned', partitioned=True)
+    # Autovacuum analyzes the partitions but never a partitioned table itself
+    op.execute('ANALYZE workout_report, split_set_report')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Only the attached partitions are copied back, detached ones stay as they are
+    rename_report_tables('partitioned')
+    op.execute('ALTER TABLE workout_report_partitioned RENAME CONSTRAINT uq_workout_report_id TO workout_report_partitioned_id_key')
+    create_report_tables(partitioned=False)
+    copy_reports('partitioned', partitioned=False)
+    op.execute('DROP FUNCTION IF EXISTS create_report_partitions(date, integer)')
@@ -0,0 +1,3 @@
+"""
+Benchmarks, run with python -m benchmarks.<benchmark>.
+"""
@@ -0,0 +1,80 @@
+import argparse
+import json
+import timeit
+from types import SimpleNamespace
+
+from pydantic import TypeAdapter
+
+from src.schemas.muscle_group_schemas import MuscleGroupResponseSchema
+from src.utils.codec import CODECS
+
+RESPONSE_ADAPTER = TypeAdapter(list[MuscleGroupResponseSchema])
+
+
+def build_rows(size: int) -> list[SimpleNamespace]:
+    """
+    Build rows shaped like MuscleGroup models, half global and half owned by a user.
+    """
+
+    return [
+        SimpleNamespace(group_name=f"Grupo muscular {i}", user_id=i if i % 2 else None, deleted=False)
+        for i in range(size)
+    ]
+
+
+def measure(func, repeat: int) -> float:
+    """
+    Best time of a call over repeat runs, in milliseconds.
+    """
+
+    number = 10
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1000
+
+
+def run(size: int, repeat: int) -> list[tuple[str, float, int]]:
+    """
+    Time every way of turning size muscle groups into a JSON response body.
+    Returns:
+        list[tuple[str, float, int]]: Path name, milliseconds per call and body or entry size in bytes.
+    """
+
+    rows = build_rows(size)
+    payload = RESPONSE_ADAPTER.dump_python(RESPONSE_ADAPTER.validate_python(rows), mode="json", by_alias=True)
+    results = []
+
+    def stdlib_response():
+        models = RESPONSE_ADAPTER.validate_python(rows)
+        content = RESPONSE_ADAPTER.dump_python(models, mode="json", by_alias=True)
+        # Same options as starlette's JSONResponse.render
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+    def pydantic_response():
+        return RESPONSE_ADAPTER.dump_json(RESPONSE_ADAPTER.validate_python(rows), by_alias=True)
+
+    results.append(("uncached, validate + json.dumps", measure(stdlib_response, repeat), len(stdlib_response())))
+    results.append(("uncached, validate + dump_json", measure(pydantic_response, repeat), len(pydantic_response())))
+
+    for codec in CODECS.values():
+        encoded = codec.encode(payload)
+        results.append((f"{codec.name}, encode", measure(lambda: codec.encode(payload), repeat), len(encoded)))
+        results.append((f"{codec.name}, decode", measure(lambda: codec.decode(encoded), repeat), len(encoded)))
+        results.append((f"{codec.name}, cached entry to body", measure(lambda: codec.to_json(encoded), repeat), len(codec.to_json(encoded))))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the cache codecs on large MuscleGroupResponseSchema lists.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="list sizes to encode")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement, the best one is kept")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        print(f"\n{size} muscle groups")
+        print(f"{'path':<40}{'ms':>10}{'bytes':>12}")
+        for name, elapsed, length in run(size, args.repeat):
+            print(f"{name:<40}{elapsed:>10.3f}{length:>12}")
+
+
+if __name__ == "__main__":
+    main()
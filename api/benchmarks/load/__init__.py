@@ -0,0 +1,3 @@
+"""
+HTTP load tests against a running API, run with python -m benchmarks.load --help.
+"""
@@ -0,0 +1,82 @@
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+
+from benchmarks.load.baseline import find_regressions, load_baseline, save_baseline
+from benchmarks.load.driver import run_scenario
+from benchmarks.load.scenarios import SCENARIOS, SEEDS
+
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.load",
+        description=(
+            "Load test a running API. Start it with the docker-compose Postgres and Redis and a rate limit "
+            "the run can't reach, e.g. MAX_REQUESTS=100000000 uvicorn main:app --workers 4."
+        ),
+    )
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="repeat to run several, all by default")
+    parser.add_argument("--concurrency", type=int, default=16, help="requests in flight at any time")
+    parser.add_argument("--duration", type=float, default=10, help="measured seconds per scenario")
+    parser.add_argument("--warmup", type=float, default=2, help="unmeasured seconds before each scenario")
+    parser.add_argument("--skip-seed", action="store_true", help="don't create the rows the scenarios read")
+    parser.add_argument("--save", type=Path, help="save the run as a baseline, e.g. benchmarks/load/baselines/local.json")
+    parser.add_argument("--baseline", type=Path, help="compare the run with this baseline")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed relative regression, 0.15 = 15%%")
+    return parser.parse_args()
+
+
+def print_summary(name: str, summary: dict):
+    print(
+        f"{name:<28}{summary['requests']:>9}{summary['errors']:>8}{summary['throughput']:>10.1f}"
+        f"{summary['p50']:>9.2f}{summary['p95']:>9.2f}{summary['p99']:>9.2f}{summary['max']:>9.2f}"
+    )
+
+
+async def run(args: argparse.Namespace) -> dict[str, dict]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+        if not args.skip_seed:
+            for seed in SEEDS:
+                await seed(client)
+
+        print(f"{'scenario':<28}{'requests':>9}{'errors':>8}{'req/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+        summaries = {}
+        for name in args.scenario or sorted(SCENARIOS):
+            result = await run_scenario(client, SCENARIOS[name], args.concurrency, args.duration, args.warmup)
+            summaries[name] = result.summary()
+            print_summary(name, summaries[name])
+
+            unexpected = {status: count for status, count in result.statuses.items() if status not in SCENARIOS[name].expected_status}
+            if unexpected:
+                print(f"  unexpected statuses: {unexpected}")
+
+    return summaries
+
+
+def main():
+    args = parse_args()
+    summaries = asyncio.run(run(args))
+    failed = any(summary["errors"] for summary in summaries.values())
+
+    if args.save:
+        settings = {key: getattr(args, key) for key in ("base_url", "concurrency", "duration", "warmup")}
+        save_baseline(args.save, summaries, settings)
+        print(f"Baseline saved to {args.save}")
+
+    if args.baseline:
+        regressions = find_regressions(summaries, load_baseline(args.baseline), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        failed = failed or bool(regressions)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import json
+import platform
+from datetime import datetime
+from pathlib import Path
+
+# Metrics compared against the baseline, and whether a higher value is a regression
+COMPARED_METRICS = {"throughput": False, "p50": True, "p95": True, "p99": True}
+
+
+def save_baseline(path: Path, summaries: dict[str, dict], settings: dict):
+    """
+    Save the summary of every scenario of a run, along with the settings it ran with.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "host": platform.node(),
+        "settings": settings,
+        "scenarios": summaries,
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def load_baseline(path: Path) -> dict:
+    return json.loads(path.read_text())
+
+
+def find_regressions(summaries: dict[str, dict], baseline: dict, threshold: float) -> list[str]:
+    """
+    Compare a run with a baseline, scenario by scenario.
+    Args:
+        summaries (dict[str, dict]): Summaries of the current run, by scenario name.
+        baseline (dict): Document written by save_baseline.
+        threshold (float): Allowed relative change, 0.15 lets p95 grow and throughput drop by 15%.
+    Returns:
+        list[str]: One description per regressed metric, empty if the run is within the threshold.
+    """
+
+    regressions = []
+    for name, summary in summaries.items():
+        reference = baseline["scenarios"].get(name)
+        if reference is None:
+            continue
+
+        for metric, higher_is_worse in COMPARED_METRICS.items():
+            before, after = reference[metric], summary[metric]
+            if not before:
+                continue
+
+            change = (after - before) / before
+            if (change if higher_is_worse else -change) > threshold:
+                regressions.append(f"{name} {metric}: {before:.2f} -> {after:.2f} ({change:+.0%})")
+
+    return regressions
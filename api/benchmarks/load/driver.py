@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+import httpx
+
+from benchmarks.load.scenarios import Scenario
+from benchmarks.load.stats import ScenarioResult
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, scenario: Scenario, concurrency: int, duration: float, warmup: float
+) -> ScenarioResult:
+    """
+    Hit a scenario from concurrency workers, each sending its next request as soon as the last
+    one is answered (a closed loop). Requests made during the warmup are not recorded.
+    Args:
+        client (httpx.AsyncClient): Client pointed at the API, with room for concurrency connections.
+        scenario (Scenario): Scenario to run, already set up.
+        concurrency (int): Number of requests in flight at any time.
+        duration (float): Seconds measured after the warmup.
+        warmup (float): Seconds run before measuring, to fill caches and connection pools.
+    """
+
+    result = ScenarioResult(scenario.name)
+    context = await scenario.setup(client) if scenario.setup else {}
+
+    loop = asyncio.get_running_loop()
+    measure_from = loop.time() + warmup
+    stop_at = measure_from + duration
+
+    async def worker(worker_id: int):
+        sequence = worker_id
+        while (now := loop.time()) < stop_at:
+            start = time.perf_counter()
+            response = await scenario.request(client, context, sequence)
+            elapsed = time.perf_counter() - start
+
+            if now >= measure_from:
+                result.record(elapsed, response.status_code, response.status_code in scenario.expected_status)
+            sequence += concurrency
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    result.duration = duration
+
+    return result
@@ -0,0 +1,49 @@
+"""
+Load test scenarios. Each module registers its scenarios with the scenario decorator,
+naming them "<area>.<name>", and may register a seed coroutine creating the rows they read.
+A new area only needs a module here and an import at the bottom of this file.
+"""
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+RequestFunc = Callable[[httpx.AsyncClient, dict, int], Awaitable[httpx.Response]]
+SetupFunc = Callable[[httpx.AsyncClient], Awaitable[dict[str, Any]]]
+
+# Owner of every row the scenarios create, far from the IDs real users get locally
+LOAD_TEST_USER_ID = 900_000
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    A request repeated by the driver.
+    request receives the client, the context returned by setup and a sequence number
+    that scenarios use to spread requests over different rows.
+    """
+
+    name: str
+    request: RequestFunc
+    setup: SetupFunc | None = None
+    expected_status: frozenset[int] = frozenset({200})
+
+
+SCENARIOS: dict[str, Scenario] = {}
+SEEDS: list[Callable[[httpx.AsyncClient], Awaitable[None]]] = []
+
+
+def scenario(name: str, setup: SetupFunc | None = None, expected_status: tuple[int, ...] = (200,)):
+    def decorator(request: RequestFunc) -> RequestFunc:
+        SCENARIOS[name] = Scenario(name, request, setup, frozenset(expected_status))
+        return request
+
+    return decorator
+
+
+def seed(func: Callable[[httpx.AsyncClient], Awaitable[None]]):
+    SEEDS.append(func)
+    return func
+
+
+from benchmarks.load.scenarios import groups, reports  # noqa: E402, F401
@@ -0,0 +1,56 @@
+import httpx
+
+from benchmarks.load.scenarios import LOAD_TEST_USER_ID, scenario, seed
+
+SEED_GROUPS = [f"Carga {i:03d}" for i in range(200)]
+PAGE_SIZE = 20
+
+
+@seed
+async def seed_groups(client: httpx.AsyncClient):
+    # Groups left over from an earlier run are reported as conflicts, which is fine
+    response = await client.post(
+        "/groups/bulk", json=[{"groupName": name, "userId": LOAD_TEST_USER_ID} for name in SEED_GROUPS]
+    )
+    response.raise_for_status()
+
+
+async def collect_cursors(client: httpx.AsyncClient) -> dict:
+    cursors, cursor = [None], None
+    while len(cursors) < 10:
+        response = await client.get("/groups/", params={"page_size": PAGE_SIZE, "cursor": cursor})
+        response.raise_for_status()
+        cursor = response.json()["nextCursor"]
+        if cursor is None:
+            break
+        cursors.append(cursor)
+
+    return {"cursors": cursors}
+
+
+async def fetch_etag(client: httpx.AsyncClient) -> dict:
+    response = await client.get("/groups/", params={"page_size": PAGE_SIZE})
+    response.raise_for_status()
+    return {"etag": response.headers["etag"]}
+
+
+@scenario("groups.list")
+async def list_first_page(client: httpx.AsyncClient, context: dict, sequence: int) -> httpx.Response:
+    return await client.get("/groups/", params={"page_size": PAGE_SIZE})
+
+
+@scenario("groups.list_pages", setup=collect_cursors)
+async def list_pages(client: httpx.AsyncClient, context: dict, sequence: int) -> httpx.Response:
+    cursor = context["cursors"][sequence % len(context["cursors"])]
+    return await client.get("/groups/", params={"page_size": PAGE_SIZE, "cursor": cursor})
+
+
+@scenario("groups.list_not_modified", setup=fetch_etag, expected_status=(304,))
+async def revalidate_first_page(client: httpx.AsyncClient, context: dict, sequence: int) -> httpx.Response:
+    return await client.get("/groups/", params={"page_size": PAGE_SIZE}, headers={"If-None-Match": context["etag"]})
+
+
+@scenario("groups.by_name")
+async def get_by_name(client: httpx.AsyncClient, context: dict, sequence: int) -> httpx.Response:
+    name = SEED_GROUPS[sequence % len(SEED_GROUPS)]
+    return await client.get(f"/groups/{name}", params={"user_id": LOAD_TEST_USER_ID})
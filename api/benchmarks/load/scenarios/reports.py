@@ -0,0 +1,10 @@
+import httpx
+
+from benchmarks.load.scenarios import LOAD_TEST_USER_ID, scenario
+
+# Writing reports needs plans and exercises, which have no routes yet: only reads are covered for now
+
+
+@scenario("reports.volume")
+async def weekly_volume(client: httpx.AsyncClient, context: dict, sequence: int) -> httpx.Response:
+    return await client.get("/reports/volume", params={"user_id": LOAD_TEST_USER_ID})
@@ -0,0 +1,52 @@
+import math
+from dataclasses import dataclass, field
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    Args:
+        sorted_values (list[float]): Values in ascending order.
+        q (float): Percentile between 0 and 100.
+    """
+
+    if not sorted_values:
+        return 0.0
+
+    rank = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Latencies, in seconds, of the requests a scenario made during the measured window.
+    """
+
+    name: str
+    duration: float = 0.0
+    errors: int = 0
+    latencies: list[float] = field(default_factory=list)
+    statuses: dict[int, int] = field(default_factory=dict)
+
+    def record(self, elapsed: float, status: int, ok: bool):
+        self.latencies.append(elapsed)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if not ok:
+            self.errors += 1
+
+    def summary(self) -> dict:
+        """
+        Throughput and latency percentiles, in requests per second and milliseconds, as saved in baselines.
+        """
+
+        latencies = sorted(self.latencies)
+        return {
+            "requests": len(latencies),
+            "errors": self.errors,
+            "throughput": len(latencies) / self.duration if self.duration else 0.0,
+            "p50": percentile(latencies, 50) * 1000,
+            "p95": percentile(latencies, 95) * 1000,
+            "p99": percentile(latencies, 99) * 1000,
+            "max": (latencies[-1] if latencies else 0.0) * 1000,
+        }
@@ -0,0 +1,99 @@
+import argparse
+import asyncio
+import time
+
+from argon2 import PasswordHasher
+
+from benchmarks.load.stats import percentile
+from src.config import SETTINGS
+from src.security.passwords import PasswordService
+
+PROBE_INTERVAL = 0.005
+
+
+async def probe(latencies: list[float], stop: asyncio.Event):
+    """
+    Stand-in for the other endpoints: a tiny task scheduled every PROBE_INTERVAL,
+    recording how late the event loop gets to run it.
+    """
+
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        latencies.append(loop.time() - expected)
+
+
+async def login_storm(verify, password_hash: str, logins: int, concurrency: int) -> tuple[float, list[float]]:
+    """
+    Verify logins passwords from concurrency clients while the probe runs.
+    Returns:
+        tuple[float, list[float]]: Logins per second and the probe delays, in seconds.
+    """
+
+    latencies, stop = [], asyncio.Event()
+    probe_task = asyncio.create_task(probe(latencies, stop))
+    remaining = logins
+
+    async def client():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await verify(password_hash, "segredo")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe_task
+    return logins / elapsed, latencies
+
+
+async def run(logins: int, concurrency: int, workers: list[int]) -> list[tuple[str, float, list[float]]]:
+    hasher = PasswordHasher(
+        time_cost=SETTINGS.PASSWORD_HASH_TIME_COST,
+        memory_cost=SETTINGS.PASSWORD_HASH_MEMORY_COST,
+        parallelism=SETTINGS.PASSWORD_HASH_PARALLELISM,
+    )
+    password_hash = hasher.hash("segredo")
+    results = []
+
+    async def inline_verify(stored: str, password: str):
+        hasher.verify(stored, password)
+
+    results.append(("inline on the event loop", *await login_storm(inline_verify, password_hash, logins, concurrency)))
+
+    for count in workers:
+        service = PasswordService(workers=count, queue_limit=concurrency)
+        throughput, latencies = await login_storm(service.verify, password_hash, logins, concurrency)
+        service.executor.shutdown()
+        results.append((f"pool of {count} threads", throughput, latencies))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Login throughput and the event loop delay other requests see during a login storm."
+    )
+    parser.add_argument("--logins", type=int, default=200, help="passwords verified per run")
+    parser.add_argument("--concurrency", type=int, default=32, help="logins in flight at any time")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="pool sizes to compare")
+    args = parser.parse_args()
+
+    print(
+        f"argon2 t={SETTINGS.PASSWORD_HASH_TIME_COST} m={SETTINGS.PASSWORD_HASH_MEMORY_COST}KiB "
+        f"p={SETTINGS.PASSWORD_HASH_PARALLELISM}, {args.logins} logins from {args.concurrency} clients"
+    )
+    print(f"{'path':<28}{'logins/s':>10}{'loop p50 ms':>13}{'loop p99 ms':>13}{'loop max ms':>13}")
+    for name, throughput, latencies in asyncio.run(run(args.logins, args.concurrency, args.workers)):
+        latencies.sort()
+        print(
+            f"{name:<28}{throughput:>10.1f}{percentile(latencies, 50) * 1000:>13.2f}"
+            f"{percentile(latencies, 99) * 1000:>13.2f}{(latencies[-1] if latencies else 0) * 1000:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,48 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import Depends, FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from src.config import SETTINGS
+from src.middlewares.primary_pin import PrimaryPinMiddleware
+from src.middlewares.rate_limit_headers import RateLimitHeadersMiddleware
+from src.middlewares.server_timing import ServerTimingMiddleware
+from src.routes.auth_routes import router as auth_router
+from src.routes.metrics_routes import router as metrics_router
 from src.routes.muscle_group_routes import router as muscle_group_router
+from src.routes.report_routes import router as report_router
+from src.routes.search_routes import router as search_router
+from src.routes.sync_routes import router as sync_router
+from src.routes.workout_plan_routes import router as workout_plan_router
+from src.security.security import verify_request_limit
+from src.utils.cache import LOCAL_CACHE, listen_for_invalidations
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Each worker keeps its own local cache tier coherent with the others' writes
+    listener = asyncio.create_task(listen_for_invalidations(LOCAL_CACHE)) if LOCAL_CACHE is not None else None
+    yield
+    if listener is not None:
+        listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener
 
-app = FastAPI(debug=True)
 
+app = FastAPI(debug=True, dependencies=[Depends(verify_request_limit)], lifespan=lifespan)
+
+app.include_router(auth_router)
 app.include_router(muscle_group_router)
+app.include_router(report_router)
+app.include_router(search_router)
+app.include_router(sync_router)
+app.include_router(workout_plan_router)
+if SETTINGS.METRICS_ENABLED:
+    app.include_router(metrics_router)
+
+# Reads only need pinning to the primary when some of them go to a replica
+if SETTINGS.POSTGRES_REPLICA_URL:
+    app.add_middleware(PrimaryPinMiddleware)
+app.add_middleware(RateLimitHeadersMiddleware)
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(GZipMiddleware, minimum_size=SETTINGS.GZIP_MINIMUM_SIZE)
@@ -0,0 +1,3 @@
+"""
+One-off maintenance commands, run with python -m src.commands.<command>.
+"""
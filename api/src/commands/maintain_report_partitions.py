@@ -0,0 +1,61 @@
+import argparse
+import asyncio
+import logging
+from datetime import date
+
+from src.config import SETTINGS
+from src.connections import ASYNC_ENGINE, session_maker
+from src.repository.report_partition_repository import ReportPartitionRepository
+
+logger = logging.getLogger("overload.commands")
+
+
+async def maintain_report_partitions(
+    months_ahead: int = SETTINGS.REPORT_PARTITION_MONTHS_AHEAD, detach_before: date | None = None
+) -> tuple[int, list[date]]:
+    """
+    Create the report partitions of the current month and the next months_ahead ones, and
+    optionally detach old ones for archival, in a single transaction. Meant to run daily, so
+    reports land in their own partition instead of the default one.
+    Args:
+        months_ahead (int): Months to create past the current one.
+        detach_before (date | None): Detach the months ending on or before this day, none when None.
+    Returns:
+        tuple[int, list[date]]: Number of months created and the months detached.
+    """
+
+    try:
+        async with session_maker.begin() as session:
+            repo = ReportPartitionRepository(session)
+            created = await repo.create_partitions(date.today(), months_ahead + 1)
+            detached = await repo.detach_partitions(detach_before) if detach_before is not None else []
+            return created, detached
+    finally:
+        await ASYNC_ENGINE.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create the upcoming report partitions and detach old ones.")
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=SETTINGS.REPORT_PARTITION_MONTHS_AHEAD,
+        help="months to create past the current one",
+    )
+    parser.add_argument(
+        "--detach-before",
+        type=date.fromisoformat,
+        default=None,
+        help="detach the months ending on or before this day, YYYY-MM-DD",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    created, detached = asyncio.run(maintain_report_partitions(args.months_ahead, args.detach_before))
+    logger.info("Report partitions created: %s months", created)
+    for month in detached:
+        logger.info("Report partitions detached: %s", month.strftime("%Y-%m"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import asyncio
+import logging
+from datetime import datetime
+
+from src.config import SETTINGS
+from src.connections import ASYNC_ENGINE, session_maker
+from src.repository.idempotency_repository import IdempotencyRepository
+
+logger = logging.getLogger("overload.commands")
+
+
+async def purge_idempotency_keys() -> int:
+    """
+    Delete the idempotency keys older than SETTINGS.IDEMPOTENCY_KEY_TTL. Clients only retry
+    for a short while, so a request repeated after that is processed again.
+    Returns:
+        int: Number of keys deleted.
+    """
+
+    try:
+        async with session_maker.begin() as session:
+            return await IdempotencyRepository(session).purge(datetime.now() - SETTINGS.IDEMPOTENCY_KEY_TTL)
+    finally:
+        await ASYNC_ENGINE.dispose()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    deleted = asyncio.run(purge_idempotency_keys())
+    logger.info("Idempotency keys purged: %s", deleted)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import argparse
+import asyncio
+import logging
+from datetime import date
+
+from src.connections import ASYNC_ENGINE, session_maker
+from src.repository.personal_record_repository import PersonalRecordRepository
+
+logger = logging.getLogger("overload.commands")
+
+
+async def rebuild_personal_records(
+    user_id: int | None = None, exercise_ids: set[int] | None = None, since: date | None = None
+) -> int:
+    """
+    Derive the personal records again from the set reports in a single transaction, after
+    reports are edited or deleted, or when ONE_REP_MAX_FORMULA changes.
+    Args:
+        user_id (int | None): Only rebuild this user's records, everyone's when None.
+        exercise_ids (set[int] | None): Only rebuild the records of these exercises, all when None.
+        since (date | None): Only read the set reports from this day on, the records set before it are kept.
+    Returns:
+        int: Number of personal record rows written.
+    """
+
+    try:
+        async with session_maker.begin() as session:
+            return await PersonalRecordRepository(session).rebuild(user_id, exercise_ids, since)
+    finally:
+        await ASYNC_ENGINE.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the personal records from the set reports.")
+    parser.add_argument("--user-id", type=int, default=None, help="only rebuild this user's records")
+    parser.add_argument("--exercise-id", type=int, action="append", help="only rebuild these exercises, repeatable")
+    parser.add_argument(
+        "--since", type=date.fromisoformat, default=None, help="only read the set reports from this day on, YYYY-MM-DD"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    exercise_ids = set(args.exercise_id) if args.exercise_id else None
+    rows = asyncio.run(rebuild_personal_records(args.user_id, exercise_ids, args.since))
+    logger.info("Personal records rebuilt: %s rows", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import argparse
+import asyncio
+import logging
+from datetime import date
+
+from src.connections import ASYNC_ENGINE, session_maker
+from src.repository.weekly_volume_repository import WeeklyVolumeRepository
+
+logger = logging.getLogger("overload.commands")
+
+
+async def rebuild_weekly_volume(user_id: int | None = None, since: date | None = None) -> int:
+    """
+    Recompute the weekly volume rollup from the set reports in a single transaction.
+    Args:
+        user_id (int | None): Only rebuild this user's rollup, everyone's when None.
+        since (date | None): Only rebuild the weeks from the one of this day on, all when None.
+    Returns:
+        int: Number of rollup rows written.
+    """
+
+    try:
+        async with session_maker.begin() as session:
+            return await WeeklyVolumeRepository(session).rebuild(user_id, since)
+    finally:
+        await ASYNC_ENGINE.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the weekly volume rollup from the set reports.")
+    parser.add_argument("--user-id", type=int, default=None, help="only rebuild this user's rollup")
+    parser.add_argument(
+        "--since", type=date.fromisoformat, default=None, help="only rebuild the weeks from this day on, YYYY-MM-DD"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    rows = asyncio.run(rebuild_weekly_volume(args.user_id, args.since))
+    logger.info("Weekly volume rebuilt: %s rows", rows)
+
+
+if __name__ == "__main__":
+    main()
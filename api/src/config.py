@@ -1,5 +1,6 @@
-from pydantic import Field
+from pydantic import Field, model_validator
 from datetime import timedelta
+from socket import gethostname
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,11 +15,17 @@ class _Settings(BaseSettings):
     # Redis Settings
     REDIS_HOST: str = "redis"
     REDIS_PORT: int = 6379
+    REDIS_TEST_DB: int = 1
     @property
     def REDIS_URL(self) -> str:
         """Get the Redis connection URL"""
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}"
 
+    @property
+    def REDIS_TEST_URL(self) -> str:
+        """Get the Redis test database connection URL"""
+        return f"{self.REDIS_URL}/{self.REDIS_TEST_DB}"
+
     # PostgreSQL Settings
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str = Field(exclude=True)
@@ -27,6 +34,15 @@ class _Settings(BaseSettings):
     POSTGRES_DB: str
     POSTGRES_TEST_DB: str
 
+    # Connection pool of the async engine
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 10.0  # seconds waiting for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100  # prepared statements kept per connection, 0 behind pgbouncer
+
     @property
     def POSTGRES_URL(self) -> str:
         """Get the PostgreSQL connection URL"""
@@ -37,6 +53,19 @@ class _Settings(BaseSettings):
         """Get the PostgreSQL test database connection URL"""
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_TEST_DB}"
 
+    # Streaming replica serving the read-only routes, they read from the primary when unset
+    POSTGRES_REPLICA_HOST: str | None = None
+    POSTGRES_REPLICA_PORT: int | None = None  # POSTGRES_PORT when unset
+    READ_PRIMARY_PIN_TIME: timedelta = timedelta(seconds=5)  # reads stay on the primary this long after a write
+
+    @property
+    def POSTGRES_REPLICA_URL(self) -> str | None:
+        """Get the PostgreSQL read replica connection URL, None when there is no replica"""
+        if self.POSTGRES_REPLICA_HOST is None:
+            return None
+        port = self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_REPLICA_HOST}:{port}/{self.POSTGRES_DB}"
+
 
     # Mail Settings
     MAIL_USERNAME: str
@@ -47,14 +76,27 @@ class _Settings(BaseSettings):
     MAIL_SSL_TLS: bool = False
     MAIL_FROM: str
     MAIL_FROM_NAME: str = "OVERLOAD Team"
+    MAIL_TIMEOUT: float = 30.0
+    MAIL_MAX_ATTEMPTS: int = 5
+    MAIL_RETRY_BACKOFF: float = 5.0  # seconds, doubled on every failed attempt
+    MAIL_RETRY_BACKOFF_MAX: float = 600.0
+    MAIL_DEAD_LETTER_MAX_SIZE: int = 1000  # older dead letters are trimmed
+    MAIL_WORKER_ID: str = gethostname()  # must be unique and survive restarts, names the worker's processing list
 
 
     # Authentication Settings
     AUTH_REQUIRED: bool = ENVIRONMENT == "production"
+    METRICS_ENABLED: bool | None = None  # mounts /metrics, which still needs a session token. Off in production when unset
     PASSWORD_HASH_ALGORITHM: str = "argon2"
+    PASSWORD_HASH_TIME_COST: int = 3  # argon2 passes over memory
+    PASSWORD_HASH_MEMORY_COST: int = 65536  # argon2 memory in KiB
+    PASSWORD_HASH_PARALLELISM: int = 4
+    PASSWORD_HASH_WORKERS: int = 4  # threads hashing at the same time, each uses MEMORY_COST
+    PASSWORD_HASH_QUEUE_LIMIT: int = 64  # hashes waiting for a thread before new ones are refused
     PASSWORD_RESET_TIMEOUT: timedelta = timedelta(hours=24)
     REGISTER_CONFIRM_TIMEOUT: timedelta = timedelta(minutes=30)
     MAX_LOGIN_ATTEMPTS: int = 5
+    MAX_LOGIN_ATTEMPTS_PER_IP: int = 50  # failures from one address, across every account it tries
     LOCKOUT_TIME: timedelta = timedelta(minutes=15)
 
 
@@ -67,6 +109,7 @@ class _Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_HEADER_TYPE: str = "Bearer"
     JWT_HEADER_NAME: str = "Authorization"
+    JWT_CLAIM_CACHE_SIZE: int = 10000
 
 
     # Security Settings
@@ -74,13 +117,50 @@ class _Settings(BaseSettings):
     ALLOWED_HOSTS: list[str] = ["*"] if ENVIRONMENT == "development" else []
     MAX_REQUESTS: int = 100
     REQUEST_TIME_WINDOW: timedelta = timedelta(minutes=1)
+    GZIP_MINIMUM_SIZE: int = 1000  # bytes, smaller responses are sent uncompressed
     CACHE_DEFAULT_TIMEOUT: int = 300  # 5 minutes
+    CACHE_CODEC: str = "orjson"  # "orjson" or "msgpack", see src.utils.codec
+    CACHE_STALE_TIMEOUT: int = 30  # seconds an expired entry is still served while one worker refreshes it
+    CACHE_LOCK_TIMEOUT: float = 5.0  # seconds other workers wait for the one loading a missing entry
+    CACHE_LOCK_POLL_INTERVAL: float = 0.05  # seconds between checks for the entry while waiting
+    CACHE_LOCAL_ENABLED: bool = True  # in-process tier in front of Redis, see LocalCache
+    CACHE_LOCAL_MAX_BYTES: int = 32 * 1024 * 1024  # per worker
+    CACHE_LOCAL_TIMEOUT: int = 30  # seconds, bounds how long a lost invalidation message can go unnoticed
+    CACHE_LOCAL_HEALTH_CHECK_INTERVAL: float = 5.0  # seconds between pings of the invalidation channel
 
 
     # Pagination Settings
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 50
 
+
+    # Bulk Settings
+    MAX_BULK_ITEMS: int = 500
+    BULK_MAX_REQUESTS: int = 10
+
+    # Report Settings
+    VOLUME_DEFAULT_WEEKS: int = 12
+    VOLUME_MAX_WEEKS: int = 104
+    SESSION_MAX_SETS: int = 200
+    ONE_REP_MAX_FORMULA: str = "epley"  # or "brzycki", see src.utils.training.estimate_one_rep_max
+    IDEMPOTENCY_KEY_TTL: timedelta = timedelta(days=2)
+    REPORT_PARTITION_MONTHS_AHEAD: int = 3  # monthly partitions kept ready past the current month
+
+    # Search Settings
+    SEARCH_DEFAULT_LIMIT: int = 10
+    SEARCH_MAX_LIMIT: int = 50
+    SEARCH_MAX_TERM_LENGTH: int = 100
+    SEARCH_CACHED_PREFIX_LENGTH: int = 4
+    SEARCH_CACHE_TIMEOUT: int = 60  # seconds, catalog changes show up in cached prefixes at most this late
+    SEARCH_SIMILARITY_THRESHOLD: float = 0.4
+
+    @model_validator(mode="after")
+    def _resolve_environment_defaults(self):
+        # Defaults depending on ENVIRONMENT must wait for it to be loaded, the class body only sees its default
+        if self.METRICS_ENABLED is None:
+            self.METRICS_ENABLED = self.ENVIRONMENT != "production"
+        return self
+
 Settings = _Settings
 SETTINGS = Settings()
 __all__ = ["SETTINGS", "Settings"]
\ No newline at end of file
@@ -1,24 +1,156 @@
-from fastapi import Depends
+from time import perf_counter
+
+from fastapi import Depends, Request
 from typing_extensions import Annotated
 
 from redis.asyncio import ConnectionPool, Redis
+from redis.asyncio.client import Pipeline
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from .config import SETTINGS
+from .middlewares.primary_pin import is_pinned_to_primary
+from .utils.request_metrics import current_metrics
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that also records how long checkouts wait for a connection.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = perf_counter() - start
+            self.checkouts += 1
+            self.wait_time_total += waited
+            self.wait_time_max = max(self.wait_time_max, waited)
+
+    def stats(self) -> dict:
+        """
+        Get the pool utilisation and checkout wait time counters.
+        """
+
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_time_avg_ms": self.wait_time_total / self.checkouts * 1000 if self.checkouts else 0.0,
+            "wait_time_max_ms": self.wait_time_max * 1000,
+        }
 
-ASYNC_ENGINE = create_async_engine(SETTINGS.POSTGRES_URL, echo=True)
 
+def _create_engine(url: str):
+    return create_async_engine(
+        url,
+        echo=SETTINGS.DB_ECHO,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=SETTINGS.DB_POOL_SIZE,
+        max_overflow=SETTINGS.DB_MAX_OVERFLOW,
+        pool_timeout=SETTINGS.DB_POOL_TIMEOUT,
+        pool_recycle=SETTINGS.DB_POOL_RECYCLE,
+        pool_pre_ping=SETTINGS.DB_POOL_PRE_PING,
+        connect_args={"prepared_statement_cache_size": SETTINGS.DB_STATEMENT_CACHE_SIZE},
+    )
+
+
+ASYNC_ENGINE = _create_engine(SETTINGS.POSTGRES_URL)
 session_maker = async_sessionmaker(ASYNC_ENGINE, autoflush=False)
 
+# Read replica, None when not configured
+READ_ENGINE = _create_engine(SETTINGS.POSTGRES_REPLICA_URL) if SETTINGS.POSTGRES_REPLICA_URL else None
+read_session_maker = async_sessionmaker(READ_ENGINE, autoflush=False) if READ_ENGINE is not None else None
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_sql_timer(conn, cursor, statement, parameters, context, executemany):
+    context._query_start = perf_counter()
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_sql_timer(conn, cursor, statement, parameters, context, executemany):
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.record_sql(perf_counter() - context._query_start)
+
+
+class InstrumentedPipeline(Pipeline):
+    async def execute(self, raise_on_error: bool = True):
+        commands = len(self.command_stack)
+        start = perf_counter()
+        try:
+            return await super().execute(raise_on_error)
+        finally:
+            metrics = current_metrics()
+            if metrics is not None:
+                metrics.record_redis(perf_counter() - start, commands)
+
+
+class InstrumentedRedis(Redis):
+    """
+    Redis client that records the number and duration of commands on the current request metrics.
+    """
+
+    async def execute_command(self, *args, **options):
+        start = perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            metrics = current_metrics()
+            if metrics is not None:
+                metrics.record_redis(perf_counter() - start)
+
+    def pipeline(self, transaction: bool = True, shard_hint: str | None = None) -> InstrumentedPipeline:
+        return InstrumentedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
 REDIS_POOL = ConnectionPool.from_url(SETTINGS.REDIS_URL, decode_responses=True)
 
+def pool_stats() -> dict:
+    return ASYNC_ENGINE.pool.stats()
+
+def read_pool_stats() -> dict | None:
+    return READ_ENGINE.pool.stats() if READ_ENGINE is not None else None
+
 async def db_connection():
     async with session_maker() as session:
         yield session
 
+async def read_connection(request: Request, primary: Annotated[AsyncSession, Depends(db_connection)]):
+    """
+    Session for read-only routes. It is on the replica when one is configured, and on the
+    primary when there's none or the client wrote recently, see PrimaryPinMiddleware.
+    The primary session is only connected to when it is used.
+    """
+
+    if read_session_maker is None or is_pinned_to_primary(request.cookies):
+        yield primary
+        return
+
+    async with read_session_maker() as session:
+        yield session
+
 async def redis_connection():
-    async with Redis(connection_pool=REDIS_POOL) as redis:
+    async with InstrumentedRedis(connection_pool=REDIS_POOL) as redis:
         yield redis
 
 AsyncSessionInjector = Annotated[AsyncSession, Depends(db_connection)]
-RedisInjector = Annotated[Redis, Depends(redis_connection)]
\ No newline at end of file
+ReadSessionInjector = Annotated[AsyncSession, Depends(read_connection)]
+RedisInjector = Annotated[Redis, Depends(redis_connection)]
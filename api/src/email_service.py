@@ -1,50 +1,85 @@
+from json import dumps
+from pathlib import Path
 from typing import Optional
+from uuid import uuid4
 
-from fastapi_mail import ConnectionConfig, FastMail, MessageSchema
-from fastapi_mail.errors import ConnectionErrors
 from jinja2 import Environment, FileSystemLoader
 from pydantic import EmailStr
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
-from src.config import Config
 from src.exceptions import MailServiceError
 
+MAIL_QUEUE_KEY = "mail:queue"
+MAIL_RETRY_KEY = "mail:retry"
+MAIL_DEAD_LETTER_KEY = "mail:dead"
+# Followed by the worker ID, holds the jobs a worker took and hasn't finished yet
+MAIL_PROCESSING_KEY = "mail:processing"
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+
+def build_template_env() -> Environment:
+    """
+    Build the Jinja environment used to render e-mails. Templates are compiled
+    once and kept in the environment cache, auto reload is disabled.
+    """
+
+    return Environment(loader=FileSystemLoader(searchpath=TEMPLATES_DIR), auto_reload=False)
+
 
 class EmailClient:
     """
-    Email client for sending emails using FastAPI Mail.
-    This class handles the configuration and sending of emails
-    for user verification and password change requests.
+    Email client for sending emails through the mail queue.
+    This class doesn't talk to the mail server: it puts a job on a Redis list
+    and returns as soon as the job is queued. Jobs are rendered and delivered
+    by src.workers.mail_worker.
     """
 
-    def __init__(self):
+    def __init__(self, redis: Redis):
         """
-        Initialize the EmailClient with configuration settings.
-        This includes setting up the email connection configuration,
-        HTML template environment, and the email client itself.
+        Initialize the EmailClient.
+        Args:
+            redis (Redis): Redis connection holding the mail queue.
         """
 
-        self.html_template_env = Environment(
-            loader=FileSystemLoader(searchpath="./templates/"), enable_async=True
-        )
+        self.redis = redis
 
-        self.connection = ConnectionConfig(
-            MAIL_USERNAME=Config.MAIL_USERNAME,
-            MAIL_PASSWORD=Config.get_mail_password(),
-            MAIL_PORT=Config.MAIL_PORT,
-            MAIL_SERVER=Config.get_mail_server(),
-            MAIL_STARTTLS=Config.MAIL_STARTTLS,
-            MAIL_SSL_TLS=Config.MAIL_SSL_TLS,
-            MAIL_FROM=Config.MAIL_FROM,
-            MAIL_FROM_NAME=Config.MAIL_FROM_NAME,
-        )
+    async def _enqueue(self, template: str, dest_email: EmailStr, subject: str, context: dict) -> bool:
+        """
+        Put an email job on the mail queue.
+        Args:
+            template (str): Name of the HTML template, relative to the templates folder
+            dest_email (EmailStr): Destination email address
+            subject (str): Email subject
+            context (dict): Variables used to render the template
+        Returns:
+            bool: True once the job is queued
+        Raises:
+            MailServiceError: If the job can't be queued
+        """
+
+        job = {
+            "id": uuid4().hex,
+            "template": template,
+            "recipient": dest_email,
+            "subject": subject,
+            "context": context,
+            "attempts": 0,
+        }
 
-        self.email_client = FastMail(self.connection)
+        try:
+            await self.redis.lpush(MAIL_QUEUE_KEY, dumps(job))
+        except RedisError:
+            raise MailServiceError()
+
+        return True
 
     async def send_register_verify_mail(
         self, dest_email: EmailStr, protocol: str, username: str
     ) -> Optional[bool]:
         """
-        Send verification email to user.
+        Queue a verification email to user.
 
         Args:
             dest_email (EmailStr): Destination email address
@@ -52,59 +87,37 @@ class EmailClient:
             username (str): User's name for email personalization
 
         Returns:
-            Optional[bool]: True if email sent successfully, None if failed
+            Optional[bool]: True if email was queued successfully
 
         Raises:
-            MailServiceError: If email sending fails
+            MailServiceError: If email queueing fails
         """
-        try:
-            html_template = self.html_template_env.get_template(
-                name="confirm_register.html"
-            )
-
-            message = MessageSchema(
-                recipients=[dest_email],
-                subject="Confirme seu cadastro na OVERLOAD!",
-                body=await html_template.render_async(nome=username, prot=protocol),
-                subtype="html",
-            )
 
-            await self.email_client.send_message(message)
-            return True
-
-        except ConnectionErrors:
-            raise MailServiceError()
+        return await self._enqueue(
+            "confirm_register.html",
+            dest_email,
+            "Confirme seu cadastro na OVERLOAD!",
+            {"nome": username, "prot": protocol},
+        )
 
     async def send_pwd_change_mail(
         self, dest_email: EmailStr, username: str, char_protocol: str
     ):
         """
-        Send a email with password change instructions and code.
+        Queue a email with password change instructions and code.
         Args:
             dest_email (EmailStr): Destination email address
             username (str): User's name for email personalization
             char_protocol (str): Password change protocol/token
         Returns:
-            Optional[bool]: True if email sent successfully, None if failed
+            Optional[bool]: True if email was queued successfully
         Raises:
-            MailServiceError: If email sending fails
+            MailServiceError: If email queueing fails
         """
-        try:
-            html_template = self.html_template_env.get_template(
-                name="change_password.html"
-            )
-
-            message = MessageSchema(
-                recipients=[dest_email],
-                subject="Alteração de senha no OVERLOAD",
-                body=await html_template.render_async(
-                    nome=username, random_char_sequence=char_protocol
-                ),
-                subtype="html",
-            )
-            await self.email_client.send_message(message)
-
-            return True
-
-        except ConnectionErrors:
-            raise MailServiceError()
+
+        return await self._enqueue(
+            "change_password.html",
+            dest_email,
+            "Alteração de senha no OVERLOAD",
+            {"nome": username, "random_char_sequence": char_protocol},
+        )
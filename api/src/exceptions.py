@@ -0,0 +1,65 @@
+"""
+OVERLOAD Exceptions
+
+Exceptions raised by the application that map directly to HTTP responses.
+"""
+from fastapi import HTTPException, status
+
+
+class RequestLimitExceeded(HTTPException):
+    def __init__(self, headers: dict[str, str] | None = None):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Limite de requisições excedido",
+            headers=headers,
+        )
+
+
+class MailServiceError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Serviço de e-mail indisponível",
+        )
+
+
+class IdempotencyKeyReused(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="Idempotency-Key já utilizada com outro conteúdo",
+        )
+
+
+class WorkoutReportNotFound(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Relatório de treino não encontrado",
+        )
+
+
+class PasswordHashingBusy(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Serviço de autenticação sobrecarregado, tente novamente",
+            headers={"Retry-After": "1"},
+        )
+
+
+class InvalidCredentials(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="E-mail ou senha inválidos",
+        )
+
+
+class LoginLocked(HTTPException):
+    def __init__(self, retry_after: int):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Muitas tentativas de login, tente novamente mais tarde",
+            headers={"Retry-After": str(retry_after)},
+        )
@@ -0,0 +1,6 @@
+"""
+OVERLOAD Middlewares Package
+
+This package contains the ASGI middlewares wrapped around the OVERLOAD application,
+such as request instrumentation.
+"""
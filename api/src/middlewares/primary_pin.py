@@ -0,0 +1,49 @@
+from datetime import timedelta
+from time import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import SETTINGS
+
+PRIMARY_PIN_COOKIE = "primary_pin"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def is_pinned_to_primary(cookies: dict[str, str]) -> bool:
+    """
+    Whether the client wrote recently enough that its reads must stay on the primary.
+    """
+
+    try:
+        return float(cookies.get(PRIMARY_PIN_COOKIE, 0)) > time()
+    except ValueError:
+        return False
+
+
+class PrimaryPinMiddleware:
+    """
+    Pure ASGI middleware giving read-your-writes on top of the read replica: every successful
+    write sets a short-lived cookie, and while it is valid ReadSessionInjector hands the client
+    a primary session, so what it just wrote isn't missing because the replica lags behind.
+    """
+
+    def __init__(self, app: ASGIApp, pin_time: timedelta = SETTINGS.READ_PRIMARY_PIN_TIME):
+        self.app = app
+        self.pin_time = pin_time
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message: Message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                seconds = int(self.pin_time.total_seconds())
+                MutableHeaders(scope=message).append(
+                    "Set-Cookie",
+                    f"{PRIMARY_PIN_COOKIE}={time() + seconds:.0f}; Max-Age={seconds}; Path=/; HttpOnly; SameSite=lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
@@ -0,0 +1,29 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+RATE_LIMIT_HEADERS_STATE = "rate_limit_headers"
+
+
+class RateLimitHeadersMiddleware:
+    """
+    Pure ASGI middleware adding the headers RateLimiter left in the request state to the response.
+    FastAPI drops the headers a dependency sets on the injected Response whenever the route returns
+    a Response of its own (EncodedJSONResponse, a 304...), so the limiter can't set them itself.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_rate_limit(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in scope.get("state", {}).get(RATE_LIMIT_HEADERS_STATE, {}).items():
+                    headers.setdefault(name, value)
+            await send(message)
+
+        await self.app(scope, receive, send_with_rate_limit)
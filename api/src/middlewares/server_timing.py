@@ -0,0 +1,55 @@
+import logging
+from time import perf_counter
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.request_metrics import start_request_metrics, stop_request_metrics
+
+logger = logging.getLogger("overload.requests")
+
+
+class ServerTimingMiddleware:
+    """
+    Pure ASGI middleware that measures each HTTP request and reports the total time,
+    the SQL statements and the Redis commands it issued in a Server-Timing header
+    and as structured fields of a log record.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics, token = start_request_metrics()
+        start = perf_counter()
+
+        async def send_with_timing(message: Message):
+            if message["type"] == "http.response.start":
+                total = perf_counter() - start
+                MutableHeaders(scope=message).append("Server-Timing", metrics.server_timing(total))
+                logger.info(
+                    "%s %s %s",
+                    scope["method"],
+                    scope["path"],
+                    message["status"],
+                    extra={
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status_code": message["status"],
+                        "duration_ms": round(total * 1000, 2),
+                        "sql_count": metrics.sql_count,
+                        "sql_ms": round(metrics.sql_time * 1000, 2),
+                        "redis_count": metrics.redis_count,
+                        "redis_ms": round(metrics.redis_time * 1000, 2),
+                    },
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            stop_request_metrics(token)
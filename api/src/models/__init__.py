@@ -6,10 +6,13 @@ from src.models.associations import (
 from src.models.base_models import BaseOrmModel
 from src.models.equipment_models import Equipment
 from src.models.exercise_models import Exercise
+from src.models.idempotency_models import IdempotencyKey
 from src.models.muscle_group_models import MuscleGroup
 from src.models.muscle_models import Muscle
+from src.models.personal_record_models import PersonalRecord
 from src.models.split_set_report_models import SplitSetReport
 from src.models.user_models import User
+from src.models.weekly_volume_models import WeeklyVolume
 from src.models.workout_plan_models import WorkoutPlan
 from src.models.workout_report_models import WorkoutReport
 from src.models.workout_split_models import WorkoutSplit
@@ -25,6 +28,9 @@ __all__ = [
     "WorkoutPlan",
     "WorkoutSplit",
     "SplitSetReport",
+    "WeeklyVolume",
+    "PersonalRecord",
+    "IdempotencyKey",
     "assoc_exercise_muscle",
     "assoc_exercise_equipment",
     "assoc_split_exercise",
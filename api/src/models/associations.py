@@ -1,5 +1,6 @@
-from sqlalchemy import String, Table, Column, Integer, ForeignKey, ForeignKeyConstraint
+from sqlalchemy import BigInteger, String, Table, Column, Integer, ForeignKey, ForeignKeyConstraint, text
 from src.models.base_models import BaseOrmModel
+from src.models.change_tracking import track_changes
 from src.utils.constraints import DatabaseConstraints
 
 assoc_exercise_muscle = Table(
@@ -28,9 +29,12 @@ assoc_split_exercise = Table(
     Column("rest_time", Integer),
     Column("advanced_technique", String, nullable=True),
     Column("deleted", Integer, default=False),
+    Column("change_version", BigInteger, nullable=False, server_default=text("0")),
     ForeignKeyConstraint(
         ["split", "workout_plan_id"],
         ["workout_split.split", "workout_split.workout_plan_id"],
         name=DatabaseConstraints.SplitExercise.FK_WORKOUT_SPLIT,
     ),
 )
+
+track_changes(assoc_split_exercise, DatabaseConstraints.SplitExercise.IDX_CHANGE_VERSION)
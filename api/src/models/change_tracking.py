@@ -0,0 +1,30 @@
+from sqlalchemy import DDL, Index, Table, event
+
+from src.models.base_models import BaseOrmModel
+
+# change_version holds the ID of the last transaction that wrote the row. Transaction IDs only
+# grow, and every transaction below the xmin of a snapshot has already committed or aborted, so
+# reading cursor <= change_version < xmin and handing xmin back as the next cursor never skips
+# a write that commits late. See SyncRepository.
+SET_CHANGE_VERSION = """
+CREATE OR REPLACE FUNCTION set_change_version() RETURNS trigger
+LANGUAGE plpgsql
+AS $$ BEGIN NEW.change_version := pg_current_xact_id()::text::bigint; RETURN NEW; END $$
+"""
+
+event.listen(BaseOrmModel.metadata, "before_create", DDL(SET_CHANGE_VERSION).execute_if(dialect="postgresql"))
+
+
+def track_changes(table: Table, index_name: str) -> Index:
+    """
+    Keep the change_version column of a table up to date on every insert and update,
+    and index it for the delta sync. The column itself is declared with the table.
+    """
+
+    trigger = (
+        f"CREATE TRIGGER {table.name}_change_version BEFORE INSERT OR UPDATE ON {table.name} "
+        "FOR EACH ROW EXECUTE FUNCTION set_change_version()"
+    )
+    event.listen(table, "after_create", DDL(trigger).execute_if(dialect="postgresql"))
+
+    return Index(index_name, table.c.change_version)
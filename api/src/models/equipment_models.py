@@ -1,6 +1,8 @@
 from src.models.base_models import BaseOrmModel
+from src.models.change_tracking import track_changes
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import ForeignKey, Index, UniqueConstraint
+from sqlalchemy import BigInteger, ForeignKey, Index, UniqueConstraint, text
+from src.models.text_search import trigram_index
 from src.utils.constraints import DatabaseConstraints
 from datetime import datetime
 
@@ -23,3 +25,8 @@ class Equipment:
     deleted: Mapped[bool] = mapped_column(default=False)
     created_at: Mapped[datetime] = mapped_column(default_factory=datetime.now, nullable=False, init=False)
     deleted_at: Mapped[datetime] = mapped_column(default=None, nullable=True)
+    change_version: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), init=False)
+
+
+trigram_index(DatabaseConstraints.Equipment.IDX_NAME_SEARCH, Equipment.equipment_name)
+track_changes(Equipment.__table__, DatabaseConstraints.Equipment.IDX_CHANGE_VERSION)
@@ -1,14 +1,15 @@
 from src.models.base_models import BaseOrmModel
-from sqlalchemy import ForeignKey, UniqueConstraint
+from src.models.change_tracking import track_changes
+from sqlalchemy import BigInteger, ForeignKey, text
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime
 
+from src.models.text_search import trigram_index
 from src.utils.constraints import DatabaseConstraints
 
 @BaseOrmModel.registry.mapped_as_dataclass
 class Exercise:
     __tablename__ = "exercise"
-    ___table_args__ = (UniqueConstraint("exercise_name", "user_id", name=DatabaseConstraints.Exercise.UNIQUE),)
 
     id: Mapped[int] = mapped_column(primary_key=True, init=False)
     user_id: Mapped[int] = mapped_column(
@@ -18,4 +19,9 @@ class Exercise:
     description: Mapped[str] = mapped_column(default=None, nullable=True)
     deleted: Mapped[bool] = mapped_column(default=False)
     created_at: Mapped[datetime] = mapped_column(default_factory=datetime.now, nullable=False, init=False)
-    deleted_at: Mapped[datetime] = mapped_column(default=None, nullable=True)
\ No newline at end of file
+    deleted_at: Mapped[datetime] = mapped_column(default=None, nullable=True)
+    change_version: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), init=False)
+
+
+trigram_index(DatabaseConstraints.Exercise.IDX_NAME_SEARCH, Exercise.exercise_name)
+track_changes(Exercise.__table__, DatabaseConstraints.Exercise.IDX_CHANGE_VERSION)
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from src.models.base_models import BaseOrmModel
+from sqlalchemy import Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from src.utils.constraints import DatabaseConstraints
+
+@BaseOrmModel.registry.mapped_as_dataclass
+class IdempotencyKey:
+    """
+    Idempotency-Key of a request already processed, with the hash of its payload and the response
+    it got. Written in the same transaction as the request's own changes, so a key exists if and
+    only if those changes were committed.
+    """
+
+    __tablename__ = "idempotency_key"
+    __table_args__ = (Index(DatabaseConstraints.IdempotencyKey.IDX_CREATED_AT, "created_at"),)
+
+    key: Mapped[str] = mapped_column(primary_key=True)
+    request_hash: Mapped[str]
+    response: Mapped[dict | None] = mapped_column(JSONB, nullable=True, default=None)
+    created_at: Mapped[datetime] = mapped_column(default_factory=datetime.now, nullable=False, init=False)
@@ -1,5 +1,8 @@
 from src.models.base_models import BaseOrmModel
+from src.models.change_tracking import track_changes
+from sqlalchemy import BigInteger, text
 from sqlalchemy.orm import Mapped, mapped_column
+from src.utils.constraints import DatabaseConstraints
 from datetime import datetime
 
 @BaseOrmModel.registry.mapped_as_dataclass
@@ -10,4 +13,8 @@ class MuscleGroup:
     group_name: Mapped[str] = mapped_column(primary_key=True)
     deleted: Mapped[bool] = mapped_column(default=False)
     created_at: Mapped[datetime] = mapped_column(default_factory=datetime.now, nullable=False, init=False)
-    deleted_at: Mapped[datetime] = mapped_column(default=None, nullable=True)
\ No newline at end of file
+    deleted_at: Mapped[datetime] = mapped_column(default=None, nullable=True)
+    change_version: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), init=False)
+
+
+track_changes(MuscleGroup.__table__, DatabaseConstraints.MuscleGroup.IDX_CHANGE_VERSION)
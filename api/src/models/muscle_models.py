@@ -1,11 +1,13 @@
 
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import BigInteger, ForeignKey, Integer, String, UniqueConstraint, text
 
 from src.models.base_models import BaseOrmModel
+from src.models.change_tracking import track_changes
 from sqlalchemy.orm import Mapped, mapped_column
 
+from src.models.text_search import trigram_index
 from src.utils.constraints import DatabaseConstraints
 
 
@@ -29,4 +31,9 @@ class Muscle:
     muscle_name: Mapped[str] = mapped_column()
     deleted: Mapped[bool] = mapped_column(default=False)
     created_at: Mapped[datetime] = mapped_column(default_factory=datetime.now, nullable=False, init=False)
-    deleted_at: Mapped[datetime] = mapped_column(default=None, nullable=True)
\ No newline at end of file
+    deleted_at: Mapped[datetime] = mapped_column(default=None, nullable=True)
+    change_version: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), init=False)
+
+
+trigram_index(DatabaseConstraints.Muscle.IDX_NAME_SEARCH, Muscle.muscle_name)
+track_changes(Muscle.__table__, DatabaseConstraints.Muscle.IDX_CHANGE_VERSION)
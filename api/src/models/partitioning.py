@@ -0,0 +1,86 @@
+from sqlalchemy import DDL, Table, event
+
+from src.models.base_models import BaseOrmModel
+
+# Partitioned by month on report_date, see ReportPartitionRepository
+PARTITIONED_TABLES = ("workout_report", "split_set_report")
+
+# Creates the monthly partitions of the report tables that don't exist yet, for both tables at once
+# so a set report always has the partition of its workout report. Rows of the month that were
+# written to the default partitions meanwhile are moved over, Postgres refuses to create a
+# partition while the default one holds rows of its range.
+CREATE_REPORT_PARTITIONS = """
+CREATE OR REPLACE FUNCTION create_report_partitions(first_month date, months integer) RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month_start date;
+    month_end date;
+    suffix text;
+    has_rows boolean;
+    created integer := 0;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('create_report_partitions'));
+
+    FOR i IN 0 .. months - 1 LOOP
+        month_start := (date_trunc('month', first_month) + make_interval(months => i))::date;
+        month_end := (month_start + interval '1 month')::date;
+        suffix := to_char(month_start, '"y"YYYY"m"MM');
+        CONTINUE WHEN to_regclass('workout_report_' || suffix) IS NOT NULL;
+
+        SELECT EXISTS (
+            SELECT FROM workout_report_default WHERE report_date >= month_start AND report_date < month_end
+        ) INTO has_rows;
+
+        IF has_rows THEN
+            EXECUTE format(
+                'CREATE TEMP TABLE moved_workout_report AS SELECT * FROM workout_report_default '
+                'WHERE report_date >= %L AND report_date < %L', month_start, month_end
+            );
+            EXECUTE format(
+                'CREATE TEMP TABLE moved_split_set_report AS SELECT * FROM split_set_report_default '
+                'WHERE report_date >= %L AND report_date < %L', month_start, month_end
+            );
+            DELETE FROM split_set_report_default WHERE report_date >= month_start AND report_date < month_end;
+            DELETE FROM workout_report_default WHERE report_date >= month_start AND report_date < month_end;
+        END IF;
+
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF workout_report FOR VALUES FROM (%L) TO (%L)',
+            'workout_report_' || suffix, month_start, month_end
+        );
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF split_set_report FOR VALUES FROM (%L) TO (%L)',
+            'split_set_report_' || suffix, month_start, month_end
+        );
+
+        IF has_rows THEN
+            EXECUTE 'INSERT INTO workout_report SELECT * FROM moved_workout_report';
+            EXECUTE 'INSERT INTO split_set_report SELECT * FROM moved_split_set_report';
+            DROP TABLE moved_workout_report, moved_split_set_report;
+        END IF;
+
+        created := created + 1;
+    END LOOP;
+
+    RETURN created;
+END $$
+"""
+
+# DDL formats the statement with %, the placeholders of format() are escaped
+event.listen(
+    BaseOrmModel.metadata,
+    "before_create",
+    DDL(CREATE_REPORT_PARTITIONS.replace("%", "%%")).execute_if(dialect="postgresql"),
+)
+
+
+def default_partition(table: Table):
+    """
+    Give a table partitioned by month a default partition, holding the rows of months whose
+    partition wasn't created yet so writes never fail for lack of one.
+    The table itself is declared with postgresql_partition_by.
+    """
+
+    partition = f"CREATE TABLE {table.name}_default PARTITION OF {table.name} DEFAULT"
+    event.listen(table, "after_create", DDL(partition).execute_if(dialect="postgresql"))
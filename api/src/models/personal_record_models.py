@@ -0,0 +1,40 @@
+from datetime import date
+
+from src.models.base_models import BaseOrmModel
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from src.utils.constraints import DatabaseConstraints
+
+@BaseOrmModel.registry.mapped_as_dataclass
+class PersonalRecord:
+    """
+    A user's best sets on an exercise: the heaviest weight, the best estimated 1RM and the set
+    with the most volume (weight * reps), each with the workout report it was done in.
+    Kept up to date as set reports are written, see PersonalRecordRepository.
+    The report IDs have no foreign key, so old reports can be archived without losing the records.
+    The report dates tell a rebuild which records come from archived months, they are NULL for
+    records whose report was already gone when they were added.
+    """
+
+    __tablename__ = "personal_record"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", name=DatabaseConstraints.PersonalRecord.FK_USER), primary_key=True
+    )
+    exercise_id: Mapped[int] = mapped_column(
+        ForeignKey("exercise.id", name=DatabaseConstraints.PersonalRecord.FK_EXERCISE), primary_key=True
+    )
+    max_weight: Mapped[float]
+    max_weight_reps: Mapped[int]
+    max_weight_report_id: Mapped[int]
+    max_weight_report_date: Mapped[date | None]
+    best_one_rep_max: Mapped[float]
+    best_one_rep_max_weight: Mapped[float]
+    best_one_rep_max_reps: Mapped[int]
+    best_one_rep_max_report_id: Mapped[int]
+    best_one_rep_max_report_date: Mapped[date | None]
+    best_set_volume: Mapped[float]
+    best_set_volume_weight: Mapped[float]
+    best_set_volume_reps: Mapped[int]
+    best_set_volume_report_id: Mapped[int]
+    best_set_volume_report_date: Mapped[date | None]
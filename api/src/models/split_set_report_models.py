@@ -1,16 +1,29 @@
 from src.models.base_models import BaseOrmModel
+from src.models.partitioning import default_partition
 from sqlalchemy.orm import Mapped, mapped_column
 from src.utils.constraints import DatabaseConstraints
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, ForeignKeyConstraint
+from datetime import date
 
 
 @BaseOrmModel.registry.mapped_as_dataclass
 class SplitSetReport:
-    __tablename__ = "split_set_report"
+    """
+    Partitioned by month like workout_report. report_date is copied from the workout report so
+    both tables are partitioned the same way and a month of each can be detached together.
+    """
 
-    workout_report_id: Mapped[int] = mapped_column(
-        ForeignKey("workout_report.id", name=DatabaseConstraints.SetReport.FK_WORKOUT_REPORT), primary_key=True
+    __tablename__ = "split_set_report"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["workout_report_id", "report_date"],
+            ["workout_report.id", "workout_report.report_date"],
+            name=DatabaseConstraints.SetReport.FK_WORKOUT_REPORT,
+        ),
+        {"postgresql_partition_by": "RANGE (report_date)"},
     )
+
+    workout_report_id: Mapped[int] = mapped_column(primary_key=True)
     exercise_id: Mapped[int] = mapped_column(
         ForeignKey("exercise.id", name=DatabaseConstraints.SetReport.FK_EXERCISE), primary_key=True
     )
@@ -20,3 +33,7 @@ class SplitSetReport:
     reps: Mapped[str]
     weight: Mapped[float]
     notes: Mapped[str] = mapped_column(nullable=True)
+    report_date: Mapped[date] = mapped_column(primary_key=True)
+
+
+default_partition(SplitSetReport.__table__)
@@ -0,0 +1,37 @@
+from sqlalchemy import DDL, Index, event, func, text
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.models.base_models import BaseOrmModel
+
+# unaccent() is only STABLE, because its dictionary can change, so it can't be used in an index.
+# The wrapper pins the dictionary and is declared IMMUTABLE.
+F_UNACCENT = """
+CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+"""
+
+for statement in ("CREATE EXTENSION IF NOT EXISTS pg_trgm", "CREATE EXTENSION IF NOT EXISTS unaccent", F_UNACCENT):
+    event.listen(BaseOrmModel.metadata, "before_create", DDL(statement).execute_if(dialect="postgresql"))
+
+
+def search_expression(column):
+    """
+    Lowercase and unaccented form of a text column, the expression the trigram indexes are built on.
+    """
+
+    return func.lower(func.f_unaccent(column))
+
+
+def trigram_index(name: str, column: InstrumentedAttribute) -> Index:
+    """
+    GIN trigram index over the search expression of a column, restricted to live rows.
+    """
+
+    return Index(
+        name,
+        search_expression(column).label("search"),
+        postgresql_using="gin",
+        postgresql_ops={"search": "gin_trgm_ops"},
+        postgresql_where=text("NOT deleted"),
+    )
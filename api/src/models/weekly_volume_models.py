@@ -0,0 +1,26 @@
+from src.models.base_models import BaseOrmModel
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from src.utils.constraints import DatabaseConstraints
+from datetime import date
+
+@BaseOrmModel.registry.mapped_as_dataclass
+class WeeklyVolume:
+    """
+    Rollup of a user's set reports per exercise and ISO week, week_start being the monday of the week.
+    Kept up to date as set reports are written, see WeeklyVolumeRepository.
+    """
+
+    __tablename__ = "weekly_volume"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", name=DatabaseConstraints.WeeklyVolume.FK_USER), primary_key=True
+    )
+    exercise_id: Mapped[int] = mapped_column(
+        ForeignKey("exercise.id", name=DatabaseConstraints.WeeklyVolume.FK_EXERCISE), primary_key=True
+    )
+    week_start: Mapped[date] = mapped_column(primary_key=True)
+    total_sets: Mapped[int] = mapped_column(default=0)
+    total_reps: Mapped[int] = mapped_column(default=0)
+    tonnage: Mapped[float] = mapped_column(default=0)
+    top_weight: Mapped[float] = mapped_column(default=0)
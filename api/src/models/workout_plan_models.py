@@ -1,5 +1,6 @@
 from src.models.base_models import BaseOrmModel
-from sqlalchemy import ForeignKey, UniqueConstraint
+from src.models.change_tracking import track_changes
+from sqlalchemy import BigInteger, ForeignKey, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime
 
@@ -17,5 +18,7 @@ class WorkoutPlan:
     deleted: Mapped[bool] = mapped_column(default=False)
     created_at: Mapped[datetime] = mapped_column(default_factory=datetime.now, nullable=False, init=False)
     deleted_at: Mapped[datetime] = mapped_column(default=None, nullable=True)
+    change_version: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), init=False)
 
 
+track_changes(WorkoutPlan.__table__, DatabaseConstraints.WorkoutPlan.IDX_CHANGE_VERSION)
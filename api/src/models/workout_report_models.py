@@ -1,11 +1,17 @@
 from src.utils.constraints import DatabaseConstraints
 from src.models.base_models import BaseOrmModel
+from src.models.partitioning import default_partition
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import date
-from sqlalchemy import ForeignKeyConstraint
+from sqlalchemy import ForeignKeyConstraint, Identity, UniqueConstraint
 
 @BaseOrmModel.registry.mapped_as_dataclass
 class WorkoutReport:
+    """
+    Partitioned by month on report_date. The ID is unique on its own, but a unique constraint of a
+    partitioned table has to include the partition key, so set reports reference (id, report_date).
+    """
+
     __tablename__ = "workout_report"
     __table_args__ = (
         ForeignKeyConstraint(
@@ -13,9 +19,14 @@ class WorkoutReport:
             ["workout_split.split", "workout_split.workout_plan_id"],
             name=DatabaseConstraints.WorkoutReport.FK_WORKOUT_PLAN,
         ),
+        UniqueConstraint("id", "report_date", name=DatabaseConstraints.WorkoutReport.UNIQUE_ID),
+        {"postgresql_partition_by": "RANGE (report_date)"},
     )
 
     report_date: Mapped[date] = mapped_column(primary_key=True)
-    id: Mapped[int] = mapped_column(primary_key=True, init=False, unique=True)
+    id: Mapped[int] = mapped_column(Identity(), primary_key=True, init=False)
     workout_plan_id: Mapped[int] = mapped_column(primary_key=True)
     split: Mapped[str] = mapped_column()
+
+
+default_partition(WorkoutReport.__table__)
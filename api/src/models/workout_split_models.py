@@ -1,5 +1,6 @@
 from src.models.base_models import BaseOrmModel
-from sqlalchemy import ForeignKey
+from src.models.change_tracking import track_changes
+from sqlalchemy import BigInteger, ForeignKey, text
 from sqlalchemy.orm import Mapped, mapped_column
 from src.utils.constraints import DatabaseConstraints
 from datetime import datetime
@@ -15,3 +16,7 @@ class WorkoutSplit:
     deleted: Mapped[bool] = mapped_column(default=False)
     created_at: Mapped[datetime] = mapped_column(default_factory=datetime.now, nullable=False, init=False)
     deleted_at: Mapped[datetime] = mapped_column(default=None, nullable=True)
+    change_version: Mapped[int] = mapped_column(BigInteger, server_default=text("0"), init=False)
+
+
+track_changes(WorkoutSplit.__table__, DatabaseConstraints.WorkoutSplit.IDX_CHANGE_VERSION)
@@ -1,5 +1,9 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.config import SETTINGS
+from src.utils.pagination import encode_cursor
 
 
 class BaseRepository:
@@ -11,4 +15,39 @@ class BaseRepository:
         result = await self.session.execute(select(query).select_from(query).offset(offset).limit(page_size))
         result = result.scalars().all()
 
-        return result
\ No newline at end of file
+        return result
+
+    async def paginate_keyset(
+        self,
+        query: Select,
+        order_columns: tuple[InstrumentedAttribute, ...],
+        after: list | None = None,
+        page_size: int = SETTINGS.DEFAULT_PAGE_SIZE,
+    ):
+        """
+        Paginate a query by seeking past the ordering columns of the previous page.
+        Unlike OFFSET, every page costs one index range scan regardless of its depth.
+        Args:
+            query (Select): Query selecting a single ORM entity.
+            order_columns (tuple[InstrumentedAttribute, ...]): Unique ordering of the entity, backed by an index.
+            after (list | None): Ordering values of the last row of the previous page.
+            page_size (int): Maximum number of rows in the page.
+        Returns:
+            tuple[list, str | None]: Rows of the page and the cursor of the next one, None on the last page.
+        """
+
+        if after is not None:
+            if len(after) != len(order_columns):
+                raise ValueError("Invalid cursor")
+            query = query.where(tuple_(*order_columns) > tuple_(*after))
+
+        result = await self.session.execute(query.order_by(*order_columns).limit(page_size + 1))
+        rows = list(result.scalars().all())
+
+        if len(rows) <= page_size:
+            return rows, None
+
+        rows = rows[:page_size]
+        next_cursor = encode_cursor([getattr(rows[-1], column.key) for column in order_columns])
+
+        return rows, next_cursor
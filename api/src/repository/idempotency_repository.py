@@ -0,0 +1,40 @@
+from datetime import datetime
+
+from src.models import IdempotencyKey
+from src.repository.base_repository import BaseRepository
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, select, update
+
+class IdempotencyRepository(BaseRepository):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+        self.db = db
+
+    async def claim(self, key: str, request_hash: str) -> bool:
+        """
+        Record a key in the session transaction.
+        If another transaction is still processing the same key, this waits for it to finish.
+        Returns:
+            bool: True if the key is new, False if it was already committed.
+        """
+
+        query = (
+            pg_insert(IdempotencyKey)
+            .values(key=key, request_hash=request_hash, created_at=datetime.now())
+            .on_conflict_do_nothing(index_elements=[IdempotencyKey.key])
+            .returning(IdempotencyKey.key)
+        )
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none() is not None
+
+    async def get(self, key: str) -> IdempotencyKey | None:
+        result = await self.db.execute(select(IdempotencyKey).where(IdempotencyKey.key == key))
+        return result.scalar_one_or_none()
+
+    async def save_response(self, key: str, response: dict):
+        await self.db.execute(update(IdempotencyKey).where(IdempotencyKey.key == key).values(response=response))
+
+    async def purge(self, before: datetime) -> int:
+        result = await self.db.execute(delete(IdempotencyKey).where(IdempotencyKey.created_at < before))
+        return result.rowcount
@@ -1,16 +1,27 @@
 from datetime import datetime
+from src.config import SETTINGS
 from src.models import MuscleGroup
+from src.repository.base_repository import BaseRepository
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, insert, update
+from sqlalchemy import Integer, String, and_, column, exists, or_, select, insert, tuple_, update, values
+from sqlalchemy.orm import aliased
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+class MuscleGroupRepository(BaseRepository):
+    ORDER_COLUMNS = (MuscleGroup.user_id, MuscleGroup.group_name)
 
-class MuscleGroupRepository:
     def __init__(self, db: AsyncSession):
+        super().__init__(db)
         self.db = db
 
     async def get_all_muscle_groups(self):
         result = await self.db.execute(select(MuscleGroup).where(MuscleGroup.deleted == False))
         return result.scalars().all()
 
+    async def get_muscle_groups_page(self, after: list | None = None, page_size: int = SETTINGS.DEFAULT_PAGE_SIZE):
+        query = select(MuscleGroup).where(MuscleGroup.deleted == False)
+        return await self.paginate_keyset(query, self.ORDER_COLUMNS, after, page_size)
+
     async def create_muscle_group(self, data: dict):
         result = await self.db.execute(insert(MuscleGroup).values(**data).returning(MuscleGroup))
         return result.scalar_one_or_none()
@@ -39,4 +50,113 @@ class MuscleGroupRepository:
             .returning(MuscleGroup)
         )
         result = await self.db.execute(query)
-        return result.scalar_one_or_none()
\ No newline at end of file
+        return result.scalar_one_or_none()
+
+    async def bulk_create_muscle_groups(self, data: list[dict]):
+        """
+        Insert the groups that don't exist yet, soft-deleted ones are brought back.
+        Live groups are left untouched and not returned.
+        """
+
+        now = datetime.now()
+        # ON CONFLICT DO UPDATE can't touch the same row twice in one statement, so repeated keys go once
+        rows = {(item["user_id"], item["group_name"]): {**item, "created_at": now} for item in data}
+        query = pg_insert(MuscleGroup).values(list(rows.values()))
+        query = query.on_conflict_do_update(
+            index_elements=[MuscleGroup.user_id, MuscleGroup.group_name],
+            set_={"deleted": False, "deleted_at": None, "created_at": query.excluded.created_at},
+            where=MuscleGroup.deleted == True,
+        ).returning(MuscleGroup)
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    async def bulk_update_muscle_groups(self, data: list[dict]):
+        """
+        Move live groups to their new owners. The old key is soft-deleted rather than rewritten, so
+        the previous owner gets a tombstone on their next sync, and the new key is inserted, bringing
+        it back if it was soft-deleted. A move whose new key is held by a live group is skipped instead
+        of failing the whole statement on the primary key. So is every move after the first one from
+        or to the same key.
+        """
+
+        sources, targets, rows = set(), set(), []
+        for item in data:
+            source, target = (item["current_user_id"], item["group_name"]), (item["user_id"], item["group_name"])
+            if source not in sources and target not in targets:
+                sources.add(source)
+                targets.add(target)
+                rows.append((item["group_name"], item["current_user_id"], item["user_id"]))
+
+        changes = values(
+            column("group_name", String),
+            column("current_user_id", Integer),
+            column("user_id", Integer),
+            name="changes",
+        ).data(rows)
+        taken = aliased(MuscleGroup)
+
+        query = (
+            update(MuscleGroup)
+            .where(
+                MuscleGroup.group_name == changes.c.group_name,
+                MuscleGroup.user_id == changes.c.current_user_id,
+                MuscleGroup.deleted == False,
+                or_(
+                    changes.c.user_id == changes.c.current_user_id,
+                    ~exists().where(
+                        taken.user_id == changes.c.user_id,
+                        taken.group_name == changes.c.group_name,
+                        taken.deleted == False,
+                    ),
+                ),
+            )
+            .values(deleted=True, deleted_at=datetime.now())
+            .returning(MuscleGroup.group_name, changes.c.current_user_id, changes.c.user_id, MuscleGroup.created_at)
+            .execution_options(synchronize_session=False)
+        )
+        moved = (await self.db.execute(query)).all()
+        if not moved:
+            return []
+
+        # A no-op move restores the row it has just soft-deleted, leaving it live with a new change version
+        inserted = pg_insert(MuscleGroup).values(
+            [{"user_id": row.user_id, "group_name": row.group_name, "created_at": row.created_at} for row in moved]
+        )
+        inserted = (
+            inserted.on_conflict_do_update(
+                index_elements=[MuscleGroup.user_id, MuscleGroup.group_name],
+                set_={"deleted": False, "deleted_at": None, "created_at": inserted.excluded.created_at},
+            )
+            .returning(MuscleGroup.group_name, MuscleGroup.user_id, MuscleGroup.deleted)
+            .cte("inserted")
+        )
+        owners = values(
+            column("group_name", String),
+            column("current_user_id", Integer),
+            column("user_id", Integer),
+            name="owners",
+        ).data([(row.group_name, row.current_user_id, row.user_id) for row in moved])
+
+        query = select(inserted, owners.c.current_user_id).join(
+            owners, and_(owners.c.user_id == inserted.c.user_id, owners.c.group_name == inserted.c.group_name)
+        )
+        result = await self.db.execute(query)
+        return result.all()
+
+    async def get_live_keys(self, keys: list[tuple[int, str]]) -> set[tuple[int, str]]:
+        query = select(MuscleGroup.user_id, MuscleGroup.group_name).where(
+            tuple_(MuscleGroup.user_id, MuscleGroup.group_name).in_(keys), MuscleGroup.deleted == False
+        )
+        result = await self.db.execute(query)
+        return {tuple(row) for row in result.all()}
+
+    async def bulk_delete_muscle_groups(self, keys: list[tuple[int, str]]):
+        query = (
+            update(MuscleGroup)
+            .where(tuple_(MuscleGroup.user_id, MuscleGroup.group_name).in_(keys), MuscleGroup.deleted == False)
+            .values(deleted=True, deleted_at=datetime.now())
+            .returning(MuscleGroup)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(query)
+        return result.scalars().all()
@@ -1,9 +1,14 @@
+from src.config import SETTINGS
 from src.models import Muscle
+from src.repository.base_repository import BaseRepository
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import insert, select, select
 
-class MuscleRepository:
+class MuscleRepository(BaseRepository):
+    ORDER_COLUMNS = (Muscle.id,)
+
     def __init__(self, db: AsyncSession):
+        super().__init__(db)
         self.db = db
 
     async def get_muscle_by_id(self, muscle_id):
@@ -16,6 +21,9 @@ class MuscleRepository:
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def get_muscles_page(self, after: list | None = None, page_size: int = SETTINGS.DEFAULT_PAGE_SIZE):
+        return await self.paginate_keyset(select(Muscle), self.ORDER_COLUMNS, after, page_size)
+
     async def create_muscle(self, data: dict):
         result = await self.db.execute(insert(Muscle).values(data).returning(Muscle))
         return result.scalar_one_or_none()
\ No newline at end of file
@@ -0,0 +1,259 @@
+from datetime import date
+
+from src.config import SETTINGS
+from src.models import PersonalRecord, SplitSetReport, WorkoutPlan, WorkoutReport
+from src.repository.base_repository import BaseRepository
+from src.repository.report_partition_repository import ReportPartitionRepository
+from src.utils.training import estimate_one_rep_max, parse_reps, parse_reps_sql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import ColumnElement, Float, and_, case, cast, delete, exists, func, or_, select, union_all
+
+# Each record keeps its score column followed by the columns describing the set it came from
+RECORD_COLUMNS = {
+    "max_weight": ("max_weight", "max_weight_reps", "max_weight_report_id", "max_weight_report_date"),
+    "best_one_rep_max": (
+        "best_one_rep_max",
+        "best_one_rep_max_weight",
+        "best_one_rep_max_reps",
+        "best_one_rep_max_report_id",
+        "best_one_rep_max_report_date",
+    ),
+    "best_set_volume": (
+        "best_set_volume",
+        "best_set_volume_weight",
+        "best_set_volume_reps",
+        "best_set_volume_report_id",
+        "best_set_volume_report_date",
+    ),
+}
+
+
+def record_values(record: str, score, weight, reps, report_id, report_date) -> dict:
+    """
+    Map a set to the columns of a record. max_weight has no weight column, its score is the weight.
+    """
+
+    values = (score, weight, reps, report_id, report_date)
+    if record == "max_weight":
+        values = (score, *values[2:])
+    return dict(zip(RECORD_COLUMNS[record], values))
+
+
+def record_set(record: str) -> tuple:
+    """
+    Inverse of record_values: the weight, reps, report ID and report date columns of the set a record came from.
+    """
+
+    weight = getattr(PersonalRecord, record if record == "max_weight" else f"{record}_weight")
+    return weight, *(getattr(PersonalRecord, f"{record}_{name}") for name in ("reps", "report_id", "report_date"))
+
+
+def one_rep_max_sql(weight: ColumnElement, reps: ColumnElement, formula: str) -> ColumnElement:
+    """
+    SQL counterpart of estimate_one_rep_max, for sets with at least one rep.
+    """
+
+    reps = cast(reps, Float)
+    if formula == "epley":
+        estimate = weight * (1 + reps / 30)
+    elif formula == "brzycki":
+        estimate = weight * 36 / (37 - func.least(reps, 36))
+    else:
+        raise ValueError(f"Unknown 1RM formula {formula}")
+
+    return case((reps == 1, weight), else_=estimate)
+
+
+class PersonalRecordRepository(BaseRepository):
+    def __init__(self, db: AsyncSession, formula: str = SETTINGS.ONE_REP_MAX_FORMULA):
+        super().__init__(db)
+        self.db = db
+        self.formula = formula
+
+    def aggregate_sets(self, sets: list[dict]) -> list[dict]:
+        """
+        Keep the best set of each record per user and exercise. Sets without any rep don't count,
+        and on a tie the set seen first wins.
+        Args:
+            sets (list[dict]): Set reports with the user_id and report_date of their workout report.
+        Returns:
+            list[dict]: Personal record rows ready to be upserted.
+        """
+
+        rows = {}
+        for item in sets:
+            reps = parse_reps(item["reps"])
+            if reps < 1:
+                continue
+
+            weight = float(item["weight"])
+            scores = {
+                "max_weight": weight,
+                "best_one_rep_max": estimate_one_rep_max(weight, reps, self.formula),
+                "best_set_volume": weight * reps,
+            }
+            key = (item["user_id"], item["exercise_id"])
+            row = rows.setdefault(key, {"user_id": key[0], "exercise_id": key[1]})
+
+            for record, score in scores.items():
+                if record not in row or score > row[record]:
+                    row.update(
+                        record_values(record, score, weight, reps, item["workout_report_id"], item["report_date"])
+                    )
+
+        return list(rows.values())
+
+    async def add_sets(self, sets: list[dict]):
+        """
+        Merge new set reports into the personal records, in the session transaction.
+        Only records the new sets beat are replaced.
+        """
+
+        rows = self.aggregate_sets(sets)
+        if not rows:
+            return
+
+        query = pg_insert(PersonalRecord).values(rows)
+        set_ = {}
+        for record, columns in RECORD_COLUMNS.items():
+            beaten = query.excluded[record] > getattr(PersonalRecord, record)
+            for name in columns:
+                set_[name] = case((beaten, query.excluded[name]), else_=getattr(PersonalRecord, name))
+
+        await self.db.execute(
+            query.on_conflict_do_update(index_elements=[PersonalRecord.user_id, PersonalRecord.exercise_id], set_=set_)
+        )
+
+    async def get_personal_records(self, user_id: int):
+        result = await self.db.execute(
+            select(PersonalRecord).where(PersonalRecord.user_id == user_id).order_by(PersonalRecord.exercise_id)
+        )
+        return result.scalars().all()
+
+    def _candidate_sets(self, bound: date | None, user_id: int | None, exercise_ids: set[int] | None):
+        """
+        Sets a rebuild picks the records from: the set reports from bound on, and the sets of the
+        current records that are older than bound, which may no longer be attached.
+        """
+
+        reps = parse_reps_sql(SplitSetReport.reps)
+        fresh = (
+            select(
+                WorkoutPlan.user_id,
+                SplitSetReport.exercise_id,
+                SplitSetReport.workout_report_id.label("report_id"),
+                SplitSetReport.report_date,
+                SplitSetReport.weight,
+                reps.label("reps"),
+            )
+            .join(
+                WorkoutReport,
+                and_(
+                    WorkoutReport.id == SplitSetReport.workout_report_id,
+                    WorkoutReport.report_date == SplitSetReport.report_date,
+                ),
+            )
+            .join(WorkoutPlan, WorkoutPlan.id == WorkoutReport.workout_plan_id)
+            .where(reps >= 1)
+        )
+        if user_id is not None:
+            fresh = fresh.where(WorkoutPlan.user_id == user_id)
+        if exercise_ids is not None:
+            fresh = fresh.where(SplitSetReport.exercise_id.in_(exercise_ids))
+        if bound is None:
+            return fresh
+
+        fresh = fresh.where(WorkoutReport.report_date >= bound, SplitSetReport.report_date >= bound)
+        kept = []
+        for record in RECORD_COLUMNS:
+            weight, reps, report_id, report_date = record_set(record)
+            query = select(PersonalRecord.user_id, PersonalRecord.exercise_id, report_id, report_date, weight, reps)
+            # The report of a record without a date was already gone when it was set
+            query = query.where(or_(report_date.is_(None), report_date < bound))
+            if user_id is not None:
+                query = query.where(PersonalRecord.user_id == user_id)
+            if exercise_ids is not None:
+                query = query.where(PersonalRecord.exercise_id.in_(exercise_ids))
+            kept.append(query)
+
+        return union_all(fresh, *kept)
+
+    async def rebuild(
+        self, user_id: int | None = None, exercise_ids: set[int] | None = None, since: date | None = None
+    ) -> int:
+        """
+        Derive the personal records again from the set reports, after reports are edited or deleted.
+        Only the sets from the oldest attached report partition on are read, or from since when later.
+        A record set before that is kept as a candidate, so the records of archived months are
+        never lost. If such a record is beaten by a set that is later deleted, the rebuild can only
+        fall back on the sets still known, the other archived sets are gone.
+        Args:
+            user_id (int | None): Only rebuild this user's records, everyone's when None.
+            exercise_ids (set[int] | None): Only rebuild the records of these exercises, all when None.
+            since (date | None): Only read the set reports from this day on.
+        Returns:
+            int: Number of personal record rows written.
+        """
+
+        oldest = await ReportPartitionRepository(self.db).get_oldest_partition()
+        bound = max((day for day in (since, oldest) if day is not None), default=None)
+
+        # Records without any set left are dropped, before the candidates are read from the records
+        remaining = self._candidate_sets(bound, user_id, exercise_ids).subquery()
+        clear = delete(PersonalRecord).where(
+            ~exists().where(
+                remaining.c.user_id == PersonalRecord.user_id, remaining.c.exercise_id == PersonalRecord.exercise_id
+            )
+        )
+        if user_id is not None:
+            clear = clear.where(PersonalRecord.user_id == user_id)
+        if exercise_ids is not None:
+            clear = clear.where(PersonalRecord.exercise_id.in_(exercise_ids))
+        await self.db.execute(clear)
+
+        candidates = self._candidate_sets(bound, user_id, exercise_ids).subquery("candidates")
+        sets = select(
+            candidates,
+            one_rep_max_sql(candidates.c.weight, candidates.c.reps, self.formula).label("one_rep_max"),
+            (candidates.c.weight * candidates.c.reps).label("set_volume"),
+        ).cte("sets")
+        scores = {
+            "max_weight": sets.c.weight,
+            "best_one_rep_max": sets.c.one_rep_max,
+            "best_set_volume": sets.c.set_volume,
+        }
+
+        # One DISTINCT ON per record picks the best set of every user and exercise, then they are joined side by side
+        first = joined = None
+        selected = []
+        for record, score in scores.items():
+            values = record_values(
+                record, score, sets.c.weight, sets.c.reps, sets.c.report_id, sets.c.report_date
+            )
+            best = (
+                select(sets.c.user_id, sets.c.exercise_id, *(value.label(name) for name, value in values.items()))
+                .distinct(sets.c.user_id, sets.c.exercise_id)
+                .order_by(sets.c.user_id, sets.c.exercise_id, score.desc(), sets.c.report_id)
+                .subquery(record)
+            )
+
+            if first is None:
+                first = joined = best
+                selected += [best.c.user_id, best.c.exercise_id]
+            else:
+                joined = joined.join(
+                    best, and_(best.c.user_id == first.c.user_id, best.c.exercise_id == first.c.exercise_id)
+                )
+            selected += [best.c[name] for name in values]
+
+        source = select(*selected).select_from(joined)
+
+        names = [name for names in RECORD_COLUMNS.values() for name in names]
+        query = pg_insert(PersonalRecord).from_select(["user_id", "exercise_id", *names], source)
+        query = query.on_conflict_do_update(
+            index_elements=[PersonalRecord.user_id, PersonalRecord.exercise_id],
+            set_={name: query.excluded[name] for name in names},
+        )
+        result = await self.db.execute(query)
+        return result.rowcount
@@ -0,0 +1,98 @@
+from datetime import date
+
+from src.models.partitioning import PARTITIONED_TABLES
+from src.repository.base_repository import BaseRepository
+from src.utils.constraints import DatabaseConstraints
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select, text
+
+
+def month_start(day: date, months: int = 0) -> date:
+    """
+    First day of the month of day, moved by months.
+    """
+
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """
+    Name of the partition of a report table holding a month, the same create_report_partitions gives it.
+    """
+
+    return f"{table}_y{month.year}m{month.month:02d}"
+
+
+class ReportPartitionRepository(BaseRepository):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+        self.db = db
+
+    async def create_partitions(self, first_month: date, months: int) -> int:
+        """
+        Create the missing monthly partitions of workout_report and split_set_report, moving over
+        the rows of those months already in the default partitions.
+        Args:
+            first_month (date): Any day of the first month.
+            months (int): Number of months from it.
+        Returns:
+            int: Number of months whose partitions were created.
+        """
+
+        result = await self.db.execute(select(func.create_report_partitions(first_month, months)))
+        return result.scalar_one()
+
+    async def get_partitions(self) -> list[date]:
+        """
+        Get the months with a partition attached, oldest first.
+        """
+
+        result = await self.db.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = 'workout_report'::regclass "
+                "AND child.relname <> 'workout_report_default'"
+            )
+        )
+        months = [date(int(name[-7:-3]), int(name[-2:]), 1) for name in result.scalars().all()]
+        return sorted(months)
+
+    async def get_oldest_partition(self) -> date | None:
+        """
+        Get the oldest month still attached. Rollups hold what the months before it had, they may
+        have been detached, so rebuilds never clear them.
+        """
+
+        partitions = await self.get_partitions()
+        return partitions[0] if partitions else None
+
+    async def detach_partitions(self, before: date) -> list[date]:
+        """
+        Detach the partitions of the months ending on or before a day from both report tables.
+        They become standalone tables that can be dumped and dropped, the weekly volume rollup
+        and the personal records keep what they hold. The foreign key the set report partition
+        keeps to workout_report is dropped, else the report partition couldn't be detached.
+        Args:
+            before (date): Months ending after this day stay attached.
+        Returns:
+            list[date]: The months detached.
+        """
+
+        detached = []
+        for month in await self.get_partitions():
+            if month_start(month, 1) > before:
+                break
+
+            workout_report, split_set_report = (partition_name(table, month) for table in PARTITIONED_TABLES)
+            await self.db.execute(text(f"ALTER TABLE split_set_report DETACH PARTITION {split_set_report}"))
+            await self.db.execute(
+                text(
+                    f"ALTER TABLE {split_set_report} DROP CONSTRAINT {DatabaseConstraints.SetReport.FK_WORKOUT_REPORT}"
+                )
+            )
+            await self.db.execute(text(f"ALTER TABLE workout_report DETACH PARTITION {workout_report}"))
+            detached.append(month)
+
+        return detached
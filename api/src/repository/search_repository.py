@@ -0,0 +1,69 @@
+from functools import cache
+
+from src.config import SETTINGS
+from src.models import Equipment, Exercise, Muscle
+from src.models.text_search import search_expression
+from src.repository.base_repository import BaseRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Integer, Select, bindparam, func, literal, or_, select, union_all
+
+class SearchRepository(BaseRepository):
+    # kind, entity, name column
+    CATALOG = (
+        ("exercise", Exercise, Exercise.exercise_name),
+        ("equipment", Equipment, Equipment.equipment_name),
+        ("muscle", Muscle, Muscle.muscle_name),
+    )
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+        self.db = db
+
+    @classmethod
+    @cache
+    def _search_query(cls) -> Select:
+        # Built once: autocomplete runs it on every keystroke and the union takes longer
+        # to assemble in Python than Postgres takes to answer it
+        search_term = search_expression(bindparam("term"))
+        limit = bindparam("limit", type_=Integer)
+
+        branches = []
+        for kind, entity, name_column in cls.CATALOG:
+            name = search_expression(name_column)
+            score = func.word_similarity(search_term, name)
+            best = (
+                select(
+                    literal(kind).label("kind"),
+                    entity.id.label("id"),
+                    name_column.label("name"),
+                    score.label("score"),
+                )
+                .where(
+                    entity.deleted == False,
+                    or_(entity.user_id.is_(None), entity.user_id == bindparam("user_id")),
+                    search_term.op("<%")(name),
+                )
+                .order_by(score.desc())
+                .limit(limit)
+                .subquery()
+            )
+            branches.append(select(best))
+
+        matches = union_all(*branches).subquery()
+        return select(matches).order_by(matches.c.score.desc(), matches.c.name).limit(limit)
+
+    async def search_catalog(self, term: str, user_id: int, limit: int = SETTINGS.SEARCH_DEFAULT_LIMIT):
+        """
+        Fuzzy, accent and case insensitive search over the names of the exercises, equipment
+        and muscles a user can see (the global catalog and their own), best matches first.
+        Candidates come from the trigram index of each table: a name matches when one of its
+        words is similar enough to the term, so prefixes and typos both match.
+        """
+
+        # Bound to the transaction, the default threshold (0.6) rejects most typos in short names
+        await self.db.execute(
+            select(func.set_config("pg_trgm.word_similarity_threshold", str(SETTINGS.SEARCH_SIMILARITY_THRESHOLD), True))
+        )
+
+        result = await self.db.execute(self._search_query(), {"term": term, "user_id": user_id, "limit": limit})
+        return result.mappings().all()
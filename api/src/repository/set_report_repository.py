@@ -0,0 +1,66 @@
+from datetime import date
+
+from src.models import SplitSetReport, WorkoutPlan, WorkoutReport
+from src.repository.base_repository import BaseRepository
+from src.repository.personal_record_repository import PersonalRecordRepository
+from src.repository.weekly_volume_repository import WeeklyVolumeRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, select
+
+class SetReportRepository(BaseRepository):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+        self.db = db
+        self.volume_repo = WeeklyVolumeRepository(db)
+        self.record_repo = PersonalRecordRepository(db)
+
+    async def get_report_owners(
+        self, workout_report_ids: set[int], report_dates: set[date] | None = None
+    ) -> dict[int, tuple]:
+        """
+        Get the user ID and report date of workout reports. Without report_dates every monthly
+        partition is probed, with them only the partitions of those days are.
+        """
+
+        query = (
+            select(WorkoutReport.id, WorkoutPlan.user_id, WorkoutReport.report_date)
+            .join(WorkoutPlan, WorkoutPlan.id == WorkoutReport.workout_plan_id)
+            .where(WorkoutReport.id.in_(workout_report_ids))
+        )
+        if report_dates is not None:
+            query = query.where(WorkoutReport.report_date.in_(report_dates))
+        result = await self.db.execute(query)
+        return {report_id: (user_id, report_date) for report_id, user_id, report_date in result.all()}
+
+    async def create_workout_report(self, data: dict) -> int:
+        result = await self.db.execute(insert(WorkoutReport).values(data).returning(WorkoutReport.id))
+        return result.scalar_one()
+
+    async def create_set_reports(self, data: list[dict], report_dates: set[date] | None = None):
+        """
+        Insert set reports and add them to the weekly volume rollup and the personal records,
+        all in the session transaction. Each set gets the report_date of its workout report, the
+        partition key of split_set_report.
+        Args:
+            data (list[dict]): Set reports to insert.
+            report_dates (set[date] | None): Dates of their workout reports when the caller knows them,
+                so only those partitions are searched.
+        Raises:
+            LookupError: If a workout report doesn't exist, before anything is written.
+        """
+
+        report_ids = {item["workout_report_id"] for item in data}
+        owners = await self.get_report_owners(report_ids, report_dates)
+        if missing := report_ids - owners.keys():
+            raise LookupError(f"Unknown workout reports {sorted(missing)}")
+
+        rows, sets = [], []
+        for item in data:
+            user_id, report_date = owners[item["workout_report_id"]]
+            rows.append({**item, "report_date": report_date})
+            sets.append({**item, "user_id": user_id, "report_date": report_date})
+
+        await self.db.execute(insert(SplitSetReport).values(rows))
+
+        await self.volume_repo.add_sets(sets)
+        await self.record_repo.add_sets(sets)
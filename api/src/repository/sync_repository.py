@@ -0,0 +1,65 @@
+from typing import Callable
+
+from src.models import Equipment, Exercise, Muscle, MuscleGroup, WorkoutPlan, WorkoutSplit, assoc_split_exercise
+from src.repository.base_repository import BaseRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import BigInteger, Boolean, ColumnElement, Row, Table, Text, cast, func, or_, select
+
+
+def _catalog_visible(table: Table, user_id: int) -> ColumnElement:
+    return or_(table.c.user_id.is_(None), table.c.user_id == user_id)
+
+
+def _owned(table: Table, user_id: int) -> ColumnElement:
+    return table.c.user_id == user_id
+
+
+def _in_owned_plan(table: Table, user_id: int) -> ColumnElement:
+    return table.c.workout_plan_id.in_(select(WorkoutPlan.id).where(WorkoutPlan.user_id == user_id))
+
+
+class SyncRepository(BaseRepository):
+    # Synced tables and the rows of each one a user can see
+    TABLES: dict[str, tuple[Table, Callable[[Table, int], ColumnElement]]] = {
+        "muscle_groups": (MuscleGroup.__table__, _catalog_visible),
+        "muscles": (Muscle.__table__, _catalog_visible),
+        "equipment": (Equipment.__table__, _catalog_visible),
+        "exercises": (Exercise.__table__, _catalog_visible),
+        "workout_plans": (WorkoutPlan.__table__, _owned),
+        "workout_splits": (WorkoutSplit.__table__, _in_owned_plan),
+        "split_exercises": (assoc_split_exercise, _in_owned_plan),
+    }
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+        self.db = db
+
+    async def get_watermark(self) -> int:
+        """
+        Get the oldest transaction ID still running. Every change with a lower version
+        is already committed or rolled back, so it can't show up after the sync reads it.
+        """
+
+        xmin = func.pg_snapshot_xmin(func.pg_current_snapshot())
+        result = await self.db.execute(select(cast(cast(xmin, Text), BigInteger)))
+        return result.scalar_one()
+
+    async def get_changes(self, name: str, user_id: int, since: int, until: int) -> list[Row]:
+        """
+        Get the rows of a synced table visible to the user with since <= change_version < until.
+        Soft deleted rows are included as they are the tombstones, except on a full sync (since 0)
+        where the client has nothing to delete.
+        """
+
+        table, visible = self.TABLES[name]
+        query = select(table).where(
+            visible(table, user_id),
+            table.c.change_version >= since,
+            table.c.change_version < until,
+        )
+        if since == 0:
+            # split_exercise.deleted is an integer column
+            query = query.where(cast(table.c.deleted, Boolean).is_not(True))
+
+        result = await self.db.execute(query.order_by(table.c.change_version))
+        return list(result.all())
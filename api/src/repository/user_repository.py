@@ -0,0 +1,16 @@
+from src.models import User
+from src.repository.base_repository import BaseRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+
+class UserRepository(BaseRepository):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+        self.db = db
+
+    async def get_user_by_email(self, email: str):
+        result = await self.db.execute(select(User).where(User.email == email, User.deleted == False))
+        return result.scalar_one_or_none()
+
+    async def update_password(self, user_id: int, password_hash: str):
+        await self.db.execute(update(User).where(User.id == user_id).values(password=password_hash))
@@ -0,0 +1,135 @@
+from datetime import date, timedelta
+
+from src.models import SplitSetReport, WeeklyVolume, WorkoutPlan, WorkoutReport
+from src.repository.base_repository import BaseRepository
+from src.repository.report_partition_repository import ReportPartitionRepository
+from src.utils.training import parse_reps, parse_reps_sql, week_start
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Date, and_, cast, delete, func, literal_column, select
+
+class WeeklyVolumeRepository(BaseRepository):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+        self.db = db
+
+    @staticmethod
+    def aggregate_sets(sets: list[dict]) -> list[dict]:
+        """
+        Fold set reports into one rollup row per user, exercise and week.
+        Args:
+            sets (list[dict]): Set reports with the user_id and report_date of their workout report.
+        Returns:
+            list[dict]: Rollup rows ready to be upserted.
+        """
+
+        rows = {}
+        for item in sets:
+            key = (item["user_id"], item["exercise_id"], week_start(item["report_date"]))
+            reps = parse_reps(item["reps"])
+            row = rows.setdefault(
+                key,
+                {
+                    "user_id": key[0],
+                    "exercise_id": key[1],
+                    "week_start": key[2],
+                    "total_sets": 0,
+                    "total_reps": 0,
+                    "tonnage": 0.0,
+                    "top_weight": 0.0,
+                },
+            )
+            row["total_sets"] += 1
+            row["total_reps"] += reps
+            row["tonnage"] += item["weight"] * reps
+            row["top_weight"] = max(row["top_weight"], item["weight"])
+
+        return list(rows.values())
+
+    async def add_sets(self, sets: list[dict]):
+        rows = self.aggregate_sets(sets)
+        if not rows:
+            return
+
+        query = pg_insert(WeeklyVolume).values(rows)
+        query = query.on_conflict_do_update(
+            index_elements=[WeeklyVolume.user_id, WeeklyVolume.exercise_id, WeeklyVolume.week_start],
+            set_={
+                "total_sets": WeeklyVolume.total_sets + query.excluded.total_sets,
+                "total_reps": WeeklyVolume.total_reps + query.excluded.total_reps,
+                "tonnage": WeeklyVolume.tonnage + query.excluded.tonnage,
+                "top_weight": func.greatest(WeeklyVolume.top_weight, query.excluded.top_weight),
+            },
+        )
+        await self.db.execute(query)
+
+    async def get_weekly_volume(self, user_id: int, since: date, exercise_id: int | None = None):
+        query = select(WeeklyVolume).where(WeeklyVolume.user_id == user_id, WeeklyVolume.week_start >= since)
+
+        if exercise_id is not None:
+            query = query.where(WeeklyVolume.exercise_id == exercise_id)
+
+        result = await self.db.execute(query.order_by(WeeklyVolume.week_start, WeeklyVolume.exercise_id))
+        return result.scalars().all()
+
+    async def rebuild(self, user_id: int | None = None, since: date | None = None) -> int:
+        """
+        Recompute the rollup from the set reports, for one user or everyone. Only the weeks that
+        start on or after the oldest attached report partition are rebuilt, the earlier ones may
+        hold detached months and are kept as they are.
+        Args:
+            user_id (int | None): Only rebuild this user's rollup, everyone's when None.
+            since (date | None): Only rebuild the weeks from the one of this day on, so only the
+                report partitions of those months are read.
+        Returns:
+            int: Number of rollup rows written.
+        """
+
+        reps = parse_reps_sql(SplitSetReport.reps)
+        # Literal unit so the expression in GROUP BY is the same one selected, a bind parameter would differ
+        week = cast(func.date_trunc(literal_column("'week'"), WorkoutReport.report_date), Date)
+
+        source = (
+            select(
+                WorkoutPlan.user_id,
+                SplitSetReport.exercise_id,
+                week,
+                func.count(),
+                func.sum(reps),
+                func.sum(SplitSetReport.weight * reps),
+                func.max(SplitSetReport.weight),
+            )
+            .join(
+                WorkoutReport,
+                and_(
+                    WorkoutReport.id == SplitSetReport.workout_report_id,
+                    WorkoutReport.report_date == SplitSetReport.report_date,
+                ),
+            )
+            .join(WorkoutPlan, WorkoutPlan.id == WorkoutReport.workout_plan_id)
+            .group_by(WorkoutPlan.user_id, SplitSetReport.exercise_id, week)
+        )
+        clear = delete(WeeklyVolume)
+
+        if user_id is not None:
+            source = source.where(WorkoutPlan.user_id == user_id)
+            clear = clear.where(WeeklyVolume.user_id == user_id)
+        oldest = await ReportPartitionRepository(self.db).get_oldest_partition()
+        if since is not None:
+            since = week_start(since)
+        if oldest is not None:
+            # The week of the first attached day may begin in the month before it
+            first_week = oldest if week_start(oldest) == oldest else week_start(oldest) + timedelta(weeks=1)
+            since = max(since, first_week) if since is not None else first_week
+        if since is not None:
+            source = source.where(WorkoutReport.report_date >= since, SplitSetReport.report_date >= since)
+            clear = clear.where(WeeklyVolume.week_start >= since)
+
+        await self.db.execute(clear)
+        result = await self.db.execute(
+            pg_insert(WeeklyVolume).from_select(
+                ["user_id", "exercise_id", "week_start", "total_sets", "total_reps", "tonnage", "top_weight"],
+                source,
+            )
+        )
+        return result.rowcount
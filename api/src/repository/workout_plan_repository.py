@@ -0,0 +1,121 @@
+from src.models import (
+    Equipment,
+    Exercise,
+    Muscle,
+    WorkoutPlan,
+    WorkoutSplit,
+    assoc_exercise_equipment,
+    assoc_exercise_muscle,
+    assoc_split_exercise,
+)
+from src.repository.base_repository import BaseRepository
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import BigInteger, cast, func, literal_column, select, union_all
+
+EMPTY_JSON_ARRAY = literal_column("'[]'::json")
+
+
+def json_array(value, order_by, select_from, *where):
+    """
+    Correlated subquery aggregating value into a JSON array ordered by order_by, [] when there are no rows.
+    """
+
+    aggregated = func.coalesce(func.json_agg(aggregate_order_by(value, *order_by)), EMPTY_JSON_ARRAY)
+    return select(aggregated).select_from(select_from).where(*where).scalar_subquery()
+
+
+class WorkoutPlanRepository(BaseRepository):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+        self.db = db
+
+    async def get_plan_tree(self, plan_id: int) -> dict | None:
+        """
+        Load a whole plan in a single query: its splits, their exercises in execution order, and the
+        muscles and equipment of each exercise. Postgres assembles the document with json_agg, so
+        no rows are sent for the ORM to stitch together.
+        Returns:
+            dict | None: The plan document with camelCase keys, None if the plan doesn't exist.
+        """
+
+        split_exercise = assoc_split_exercise.c
+
+        muscles = json_array(
+            func.json_build_object("id", Muscle.id, "muscleName", Muscle.muscle_name, "groupName", Muscle.group_name),
+            (Muscle.muscle_name,),
+            assoc_exercise_muscle.join(Muscle, Muscle.id == assoc_exercise_muscle.c.muscle_id),
+            assoc_exercise_muscle.c.exercise_id == split_exercise.exercise_id,
+            Muscle.deleted == False,
+        )
+        equipment = json_array(
+            func.json_build_object("id", Equipment.id, "equipmentName", Equipment.equipment_name),
+            (Equipment.equipment_name,),
+            assoc_exercise_equipment.join(Equipment, Equipment.id == assoc_exercise_equipment.c.equipment_id),
+            assoc_exercise_equipment.c.exercise_id == split_exercise.exercise_id,
+            Equipment.deleted == False,
+        )
+        exercises = json_array(
+            func.json_build_object(
+                "executionOrder", split_exercise.execution_order,
+                "exerciseId", Exercise.id,
+                "exerciseName", Exercise.exercise_name,
+                "sets", split_exercise.sets,
+                "reps", split_exercise.reps,
+                "restTime", split_exercise.rest_time,
+                "advancedTechnique", split_exercise.advanced_technique,
+                "muscles", muscles,
+                "equipment", equipment,
+            ),
+            (split_exercise.execution_order, Exercise.id),
+            assoc_split_exercise.join(Exercise, Exercise.id == split_exercise.exercise_id),
+            split_exercise.workout_plan_id == WorkoutSplit.workout_plan_id,
+            split_exercise.split == WorkoutSplit.split,
+            split_exercise.deleted == 0,
+        )
+        splits = json_array(
+            func.json_build_object("split", WorkoutSplit.split, "exercises", exercises),
+            (WorkoutSplit.split,),
+            WorkoutSplit,
+            WorkoutSplit.workout_plan_id == WorkoutPlan.id,
+            WorkoutSplit.deleted == False,
+        )
+        document = func.json_build_object(
+            "id", WorkoutPlan.id,
+            "userId", WorkoutPlan.user_id,
+            "workoutPlanName", WorkoutPlan.workout_plan_name,
+            "workoutPlanGoal", WorkoutPlan.workout_plan_goal,
+            "splits", splits,
+            type_=JSON,
+        )
+
+        result = await self.db.execute(
+            select(document).where(WorkoutPlan.id == plan_id, WorkoutPlan.deleted == False)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_plan_tree_version(self, plan_id: int) -> tuple[int, int]:
+        """
+        Fingerprint the rows a plan document is built from, including soft-deleted ones.
+        Every write sets the row's change_version to the writing transaction ID, so any insert,
+        update or delete of the plan, its splits, its split exercises or their exercises changes
+        the sum, and a hard delete changes the count as well. A plain max wouldn't do: a transaction
+        can commit after one with a higher ID.
+        Returns:
+            tuple[int, int]: Sum of the change versions and number of rows.
+        """
+
+        split_exercise = assoc_split_exercise.c
+        versions = union_all(
+            select(WorkoutPlan.change_version).where(WorkoutPlan.id == plan_id),
+            select(WorkoutSplit.change_version).where(WorkoutSplit.workout_plan_id == plan_id),
+            select(split_exercise.change_version).where(split_exercise.workout_plan_id == plan_id),
+            select(Exercise.change_version)
+            .join(assoc_split_exercise, split_exercise.exercise_id == Exercise.id)
+            .where(split_exercise.workout_plan_id == plan_id),
+        ).subquery()
+
+        result = await self.db.execute(
+            select(cast(func.coalesce(func.sum(versions.c.change_version), 0), BigInteger), func.count())
+        )
+        return tuple(result.one())
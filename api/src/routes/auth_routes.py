@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, Request, Response
+from src.connections import AsyncSessionInjector, RedisInjector
+from src.schemas.user_schemas import UserLogin, UserSession
+from src.security.authentication import TokenService
+from src.services.auth_service import AuthService
+router = APIRouter(prefix="/auth", tags=["Auth"])
+
+class _RequestDeps:
+    def __init__(self, session: AsyncSessionInjector, redis: RedisInjector, tokens: TokenService = Depends()):
+        self.session = session
+        self.service = AuthService(self.session, redis)
+        self.tokens = tokens
+
+@router.post("/login", response_model=UserSession)
+async def login(
+    credentials: UserLogin,
+    request: Request,
+    response: Response,
+    deps: _RequestDeps = Depends(),
+):
+    client_id = request.client.host if request.client else "unknown"
+    user_id = await deps.service.authenticate(credentials, client_id)
+
+    if credentials.keep_login:
+        refresh_token = await deps.tokens.generate_refresh_token(user_id)
+        await deps.tokens.set_refresh_token_cookie(response, refresh_token)
+
+    return UserSession(access_token=await deps.tokens.generate_session_token(user_id))
@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends
+from src.connections import pool_stats, read_pool_stats
+from src.security.authentication import TokenService
+from src.security.passwords import PASSWORD_SERVICE
+from src.utils.cache import LOCAL_CACHE, VersionedCache
+from src.utils.codec import FastJSONResponse
+
+# These routes return plain dicts with no response model, so the response class does the encoding.
+# They expose the internals of the process, so they need a session token and are only mounted
+# when SETTINGS.METRICS_ENABLED.
+router = APIRouter(
+    prefix="/metrics",
+    tags=["Metrics"],
+    default_response_class=FastJSONResponse,
+    dependencies=[Depends(TokenService.validate_token)],
+)
+
+@router.get("/pool")
+async def get_pool_stats():
+    return pool_stats()
+
+@router.get("/read-pool")
+async def get_read_pool_stats():
+    return read_pool_stats()
+
+@router.get("/token-cache")
+async def get_token_cache_stats():
+    return TokenService.claim_cache.stats()
+
+@router.get("/password-hasher")
+async def get_password_hasher_stats():
+    return PASSWORD_SERVICE.stats()
+
+@router.get("/cache")
+async def get_cache_stats():
+    return VersionedCache.stats()
+
+@router.get("/local-cache")
+async def get_local_cache_stats():
+    return LOCAL_CACHE.stats() if LOCAL_CACHE is not None else None
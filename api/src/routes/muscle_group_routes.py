@@ -1,33 +1,85 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from src.config import SETTINGS
 from src.connections import AsyncSessionInjector, RedisInjector
 from src.repository.muscle_group_repository import MuscleGroupRepository
 from src.services.muscle_group_service import MuscleGroupService
 from src.schemas.muscle_group_schemas import (
+    BulkCreatePayload,
+    BulkDeletePayload,
+    BulkUpdatePayload,
+    MuscleGroupBulkResultSchema,
     MuscleGroupCreateSchema,
     MuscleGroupUpdateSchema,
     MuscleGroupResponseSchema,
 )
+from src.schemas.schemas_utils import CursorPageSchema
+from src.security.security import RateLimiter
+from src.utils.codec import EncodedJSONResponse
+from src.utils.etag import etag_headers, etag_matches, not_modified
+from src.utils.pagination import Pagination
 router = APIRouter(prefix="/groups", tags=["Muscle Groups"])
 
+bulk_request_limit = RateLimiter(max_requests=SETTINGS.BULK_MAX_REQUESTS, scope="groups:bulk")
+MuscleGroupPagination = Pagination.over(MuscleGroupRepository.ORDER_COLUMNS)
+
 class _RequestDeps:
     def __init__(self, session: AsyncSessionInjector, redis: RedisInjector):
         self.session = session
         self.redis = redis
-        self.service = MuscleGroupService(self.session)
+        self.service = MuscleGroupService(self.session, self.redis)
 
-@router.get("/", response_model=list[MuscleGroupResponseSchema])
+@router.get("/", response_model=CursorPageSchema[MuscleGroupResponseSchema])
 async def get_all_muscle_groups(
+    pagination: Pagination = Depends(MuscleGroupPagination),
+    if_none_match: str | None = Header(default=None),
     deps: _RequestDeps = Depends(),
 ):
-    return await deps.service.get_all_muscle_groups()
+    version, etag = await deps.service.get_muscle_groups_etag(pagination.after, pagination.page_size)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    try:
+        body = await deps.service.get_all_muscle_groups(pagination.after, pagination.page_size, version)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    return EncodedJSONResponse(body, headers=etag_headers(etag))
+
+@router.post("/bulk", response_model=list[MuscleGroupBulkResultSchema], dependencies=[Depends(bulk_request_limit)])
+async def bulk_create_muscle_groups(
+    muscle_groups: BulkCreatePayload,
+    deps: _RequestDeps = Depends(),
+):
+    return await deps.service.bulk_create_muscle_groups(muscle_groups)
+
+@router.put("/bulk", response_model=list[MuscleGroupBulkResultSchema], dependencies=[Depends(bulk_request_limit)])
+async def bulk_update_muscle_groups(
+    muscle_groups: BulkUpdatePayload,
+    deps: _RequestDeps = Depends(),
+):
+    return await deps.service.bulk_update_muscle_groups(muscle_groups)
+
+@router.delete("/bulk", response_model=list[MuscleGroupBulkResultSchema], dependencies=[Depends(bulk_request_limit)])
+async def bulk_delete_muscle_groups(
+    muscle_groups: BulkDeletePayload,
+    deps: _RequestDeps = Depends(),
+):
+    return await deps.service.bulk_delete_muscle_groups(muscle_groups)
 
 @router.get("/{group_name}", response_model=MuscleGroupResponseSchema)
 async def get_muscle_group_by_name(
     group_name: str,
     user_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
     deps: _RequestDeps = Depends(),
 ):
-    return await deps.service.get_muscle_group_by_name(group_name, user_id)
+    version, etag = await deps.service.get_muscle_group_etag(group_name, user_id)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    response.headers.update(etag_headers(etag))
+    return await deps.service.get_muscle_group_by_name(group_name, user_id, version)
 
 @router.post("/", response_model=MuscleGroupResponseSchema, status_code=status.HTTP_201_CREATED)
 async def create_muscle_group(
@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from src.config import SETTINGS
+from src.connections import AsyncSessionInjector, ReadSessionInjector
+from src.schemas.personal_record_schemas import PersonalRecordResponseSchema
+from src.schemas.weekly_volume_schemas import WeeklyVolumeResponseSchema
+from src.schemas.workout_report_split_schemas import SetReportsPayload, WorkoutSessionReport, WorkoutSessionResult
+from src.services.report_service import ReportService
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+class _RequestDeps:
+    def __init__(self, session: AsyncSessionInjector):
+        self.session = session
+        self.service = ReportService(self.session)
+
+class _ReadRequestDeps(_RequestDeps):
+    def __init__(self, session: ReadSessionInjector):
+        super().__init__(session)
+
+@router.post("/sets", status_code=status.HTTP_201_CREATED)
+async def create_set_reports(
+    set_reports: SetReportsPayload,
+    deps: _RequestDeps = Depends(),
+):
+    await deps.service.create_set_reports(set_reports)
+
+@router.post("/sessions", response_model=WorkoutSessionResult, status_code=status.HTTP_201_CREATED)
+async def ingest_workout_session(
+    session: WorkoutSessionReport,
+    response: Response,
+    idempotency_key: str = Header(min_length=1, max_length=255),
+    deps: _RequestDeps = Depends(),
+):
+    result, replayed = await deps.service.ingest_workout_session(idempotency_key, session)
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return result
+
+@router.get("/volume", response_model=list[WeeklyVolumeResponseSchema])
+async def get_weekly_volume(
+    user_id: int,
+    exercise_id: int | None = None,
+    weeks: int = Query(SETTINGS.VOLUME_DEFAULT_WEEKS, ge=1, le=SETTINGS.VOLUME_MAX_WEEKS),
+    deps: _ReadRequestDeps = Depends(),
+):
+    return await deps.service.get_weekly_volume(user_id, exercise_id, weeks)
+
+@router.get("/records", response_model=list[PersonalRecordResponseSchema])
+async def get_personal_records(
+    user_id: int,
+    deps: _ReadRequestDeps = Depends(),
+):
+    return await deps.service.get_personal_records(user_id)
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, Query
+from src.config import SETTINGS
+from src.connections import AsyncSessionInjector, RedisInjector
+from src.schemas.search_schemas import SearchResultSchema
+from src.services.search_service import SearchService
+from src.utils.codec import EncodedJSONResponse
+router = APIRouter(prefix="/search", tags=["Search"])
+
+class _RequestDeps:
+    def __init__(self, session: AsyncSessionInjector, redis: RedisInjector):
+        self.session = session
+        self.redis = redis
+        self.service = SearchService(self.session, self.redis)
+
+@router.get("/", response_model=list[SearchResultSchema])
+async def search_catalog(
+    user_id: int,
+    q: str = Query(min_length=1, max_length=SETTINGS.SEARCH_MAX_TERM_LENGTH),
+    limit: int = Query(SETTINGS.SEARCH_DEFAULT_LIMIT, ge=1, le=SETTINGS.SEARCH_MAX_LIMIT),
+    deps: _RequestDeps = Depends(),
+):
+    return EncodedJSONResponse(await deps.service.search_catalog(q, user_id, limit))
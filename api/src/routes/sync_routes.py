@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from src.connections import ReadSessionInjector
+from src.schemas.sync_schemas import SyncResponseSchema
+from src.services.sync_service import SyncService
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+class _RequestDeps:
+    def __init__(self, session: ReadSessionInjector):
+        self.session = session
+        self.service = SyncService(self.session)
+
+@router.get("/", response_model=SyncResponseSchema)
+async def sync(
+    user_id: int,
+    cursor: str | None = None,
+    deps: _RequestDeps = Depends(),
+):
+    try:
+        return await deps.service.sync(user_id, cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from src.connections import ReadSessionInjector, RedisInjector
+from src.schemas.workout_plan_schemas import WorkoutPlanTreeSchema
+from src.services.workout_plan_service import WorkoutPlanService
+from src.utils.codec import EncodedJSONResponse
+router = APIRouter(prefix="/plans", tags=["Workout Plans"])
+
+class _RequestDeps:
+    def __init__(self, session: ReadSessionInjector, redis: RedisInjector):
+        self.session = session
+        self.redis = redis
+        self.service = WorkoutPlanService(self.session, self.redis)
+
+@router.get("/{plan_id}", response_model=WorkoutPlanTreeSchema)
+async def get_workout_plan(
+    plan_id: int,
+    deps: _RequestDeps = Depends(),
+):
+    body = await deps.service.get_plan_tree(plan_id)
+    if body is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plano de treino não encontrado")
+
+    return EncodedJSONResponse(body)
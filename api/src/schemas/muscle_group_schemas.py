@@ -1,3 +1,8 @@
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from src.config import SETTINGS
 from .schemas_utils import ORMCamelCaseSchema
 
 class MuscleGroupCreateSchema(ORMCamelCaseSchema):
@@ -11,3 +16,22 @@ class MuscleGroupResponseSchema(ORMCamelCaseSchema):
     group_name: str
     user_id: int | None = None
     deleted: bool
+
+class MuscleGroupKeySchema(ORMCamelCaseSchema):
+    group_name: str
+    user_id: int
+
+class MuscleGroupBulkUpdateSchema(ORMCamelCaseSchema):
+    group_name: str
+    current_user_id: int  # owner in database
+    user_id: int  # new owner
+
+class MuscleGroupBulkResultSchema(ORMCamelCaseSchema):
+    group_name: str
+    user_id: int | None = None
+    status: Literal["created", "updated", "deleted", "conflict", "not_found"]
+    item: MuscleGroupResponseSchema | None = None
+
+BulkCreatePayload = Annotated[list[MuscleGroupCreateSchema], Field(min_length=1, max_length=SETTINGS.MAX_BULK_ITEMS)]
+BulkUpdatePayload = Annotated[list[MuscleGroupBulkUpdateSchema], Field(min_length=1, max_length=SETTINGS.MAX_BULK_ITEMS)]
+BulkDeletePayload = Annotated[list[MuscleGroupKeySchema], Field(min_length=1, max_length=SETTINGS.MAX_BULK_ITEMS)]
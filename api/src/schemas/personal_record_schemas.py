@@ -0,0 +1,15 @@
+from .schemas_utils import ORMCamelCaseSchema
+
+class PersonalRecordResponseSchema(ORMCamelCaseSchema):
+    exercise_id: int
+    max_weight: float
+    max_weight_reps: int
+    max_weight_report_id: int
+    best_one_rep_max: float
+    best_one_rep_max_weight: float
+    best_one_rep_max_reps: int
+    best_one_rep_max_report_id: int
+    best_set_volume: float
+    best_set_volume_weight: float
+    best_set_volume_reps: int
+    best_set_volume_report_id: int
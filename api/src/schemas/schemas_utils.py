@@ -1,3 +1,5 @@
+from typing import Generic, TypeVar
+
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
@@ -5,4 +7,10 @@ class CamelCaseSchema(BaseModel):
     model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
 
 class ORMCamelCaseSchema(CamelCaseSchema):
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+T = TypeVar("T")
+
+class CursorPageSchema(CamelCaseSchema, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
@@ -0,0 +1,9 @@
+from typing import Literal
+
+from .schemas_utils import ORMCamelCaseSchema
+
+class SearchResultSchema(ORMCamelCaseSchema):
+    kind: Literal["exercise", "equipment", "muscle"]
+    id: int
+    name: str
+    score: float
@@ -0,0 +1,61 @@
+from typing import Any, Generic, TypeVar
+
+from .schemas_utils import CamelCaseSchema, ORMCamelCaseSchema
+
+class SyncMuscleGroupSchema(ORMCamelCaseSchema):
+    user_id: int | None = None
+    group_name: str
+
+class SyncMuscleSchema(ORMCamelCaseSchema):
+    id: int
+    user_id: int | None = None
+    group_name: str
+    muscle_name: str
+
+class SyncEquipmentSchema(ORMCamelCaseSchema):
+    id: int
+    user_id: int | None = None
+    group_name: str
+    equipment_name: str
+
+class SyncExerciseSchema(ORMCamelCaseSchema):
+    id: int
+    user_id: int | None = None
+    exercise_name: str
+    description: str | None = None
+
+class SyncWorkoutPlanSchema(ORMCamelCaseSchema):
+    id: int
+    user_id: int
+    workout_plan_name: str
+    workout_plan_goal: str
+
+class SyncWorkoutSplitSchema(ORMCamelCaseSchema):
+    workout_plan_id: int
+    split: str
+
+class SyncSplitExerciseSchema(ORMCamelCaseSchema):
+    workout_plan_id: int
+    split: str
+    exercise_id: int
+    execution_order: int
+    sets: int | None = None
+    reps: str | None = None
+    rest_time: int | None = None
+    advanced_technique: str | None = None
+
+T = TypeVar("T")
+
+class SyncChangesSchema(CamelCaseSchema, Generic[T]):
+    upserted: list[T] = []
+    deleted: list[dict[str, Any]] = []  # primary keys of the soft deleted rows
+
+class SyncResponseSchema(CamelCaseSchema):
+    cursor: str
+    muscle_groups: SyncChangesSchema[SyncMuscleGroupSchema]
+    muscles: SyncChangesSchema[SyncMuscleSchema]
+    equipment: SyncChangesSchema[SyncEquipmentSchema]
+    exercises: SyncChangesSchema[SyncExerciseSchema]
+    workout_plans: SyncChangesSchema[SyncWorkoutPlanSchema]
+    workout_splits: SyncChangesSchema[SyncWorkoutSplitSchema]
+    split_exercises: SyncChangesSchema[SyncSplitExerciseSchema]
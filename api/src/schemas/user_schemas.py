@@ -15,4 +15,8 @@ class UserPwdChange(UserBase):
 
 
 class UserLogin(UserBase):
-    keep_login: bool
\ No newline at end of file
+    keep_login: bool
+
+class UserSession(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
@@ -0,0 +1,11 @@
+from datetime import date
+
+from .schemas_utils import ORMCamelCaseSchema
+
+class WeeklyVolumeResponseSchema(ORMCamelCaseSchema):
+    exercise_id: int
+    week_start: date
+    total_sets: int
+    total_reps: int
+    tonnage: float
+    top_weight: float
@@ -1,5 +1,7 @@
 from pydantic import BaseModel
 
+from .schemas_utils import CamelCaseSchema
+
 class WorkoutPlan(BaseModel):
     workout_plan_name: str
     workout_plan_goal: str
@@ -7,4 +9,44 @@ class WorkoutPlan(BaseModel):
 
 class WorkoutPlanUpdate(BaseModel):
     workout_plan_name: str | None = None
-    workout_plan_goal: str | None = None
\ No newline at end of file
+    workout_plan_goal: str | None = None
+
+
+class PlanMuscleSchema(CamelCaseSchema):
+    id: int
+    muscle_name: str
+    group_name: str
+
+
+class PlanEquipmentSchema(CamelCaseSchema):
+    id: int
+    equipment_name: str
+
+
+class PlanExerciseSchema(CamelCaseSchema):
+    execution_order: int
+    exercise_id: int
+    exercise_name: str
+    sets: int | None = None
+    reps: str | None = None
+    rest_time: int | None = None
+    advanced_technique: str | None = None
+    muscles: list[PlanMuscleSchema]
+    equipment: list[PlanEquipmentSchema]
+
+
+class PlanSplitSchema(CamelCaseSchema):
+    split: str
+    exercises: list[PlanExerciseSchema]
+
+
+class WorkoutPlanTreeSchema(CamelCaseSchema):
+    """
+    A whole plan as rendered by the app: splits, their exercises in execution order and what each exercise works.
+    """
+
+    id: int
+    user_id: int
+    workout_plan_name: str
+    workout_plan_goal: str
+    splits: list[PlanSplitSchema]
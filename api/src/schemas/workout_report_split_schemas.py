@@ -1,8 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 from datetime import date, datetime, timezone
+from typing import Annotated
+
+from src.config import SETTINGS
 
 class WorkoutReport(BaseModel):
-    report_date: date = datetime.now(timezone.utc).date()
+    report_date: date = Field(default_factory=lambda: datetime.now(timezone.utc).date())
     split: str
     workout_plan_id: int
 
@@ -20,5 +23,39 @@ class SetReport(BaseModel):
     set_number: int
     workout_report_id: int
     reps: str
-    weight: int
-    notes: str
\ No newline at end of file
+    weight: float
+    notes: str
+
+
+SetReportsPayload = Annotated[list[SetReport], Field(min_length=1, max_length=SETTINGS.SESSION_MAX_SETS)]
+
+
+class SessionSetReport(BaseModel):
+    exercise_id: int
+    execution_order: int
+    set_number: int
+    reps: str
+    weight: float
+    notes: str | None = None
+
+
+class WorkoutSessionReport(WorkoutReport):
+    """
+    A whole workout session: the workout report and every set done in it.
+    """
+
+    sets: list[SessionSetReport] = Field(min_length=1, max_length=SETTINGS.SESSION_MAX_SETS)
+
+    @field_validator("sets")
+    @classmethod
+    def unique_sets(cls, sets: list[SessionSetReport]):
+        keys = {(item.exercise_id, item.set_number) for item in sets}
+        if len(keys) != len(sets):
+            raise ValueError("Each exercise set_number must appear only once")
+        return sets
+
+
+class WorkoutSessionResult(BaseModel):
+    workout_report_id: int
+    report_date: date
+    sets: int
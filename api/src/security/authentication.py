@@ -1,14 +1,91 @@
-from datetime import datetime
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from hashlib import blake2b
 
 import jwt
 from fastapi import Depends, Request, Response
-from fastsecurity import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from src.config import SETTINGS
 
 
+class TokenClaimCache:
+    """
+    Bounded LRU of session tokens that already passed signature verification.
+    Entries are keyed on a digest of the token, so raw tokens are never kept in memory,
+    and hold only the decoded user ID and expiration. An entry is dropped as soon as its
+    token expires, and only successfully verified tokens are ever stored.
+    """
+
+    def __init__(self, max_size: int = SETTINGS.JWT_CLAIM_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[int, float]] = OrderedDict()
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> int | None:
+        """
+        Get the user ID of a cached, still valid token.
+        Args:
+            token (str): Encoded JWT session token.
+        Returns:
+            int | None: The user ID, None if the token is not cached or has expired.
+        """
+
+        key = self._digest(token)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        user_id, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return user_id
+
+    def put(self, token: str, user_id: int, expires_at: float):
+        """
+        Store the claims of a verified token, evicting the least recently used entry when full.
+        Args:
+            token (str): Encoded JWT session token.
+            user_id (int): Decoded "sub" claim.
+            expires_at (float): Decoded "exp" claim as a UNIX timestamp.
+        """
+
+        key = self._digest(token)
+        self._entries[key] = (user_id, expires_at)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        """
+        Get the cache size and hit/miss counters.
+        """
+
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
 class TokenService:
     security = HTTPBearer()
+    claim_cache = TokenClaimCache()
 
     def __init__(self, request: Request, response: Response):
         self.request = request
@@ -64,7 +141,7 @@ class TokenService:
             key="refresh_token",
             value=token,
             max_age=SETTINGS.JWT_REFRESH_COOKIE_MAX_AGE,  # 7 dias em segundos
-            expires=datetime.now() + self.refresh_expires,
+            expires=datetime.now(timezone.utc) + self.refresh_expires,
             httponly=True,
             samesite="none",
             secure=True,
@@ -149,6 +226,10 @@ class TokenService:
         if not token:
             raise MissingToken("Session token não encontrado")
 
+        user_id = TokenService.claim_cache.get(token)
+        if user_id is not None:
+            return user_id
+
         try:
             decoded = jwt.decode(
                 token,
@@ -165,4 +246,7 @@ class TokenService:
         except jwt.DecodeError:
             raise Exception("Erro ao decodificar o token")
         else:
-            return int(decoded["sub"])
+            user_id = int(decoded["sub"])
+            if "exp" in decoded:
+                TokenService.claim_cache.put(token, user_id, decoded["exp"])
+            return user_id
@@ -0,0 +1,136 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+from src.config import SETTINGS
+from src.exceptions import PasswordHashingBusy
+
+
+class PasswordService:
+    """
+    Argon2 hashing and verification off the event loop.
+    Each hash takes tens of milliseconds of CPU and MEMORY_COST of memory, so they run on a
+    bounded thread pool (argon2 releases the GIL while hashing) and the number of hashes
+    waiting for a thread is capped: past the limit new ones are refused straight away
+    instead of piling up memory and latency during a login burst.
+    """
+
+    def __init__(
+        self,
+        time_cost: int = SETTINGS.PASSWORD_HASH_TIME_COST,
+        memory_cost: int = SETTINGS.PASSWORD_HASH_MEMORY_COST,
+        parallelism: int = SETTINGS.PASSWORD_HASH_PARALLELISM,
+        workers: int = SETTINGS.PASSWORD_HASH_WORKERS,
+        queue_limit: int = SETTINGS.PASSWORD_HASH_QUEUE_LIMIT,
+    ):
+        """
+        Args:
+            time_cost (int): Argon2 passes over memory.
+            memory_cost (int): Argon2 memory in KiB.
+            parallelism (int): Argon2 lanes.
+            workers (int): Threads hashing at the same time.
+            queue_limit (int): Hashes allowed to wait for a thread.
+        Raises:
+            ValueError: If PASSWORD_HASH_ALGORITHM isn't argon2.
+        """
+
+        if SETTINGS.PASSWORD_HASH_ALGORITHM != "argon2":
+            raise ValueError(f"Unsupported password hash algorithm {SETTINGS.PASSWORD_HASH_ALGORITHM}")
+
+        self.hasher = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hasher")
+        self.in_flight = 0
+        self.hashes = 0
+        self.verifications = 0
+        self.rehashes = 0
+        self.rejected = 0
+        self._dummy_hash: str | None = None
+
+    async def _run(self, func, *args):
+        if self.in_flight >= self.workers + self.queue_limit:
+            self.rejected += 1
+            raise PasswordHashingBusy()
+
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            self.in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password with the configured cost parameters.
+        Raises:
+            PasswordHashingBusy: If too many hashes are already waiting.
+        """
+
+        self.hashes += 1
+        return await self._run(self.hasher.hash, password)
+
+    def _verify(self, password_hash: str, password: str) -> tuple[bool, str | None]:
+        try:
+            self.hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False, None
+
+        if self.hasher.check_needs_rehash(password_hash):
+            return True, self.hasher.hash(password)
+
+        return True, None
+
+    async def verify(self, password_hash: str, password: str) -> tuple[bool, str | None]:
+        """
+        Check a password against its stored hash.
+        When the hash was made with other cost parameters, the password is rehashed in the same worker call.
+        Args:
+            password_hash (str): Hash stored for the user.
+            password (str): Password sent by the user.
+        Returns:
+            tuple[bool, str | None]: Whether the password matches, and the hash to store in place of
+            the old one when it has to be upgraded.
+        Raises:
+            PasswordHashingBusy: If too many hashes are already waiting.
+        """
+
+        self.verifications += 1
+        valid, new_hash = await self._run(self._verify, password_hash, password)
+        if new_hash is not None:
+            self.rehashes += 1
+
+        return valid, new_hash
+
+    def _verify_dummy(self, password: str) -> tuple[bool, str | None]:
+        if self._dummy_hash is None:
+            self._dummy_hash = self.hasher.hash("dummy password")
+        return self._verify(self._dummy_hash, password)
+
+    async def verify_dummy(self, password: str):
+        """
+        Spend the same time as a verification, for unknown e-mails, so response times don't reveal
+        which e-mails are registered.
+        """
+
+        self.verifications += 1
+        await self._run(self._verify_dummy, password)
+
+    def stats(self) -> dict:
+        """
+        Get the pool size, queue usage and operation counters.
+        """
+
+        return {
+            "workers": self.workers,
+            "queue_limit": self.queue_limit,
+            "in_flight": self.in_flight,
+            "hashes": self.hashes,
+            "verifications": self.verifications,
+            "rehashes": self.rehashes,
+            "rejected": self.rejected,
+        }
+
+
+PASSWORD_SERVICE = PasswordService()
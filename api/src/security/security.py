@@ -1,26 +1,246 @@
+from datetime import timedelta
+from math import ceil
+from typing import NamedTuple
+from uuid import uuid4
+
 from fastapi import Request
+from redis.asyncio import Redis
+
+from src.config import SETTINGS
+from src.connections import RedisInjector
+from src.exceptions import LoginLocked, RequestLimitExceeded
+from src.middlewares.rate_limit_headers import RATE_LIMIT_HEADERS_STATE
+
+# Sliding window log: every accepted request is a member of a sorted set scored by its
+# timestamp. Trimming, counting, recording and expiring happen atomically on the server,
+# so concurrent requests can't race past the limit and there are no bursts at window edges.
+_SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+local allowed = 0
+
+if count < limit then
+    redis.call('ZADD', KEYS[1], now, ARGV[3])
+    count = count + 1
+    allowed = 1
+end
+
+redis.call('PEXPIRE', KEYS[1], window)
+
+local reset = window
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window - now
+end
+
+return {allowed, limit - count, reset}
+"""
+
+# Reserves a login attempt on the account and the address, unless either is locked. Checking and
+# counting in one step keeps concurrent guesses from all passing the check before any is counted.
+# Every attempt pushes the expiration back, so a lock lasts the whole lockout time after the last one.
+# Returns how many milliseconds the account or the address is still locked for (0 if neither is)
+# and the attempts of the account inside the lockout time.
+_LOGIN_RESERVE_SCRIPT = """
+local account = tonumber(redis.call('GET', KEYS[1]) or '0')
+if account >= tonumber(ARGV[1]) then
+    return {redis.call('PTTL', KEYS[1]), account}
+end
+
+local address = tonumber(redis.call('GET', KEYS[2]) or '0')
+if address >= tonumber(ARGV[2]) then
+    return {redis.call('PTTL', KEYS[2]), account}
+end
+
+account = redis.call('INCR', KEYS[1])
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+redis.call('INCR', KEYS[2])
+redis.call('PEXPIRE', KEYS[2], ARGV[3])
+return {0, account}
+"""
+
+# Gives back a reserved attempt that didn't fail. ARGV[1] = '1' also clears the account failures.
+_LOGIN_RELEASE_SCRIPT = """
+if ARGV[1] == '1' then
+    redis.call('DEL', KEYS[1])
+end
+
+for _, key in ipairs(KEYS) do
+    if tonumber(redis.call('GET', key) or '0') > 0 then
+        redis.call('DECR', key)
+    end
+end
+"""
+
+
+class RateLimitStatus(NamedTuple):
+    allowed: bool
+    remaining: int
+    reset_ms: int
+
+
+class RateLimiter:
+    """
+    Sliding window rate limiter, usable as a FastAPI dependency on the app, a router or a route.
+    Each request costs a single Redis round trip.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = SETTINGS.MAX_REQUESTS,
+        time_window: timedelta = SETTINGS.REQUEST_TIME_WINDOW,
+        scope: str = "global",
+    ):
+        """
+        Args:
+            max_requests (int): Requests allowed per client inside the window.
+            time_window (timedelta): Length of the sliding window.
+            scope (str): Name of the limit, clients are counted separately on each scope.
+        """
+
+        self.max_requests = max_requests
+        self.window_ms = int(time_window.total_seconds() * 1000)
+        self.scope = scope
+        self._script = None
+
+    async def check(self, redis: Redis, client_id: str) -> RateLimitStatus:
+        """
+        Record a request from the client and tell whether it is inside the limit.
+        Args:
+            redis (Redis): Redis connection.
+            client_id (str): Identifier of the client, usually its IP address.
+        Returns:
+            RateLimitStatus: Whether the request is allowed, how many remain and when a slot frees up.
+        """
+
+        if self._script is None:
+            self._script = redis.register_script(_SLIDING_WINDOW_SCRIPT)
+
+        allowed, remaining, reset_ms = await self._script(
+            keys=[f"rate_limit:{self.scope}:{client_id}"],
+            args=[self.max_requests, self.window_ms, uuid4().hex],
+            client=redis,
+        )
+
+        return RateLimitStatus(bool(allowed), int(remaining), int(reset_ms))
+
+    def headers(self, limit_status: RateLimitStatus) -> dict[str, str]:
+        """
+        Build the RateLimit-* response headers for a checked request.
+        """
+
+        return {
+            "RateLimit-Limit": str(self.max_requests),
+            "RateLimit-Remaining": str(max(limit_status.remaining, 0)),
+            "RateLimit-Reset": str(ceil(limit_status.reset_ms / 1000)),
+            "RateLimit-Policy": f"{self.max_requests};w={self.window_ms // 1000}",
+        }
+
+    async def __call__(self, request: Request, redis: RedisInjector):
+        client_id = request.client.host if request.client else "unknown"
+        limit_status = await self.check(redis, client_id)
+        headers = self.headers(limit_status)
+
+        if not limit_status.allowed:
+            headers["Retry-After"] = headers["RateLimit-Reset"]
+            raise RequestLimitExceeded(headers=headers)
+
+        # Added by RateLimitHeadersMiddleware, whatever kind of response the route returns
+        setattr(request.state, RATE_LIMIT_HEADERS_STATE, headers)
+
+
+verify_request_limit = RateLimiter()
+
+
+class LoginLockout:
+    """
+    Failed login counters per account and per client address, kept in Redis.
+    An account or address over its limit is rejected before the user is looked up or any
+    password is hashed, so each attempt of a brute-force attack costs a single Redis round trip.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = SETTINGS.MAX_LOGIN_ATTEMPTS,
+        max_attempts_per_address: int = SETTINGS.MAX_LOGIN_ATTEMPTS_PER_IP,
+        lockout_time: timedelta = SETTINGS.LOCKOUT_TIME,
+    ):
+        """
+        Args:
+            max_attempts (int): Failures allowed on an account before it is locked.
+            max_attempts_per_address (int): Failures allowed from an address, whatever the accounts.
+            lockout_time (timedelta): How long the counters live after the last attempt.
+        """
+
+        self.max_attempts = max_attempts
+        self.max_attempts_per_address = max_attempts_per_address
+        self.lockout_ms = int(lockout_time.total_seconds() * 1000)
+        self._reserve_script = None
+        self._release_script = None
+
+    @staticmethod
+    def _account_key(email: str) -> str:
+        return f"login_failures:account:{email.lower()}"
+
+    def _keys(self, email: str, client_id: str) -> list[str]:
+        return [self._account_key(email), f"login_failures:address:{client_id}"]
+
+    async def reserve(self, redis: Redis, email: str, client_id: str) -> int:
+        """
+        Reject the attempt if the account or the address is locked, otherwise count it. A reserved
+        attempt stays counted as a failure unless it is given back with `release` or `reset`.
+        Args:
+            redis (Redis): Redis connection.
+            email (str): E-mail the client is trying to log in with.
+            client_id (str): Identifier of the client, usually its IP address.
+        Returns:
+            int: Attempts of the account inside the lockout time, this one included.
+        Raises:
+            LoginLocked: If the account or the address has too many recent failures.
+        """
+
+        if self._reserve_script is None:
+            self._reserve_script = redis.register_script(_LOGIN_RESERVE_SCRIPT)
+
+        locked_ms, attempts = await self._reserve_script(
+            keys=self._keys(email, client_id),
+            args=[self.max_attempts, self.max_attempts_per_address, self.lockout_ms],
+            client=redis,
+        )
+
+        if locked_ms:
+            raise LoginLocked(retry_after=ceil(max(int(locked_ms), 0) / 1000) or 1)
+
+        return int(attempts)
 
-from ..config import Config
-from ..connections import redis_connection
-from ..exceptions import RequestLimitExceeded
+    async def release(self, redis: Redis, email: str, client_id: str):
+        """
+        Give back a reserved attempt that couldn't be checked, e.g. because password hashing was busy.
+        """
 
+        await self._release(redis, email, client_id, clear_account=False)
 
-async def is_rate_limited(request: Request) -> bool:
-    async with redis_connection() as redis:
-        client_ip = request.client.host
-        key = f"rate_limit:{client_ip}"
-        current = await redis.get(key)
+    async def reset(self, redis: Redis, email: str, client_id: str):
+        """
+        Clear the failures of an account after a successful login and give back the reserved attempt
+        of the address. Its earlier failures are kept, otherwise logging into an account of their own
+        would let an attacker keep guessing others.
+        """
 
-        if not current:
-            await redis.setex(key, Config.REQUEST_TIME_WINDOW, 1)
-            return False
+        await self._release(redis, email, client_id, clear_account=True)
 
-        if int(current) >= Config.MAX_REQUESTS:
-            raise RequestLimitExceeded()
+    async def _release(self, redis: Redis, email: str, client_id: str, clear_account: bool):
+        if self._release_script is None:
+            self._release_script = redis.register_script(_LOGIN_RELEASE_SCRIPT)
 
-        await redis.incr(key)
-        return False
+        await self._release_script(
+            keys=self._keys(email, client_id), args=["1" if clear_account else "0"], client=redis
+        )
 
 
-async def verify_request_limit(request: Request):
-    await is_rate_limited(request)
+login_lockout = LoginLockout()
@@ -0,0 +1,72 @@
+from redis.asyncio import Redis
+
+from src.exceptions import InvalidCredentials
+from src.repository.user_repository import UserRepository
+from src.schemas.user_schemas import UserLogin
+from src.security.passwords import PASSWORD_SERVICE, PasswordService
+from src.security.security import LoginLockout, login_lockout
+from sqlalchemy.ext.asyncio import AsyncSession
+
+class AuthService:
+    def __init__(
+        self,
+        session: AsyncSession,
+        redis: Redis,
+        passwords: PasswordService = PASSWORD_SERVICE,
+        lockout: LoginLockout = login_lockout,
+    ):
+        self.session = session
+        self.redis = redis
+        self.repo = UserRepository(session)
+        self.passwords = passwords
+        self.lockout = lockout
+
+    async def authenticate(self, data: UserLogin, client_id: str) -> int:
+        """
+        Check the credentials of a user, upgrading the stored hash when the argon2 parameters changed.
+        Locked accounts and addresses are rejected before the database is queried, the attempt is
+        counted before the password is checked so concurrent guesses can't get past the limit.
+        Args:
+            data (UserLogin): Credentials sent by the client.
+            client_id (str): Identifier of the client, usually its IP address.
+        Returns:
+            int: ID of the authenticated user.
+        Raises:
+            LoginLocked: If the account or the address has too many recent failures.
+            InvalidCredentials: If the e-mail isn't registered or the password doesn't match.
+            PasswordHashingBusy: If the password hashing queue is full.
+        """
+
+        await self.lockout.reserve(self.redis, data.email, client_id)
+
+        try:
+            user_id = await self._verify_credentials(data)
+        except InvalidCredentials:
+            # The reserved attempt stays counted as the failure
+            raise
+        except Exception:
+            await self.lockout.release(self.redis, data.email, client_id)
+            raise
+
+        await self.lockout.reset(self.redis, data.email, client_id)
+        return user_id
+
+    async def _verify_credentials(self, data: UserLogin) -> int:
+        user = await self.repo.get_user_by_email(data.email)
+        if user is None:
+            await self.passwords.verify_dummy(data.password)
+            raise InvalidCredentials()
+
+        user_id, password_hash = user.id, user.password
+        # Release the connection while the password is verified, it can take a while under load
+        await self.session.rollback()
+
+        valid, new_hash = await self.passwords.verify(password_hash, data.password)
+        if not valid:
+            raise InvalidCredentials()
+
+        if new_hash is not None:
+            await self.repo.update_password(user_id, new_hash)
+            await self.session.commit()
+
+        return user_id
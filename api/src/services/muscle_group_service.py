@@ -1,26 +1,143 @@
-from src.schemas.muscle_group_schemas import MuscleGroupCreateSchema, MuscleGroupUpdateSchema, MuscleGroupResponseSchema
+from json import dumps
+from redis.asyncio import Redis
+from src.config import SETTINGS
+from src.schemas.muscle_group_schemas import (
+    MuscleGroupBulkResultSchema,
+    MuscleGroupBulkUpdateSchema,
+    MuscleGroupCreateSchema,
+    MuscleGroupKeySchema,
+    MuscleGroupResponseSchema,
+    MuscleGroupUpdateSchema,
+)
 from src.repository.muscle_group_repository import MuscleGroupRepository
+from src.utils.cache import VersionedCache
 from sqlalchemy.ext.asyncio import AsyncSession
 
 class MuscleGroupService:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, redis: Redis):
+        self.session = session
         self.repo = MuscleGroupRepository(session)
+        self.cache = VersionedCache(redis, "muscle_group")
 
-    async def get_all_muscle_groups(self):
-        return await self.repo.get_all_muscle_groups()
+    @staticmethod
+    def _to_payload(muscle_group) -> dict | None:
+        if muscle_group is None:
+            return None
+        return MuscleGroupResponseSchema.model_validate(muscle_group).model_dump(mode="json", by_alias=True)
 
-    async def get_muscle_group_by_name(self, group_name: str, user_id: int):
-        return await self.repo.get_muscle_group_by_name(group_name, user_id)
+    @staticmethod
+    def _page_key(after: list | None, page_size: int) -> str:
+        return f"page:{dumps(after)}:{page_size}"
+
+    async def get_muscle_groups_etag(self, after: list | None = None, page_size: int = SETTINGS.DEFAULT_PAGE_SIZE):
+        return await self.cache.get_etag(VersionedCache.GLOBAL_SCOPE, self._page_key(after, page_size))
+
+    async def get_all_muscle_groups(
+        self, after: list | None = None, page_size: int = SETTINGS.DEFAULT_PAGE_SIZE, version: int | None = None
+    ) -> bytes:
+        """
+        Get a page of muscle groups as an encoded CursorPageSchema JSON document.
+        """
+
+        async def load():
+            groups, next_cursor = await self.repo.get_muscle_groups_page(after, page_size)
+            return {"items": [self._to_payload(group) for group in groups], "nextCursor": next_cursor}
+
+        return await self.cache.get_or_load_json(
+            VersionedCache.GLOBAL_SCOPE, self._page_key(after, page_size), load, version
+        )
+
+    async def get_muscle_group_etag(self, group_name: str, user_id: int):
+        return await self.cache.get_etag(user_id, f"name:{group_name}")
+
+    async def get_muscle_group_by_name(self, group_name: str, user_id: int, version: int | None = None):
+        async def load():
+            return self._to_payload(await self.repo.get_muscle_group_by_name(group_name, user_id))
+
+        return await self.cache.get_or_load(user_id, f"name:{group_name}", load, version)
+
+    @staticmethod
+    def _to_schema(muscle_group) -> MuscleGroupResponseSchema | None:
+        # Read before the commit expires the returned row
+        return MuscleGroupResponseSchema.model_validate(muscle_group) if muscle_group is not None else None
 
     async def create_muscle_group(self, data: MuscleGroupCreateSchema):
         data_as_dict = data.model_dump()
-        return await self.repo.create_muscle_group(data_as_dict)
-
+        result = self._to_schema(await self.repo.create_muscle_group(data_as_dict))
+        await self.session.commit()
+        await self.cache.invalidate(data.user_id)
+        return result
 
     async def update_muscle_group(self, group_name: str, user_id: int, data: MuscleGroupUpdateSchema):
         data_as_dict = data.model_dump()
-        return await self.repo.update_muscle_group(group_name, user_id, data_as_dict)
+        result = self._to_schema(await self.repo.update_muscle_group(group_name, user_id, data_as_dict))
+        await self.session.commit()
+        await self.cache.invalidate(user_id, data.user_id)
+        return result
 
     async def delete_muscle_group(self, group_name: str, user_id: int):
-        return await self.repo.delete_muscle_group(group_name, user_id)
+        result = self._to_schema(await self.repo.delete_muscle_group(group_name, user_id))
+        await self.session.commit()
+        await self.cache.invalidate(user_id)
+        return result
+
+    @staticmethod
+    def _bulk_results(keys: list[tuple[int | None, str]], rows: dict, success: str, failure: str):
+        """
+        Build one result per requested key, in request order. A key repeated in the
+        same request only succeeds once, every other occurrence is reported as failed.
+        """
+
+        results = []
+        for user_id, group_name in keys:
+            row = rows.pop((user_id, group_name), None)
+            results.append(
+                MuscleGroupBulkResultSchema(
+                    group_name=group_name,
+                    user_id=user_id,
+                    status=success if row is not None else failure,
+                    item=MuscleGroupResponseSchema.model_validate(row) if row is not None else None,
+                )
+            )
+        return results
+
+    async def bulk_create_muscle_groups(self, data: list[MuscleGroupCreateSchema]):
+        created = await self.repo.bulk_create_muscle_groups([item.model_dump() for item in data])
+
+        rows = {(group.user_id, group.group_name): group for group in created}
+        keys = [(item.user_id, item.group_name) for item in data]
+        results = self._bulk_results(keys, rows, "created", "conflict")
+
+        await self.session.commit()
+        await self.cache.invalidate(*{item.user_id for item in data})
+        return results
+
+    async def bulk_update_muscle_groups(self, data: list[MuscleGroupBulkUpdateSchema]):
+        updated = await self.repo.bulk_update_muscle_groups([item.model_dump() for item in data])
+
+        rows = {(row.current_user_id, row.group_name): row for row in updated}
+        keys = [(item.current_user_id, item.group_name) for item in data]
+        results = self._bulk_results(keys, rows, "updated", "not_found")
+
+        # A group still live under its old owner wasn't moved because its new key was taken
+        skipped = [(result.user_id, result.group_name) for result in results if result.status == "not_found"]
+        if skipped:
+            live = await self.repo.get_live_keys(list(dict.fromkeys(skipped)))
+            for result in results:
+                if result.status == "not_found" and (result.user_id, result.group_name) in live:
+                    result.status = "conflict"
+
+        await self.session.commit()
+        await self.cache.invalidate(*{item.current_user_id for item in data}, *{item.user_id for item in data})
+        return results
+
+    async def bulk_delete_muscle_groups(self, data: list[MuscleGroupKeySchema]):
+        keys = [(item.user_id, item.group_name) for item in data]
+        deleted = await self.repo.bulk_delete_muscle_groups(list(dict.fromkeys(keys)))
+
+        rows = {(group.user_id, group.group_name): group for group in deleted}
+        results = self._bulk_results(keys, rows, "deleted", "not_found")
 
+        await self.session.commit()
+        await self.cache.invalidate(*{item.user_id for item in data})
+        return results
@@ -0,0 +1,70 @@
+from datetime import date, timedelta
+from hashlib import sha256
+
+from src.config import SETTINGS
+from src.exceptions import IdempotencyKeyReused, WorkoutReportNotFound
+from src.repository.idempotency_repository import IdempotencyRepository
+from src.repository.personal_record_repository import PersonalRecordRepository
+from src.repository.set_report_repository import SetReportRepository
+from src.repository.weekly_volume_repository import WeeklyVolumeRepository
+from src.schemas.workout_report_split_schemas import SetReport, WorkoutSessionReport, WorkoutSessionResult
+from src.utils.training import week_start
+from sqlalchemy.ext.asyncio import AsyncSession
+
+class ReportService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.repo = SetReportRepository(session)
+        self.volume_repo = WeeklyVolumeRepository(session)
+        self.idempotency_repo = IdempotencyRepository(session)
+        self.record_repo = PersonalRecordRepository(session)
+
+    async def create_set_reports(self, data: list[SetReport]):
+        # workout_plan_id only identifies the split in the request, it isn't stored with the set
+        try:
+            await self.repo.create_set_reports([item.model_dump(exclude={"workout_plan_id"}) for item in data])
+        except LookupError:
+            raise WorkoutReportNotFound()
+        await self.session.commit()
+
+    async def ingest_workout_session(self, idempotency_key: str, data: WorkoutSessionReport) -> tuple[dict, bool]:
+        """
+        Write a workout report and all of its sets in a single transaction, together with the
+        idempotency key. Retrying with the same key and payload returns the first response
+        without writing anything.
+        Returns:
+            tuple[dict, bool]: The response payload and whether it is a replay of an earlier request.
+        Raises:
+            IdempotencyKeyReused: If the key was already used with a different payload.
+        """
+
+        request_hash = sha256(data.model_dump_json().encode()).hexdigest()
+
+        if not await self.idempotency_repo.claim(idempotency_key, request_hash):
+            stored = await self.idempotency_repo.get(idempotency_key)
+            if stored.request_hash != request_hash:
+                raise IdempotencyKeyReused()
+            return stored.response, True
+
+        report_id = await self.repo.create_workout_report(data.model_dump(exclude={"sets"}))
+        await self.repo.create_set_reports(
+            [{**item.model_dump(), "workout_report_id": report_id, "split": data.split} for item in data.sets],
+            {data.report_date},
+        )
+
+        response = WorkoutSessionResult(
+            workout_report_id=report_id, report_date=data.report_date, sets=len(data.sets)
+        ).model_dump(mode="json")
+        await self.idempotency_repo.save_response(idempotency_key, response)
+        await self.session.commit()
+
+        return response, False
+
+    async def get_weekly_volume(
+        self, user_id: int, exercise_id: int | None = None, weeks: int = SETTINGS.VOLUME_DEFAULT_WEEKS
+    ):
+        since = week_start(date.today()) - timedelta(weeks=weeks - 1)
+        return await self.volume_repo.get_weekly_volume(user_id, since, exercise_id)
+
+    async def get_personal_records(self, user_id: int):
+        return await self.record_repo.get_personal_records(user_id)
@@ -0,0 +1,57 @@
+import unicodedata
+
+import orjson
+from redis.asyncio import Redis
+from src.config import SETTINGS
+from src.repository.search_repository import SearchRepository
+from src.schemas.search_schemas import SearchResultSchema
+from src.utils.cache import VersionedCache
+from sqlalchemy.ext.asyncio import AsyncSession
+
+SEARCH_CACHE_NAMESPACE = "catalog_search"
+
+class SearchService:
+    def __init__(self, session: AsyncSession, redis: Redis):
+        self.repo = SearchRepository(session)
+        # Results mix the global catalog with the user's own items, so they live in the global
+        # scope. The app never writes the catalog, it changes through migrations and seeds, so
+        # entries are bounded by a short TTL (plus the stale window) unless invalidate is called.
+        self.cache = VersionedCache(redis, SEARCH_CACHE_NAMESPACE, timeout=SETTINGS.SEARCH_CACHE_TIMEOUT)
+
+    @staticmethod
+    def normalize_term(term: str) -> str:
+        """
+        Lowercase, unaccented and whitespace collapsed form of a search term, so that
+        "Supino", "supíno " and "SUPINO" share a cache entry.
+        """
+
+        decomposed = unicodedata.normalize("NFKD", term.casefold())
+        unaccented = "".join(char for char in decomposed if not unicodedata.combining(char))
+        return " ".join(unaccented.split())
+
+    async def search_catalog(self, term: str, user_id: int, limit: int = SETTINGS.SEARCH_DEFAULT_LIMIT) -> bytes:
+        """
+        Search the catalog, returning the results as an encoded JSON list of SearchResultSchema.
+        """
+
+        term = self.normalize_term(term)
+        if not term:
+            return b"[]"
+
+        async def load():
+            rows = await self.repo.search_catalog(term, user_id, limit)
+            return [SearchResultSchema.model_validate(row).model_dump(mode="json", by_alias=True) for row in rows]
+
+        # Short prefixes are what autocomplete sends on every keystroke and the most expensive
+        # to match, longer terms are too diverse to be worth caching
+        if len(term) > SETTINGS.SEARCH_CACHED_PREFIX_LENGTH:
+            return orjson.dumps(await load())
+
+        return await self.cache.get_or_load_json(VersionedCache.GLOBAL_SCOPE, f"{user_id}:{limit}:{term}", load)
+
+    async def invalidate(self):
+        """
+        Drop every cached search, for whoever changes an exercise, equipment or muscle.
+        """
+
+        await self.cache.invalidate()
@@ -0,0 +1,68 @@
+from pydantic import BaseModel
+from src.repository.sync_repository import SyncRepository
+from src.schemas.sync_schemas import (
+    SyncEquipmentSchema,
+    SyncExerciseSchema,
+    SyncMuscleGroupSchema,
+    SyncMuscleSchema,
+    SyncSplitExerciseSchema,
+    SyncWorkoutPlanSchema,
+    SyncWorkoutSplitSchema,
+)
+from src.utils.pagination import decode_cursor, encode_cursor
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Response schema and primary key of every entity, in the order the client should apply them
+SYNC_ENTITIES: dict[str, tuple[type[BaseModel], set[str]]] = {
+    "muscle_groups": (SyncMuscleGroupSchema, {"user_id", "group_name"}),
+    "muscles": (SyncMuscleSchema, {"id"}),
+    "equipment": (SyncEquipmentSchema, {"id"}),
+    "exercises": (SyncExerciseSchema, {"id"}),
+    "workout_plans": (SyncWorkoutPlanSchema, {"id"}),
+    "workout_splits": (SyncWorkoutSplitSchema, {"workout_plan_id", "split"}),
+    "split_exercises": (SyncSplitExerciseSchema, {"workout_plan_id", "split", "exercise_id", "execution_order"}),
+}
+
+class SyncService:
+    def __init__(self, session: AsyncSession):
+        self.repo = SyncRepository(session)
+
+    @staticmethod
+    def parse_cursor(cursor: str | None) -> int:
+        """
+        Get the change version a sync cursor points to, 0 for a full sync.
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+
+        if not cursor:
+            return 0
+
+        (version,) = decode_cursor(cursor, (int,))
+        if version < 0:
+            raise ValueError("Invalid cursor")
+        return version
+
+    async def sync(self, user_id: int, cursor: str | None = None) -> dict:
+        """
+        Get every change to the user's entities since the cursor, and the cursor to send next time.
+        Rows changed since are listed in "upserted", soft deleted ones in "deleted" by primary key.
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+
+        since = self.parse_cursor(cursor)
+        until = await self.repo.get_watermark()
+        response = {"cursor": encode_cursor([max(until, since)])}
+
+        for name, (schema, key) in SYNC_ENTITIES.items():
+            upserted, deleted = [], []
+            for row in await self.repo.get_changes(name, user_id, since, until):
+                item = schema.model_validate(row)
+                if row.deleted:
+                    deleted.append(item.model_dump(mode="json", by_alias=True, include=key))
+                else:
+                    upserted.append(item)
+            response[name] = {"upserted": upserted, "deleted": deleted}
+
+        return response
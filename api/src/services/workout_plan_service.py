@@ -0,0 +1,29 @@
+from redis.asyncio import Redis
+from src.repository.workout_plan_repository import WorkoutPlanRepository
+from src.utils.cache import VersionedCache
+from sqlalchemy.ext.asyncio import AsyncSession
+
+class WorkoutPlanService:
+    def __init__(self, session: AsyncSession, redis: Redis):
+        self.repo = WorkoutPlanRepository(session)
+        self.cache = VersionedCache(redis, "plan_tree")
+
+    async def get_plan_tree(self, plan_id: int) -> bytes | None:
+        """
+        Get a whole plan as an encoded WorkoutPlanTreeSchema JSON document.
+        The document is cached under the fingerprint of the rows it is built from, so any change to
+        the plan, its splits or split exercises, whatever the code path, leads to a new entry.
+        Renamed muscles or equipment show up once the entry expires.
+        Returns:
+            bytes | None: The document, None if the plan doesn't exist or was deleted.
+        """
+
+        version, rows = await self.repo.get_plan_tree_version(plan_id)
+        if rows == 0:
+            return None
+
+        async def load():
+            return await self.repo.get_plan_tree(plan_id)
+
+        body = await self.cache.get_or_load_json(plan_id, f"tree:{rows}", load, version)
+        return None if body == b"null" else body
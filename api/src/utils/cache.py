@@ -0,0 +1,479 @@
+import asyncio
+from collections import Counter, OrderedDict, defaultdict
+from hashlib import blake2b
+from time import monotonic
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+import orjson
+from redis.asyncio import Redis
+from redis.backoff import NoBackoff
+from redis.client import NEVER_DECODE
+from redis.exceptions import RedisError
+from redis.retry import Retry
+
+from src.config import SETTINGS
+from src.utils.codec import Codec, get_codec
+
+# Release a load lock only if it is still the one this worker took, it may have expired and been taken by another
+_UNLOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Published on every invalidation with the version keys bumped, so each worker drops its local copies
+INVALIDATION_CHANNEL = "cache:invalidations"
+
+
+class LocalCache:
+    """
+    Bounded in-process TTL/LRU tier in front of Redis, one per worker, holding encoded
+    entries and the version counters their keys are built from. A local hit costs neither
+    a round trip nor, for get_or_load_json, a decode.
+
+    It is only coherent while listen_for_invalidations is subscribed to INVALIDATION_CHANNEL:
+    until then, and whenever the subscription drops, it is emptied and VersionedCache goes
+    straight to Redis. Messages are dropped silently by Redis when a worker can't keep up,
+    so entries also expire after timeout seconds.
+    """
+
+    def __init__(self, max_bytes: int = SETTINGS.CACHE_LOCAL_MAX_BYTES, timeout: int = SETTINGS.CACHE_LOCAL_TIMEOUT):
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.connected = False
+        # Bumped by every invalidation, values read from Redis before one are not stored
+        self.generation = 0
+        self.size = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+
+    @staticmethod
+    def _size_of(key: str, value: Any) -> int:
+        return len(key) + (len(value) if isinstance(value, (bytes, str)) else 8)
+
+    def _pop(self, key: str):
+        _, _, size = self._entries.pop(key)
+        self.size -= size
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at, _ = entry
+        if expires_at <= monotonic():
+            self._pop(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any, timeout: float, generation: int | None = None):
+        """
+        Store a value, evicting the least recently used entries beyond max_bytes.
+        Args:
+            key (str): Redis key the value was read from or written to.
+            value (Any): Encoded entry or version counter.
+            timeout (float): Seconds to keep it, capped at the local timeout.
+            generation (int | None): Generation read before the value was, it is not stored if an invalidation came in since.
+        """
+
+        if generation is not None and generation != self.generation:
+            return
+
+        size = self._size_of(key, value)
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._pop(key)
+        self._entries[key] = (value, monotonic() + min(timeout, self.timeout), size)
+        self.size += size
+
+        while self.size > self.max_bytes:
+            self._pop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, keys: list[str]):
+        self.generation += 1
+        for key in keys:
+            if key in self._entries:
+                self._pop(key)
+
+    def clear(self):
+        self.generation += 1
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self) -> dict:
+        """
+        Get the memory used, evictions and whether invalidations are being received.
+        """
+
+        return {
+            "connected": self.connected,
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+
+LOCAL_CACHE = LocalCache() if SETTINGS.CACHE_LOCAL_ENABLED else None
+
+
+async def listen_for_invalidations(
+    local: LocalCache,
+    url: str = SETTINGS.REDIS_URL,
+    health_check_interval: float = SETTINGS.CACHE_LOCAL_HEALTH_CHECK_INTERVAL,
+):
+    """
+    Apply the invalidations published by every worker to local, until cancelled.
+    local is only marked connected while subscribed, and emptied whenever the subscription
+    is lost since the messages published meanwhile are gone. The client doesn't retry, a
+    silent reconnect would hide that gap, and the channel is pinged so a dead connection
+    is noticed even when nothing is published.
+    Args:
+        local (LocalCache): Local tier to keep coherent.
+        url (str): Redis server the workers publish to.
+        health_check_interval (float): Seconds between pings, and before reconnecting.
+    """
+
+    while True:
+        redis = Redis.from_url(url, retry=Retry(NoBackoff(), 0))
+        try:
+            async with redis.pubsub() as pubsub:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                last_seen = monotonic()
+
+                while True:
+                    message = await pubsub.get_message(timeout=health_check_interval)
+                    if message is not None:
+                        last_seen = monotonic()
+                        if message["type"] == "subscribe":
+                            local.clear()
+                            local.connected = True
+                        elif message["type"] == "message":
+                            local.invalidate(orjson.loads(message["data"]))
+                    elif monotonic() - last_seen > 2 * health_check_interval:
+                        raise ConnectionError("Invalidation channel stopped answering pings")
+                    else:
+                        await pubsub.ping()
+        except (RedisError, OSError):
+            pass
+        finally:
+            local.connected = False
+            local.clear()
+            await redis.aclose()
+
+        await asyncio.sleep(health_check_interval)
+
+
+class VersionedCache:
+    """
+    Read-through cache whose keys embed a per-user version counter.
+
+    Writes never delete cached entries, they bump the version counter of the affected
+    users (and of the global scope). Every key built with the old version becomes
+    unreachable at once and is left to expire with its TTL, so stale data is never served.
+
+    Entries are stored with the cache codec (SETTINGS.CACHE_CODEC) and always read as raw
+    bytes, even on clients created with decode_responses.
+
+    Misses are protected against stampedes. Identical concurrent loads in a process share
+    a single loader call, and across workers a short Redis lock lets only one of them
+    load while the others wait for its result. Entries outlive their timeout by
+    stale_timeout: during that window one worker refreshes the entry and the others keep
+    serving it. It is stale by age only, a write still makes it unreachable at once.
+
+    With a connected LocalCache, versions and entries are read from it first and Redis is
+    only asked on a local miss. Invalidations are published so other workers drop theirs.
+    """
+
+    GLOBAL_SCOPE = "all"
+    # Random token regenerated whenever Redis loses its data, so version counters restarting
+    # from zero can't produce an ETag a client already holds for older content
+    EPOCH_KEY = "cache:epoch"
+
+    # Loads in progress in this process, by cache key, shared by every instance. The future
+    # holds the encoded entry, or None when the load failed and waiters must load it themselves.
+    _in_flight: dict[str, asyncio.Future] = {}
+    # Per namespace counters of local and Redis hits and misses, loads, coalesced calls,
+    # lock waits and stale entries served
+    _counters: defaultdict[str, Counter] = defaultdict(Counter)
+
+    def __init__(
+        self,
+        redis: Redis,
+        namespace: str,
+        timeout: int = SETTINGS.CACHE_DEFAULT_TIMEOUT,
+        codec: Codec | None = None,
+        stale_timeout: int = SETTINGS.CACHE_STALE_TIMEOUT,
+        lock_timeout: float = SETTINGS.CACHE_LOCK_TIMEOUT,
+        local: LocalCache | None = LOCAL_CACHE,
+    ):
+        self.redis = redis
+        self.namespace = namespace
+        self.timeout = timeout
+        self.codec = codec or get_codec(SETTINGS.CACHE_CODEC)
+        self.stale_timeout = stale_timeout
+        self.lock_timeout = lock_timeout
+        self.local = local
+        self.counters = self._counters[namespace]
+        self._unlock_script = redis.register_script(_UNLOCK_SCRIPT)
+
+    @classmethod
+    def stats(cls) -> dict:
+        """
+        Get the counters of every namespace used in this process, with the hit ratio of each tier.
+        """
+
+        def ratio(hits: int, misses: int) -> float | None:
+            return round(hits / (hits + misses), 4) if hits + misses else None
+
+        return {
+            namespace: {
+                **counters,
+                "local_hit_ratio": ratio(counters["local_hits"], counters["local_misses"]),
+                "redis_hit_ratio": ratio(counters["hits"], counters["misses"]),
+            }
+            for namespace, counters in cls._counters.items()
+        }
+
+    def _connected_local(self) -> LocalCache | None:
+        return self.local if self.local is not None and self.local.connected else None
+
+    def _version_key(self, scope: int | str) -> str:
+        return f"cache:{self.namespace}:version:{scope}"
+
+    async def get_version(self, scope: int | str) -> int:
+        """
+        Get the current version counter of a scope.
+        Args:
+            scope (int | str): User ID or GLOBAL_SCOPE.
+        Returns:
+            int: Current version, 0 if the scope was never invalidated.
+        """
+
+        version_key = self._version_key(scope)
+        local = self._connected_local()
+        if local is not None and (version := local.get(version_key)) is not None:
+            return version
+
+        generation = local.generation if local is not None else None
+        version = await self.redis.get(version_key)
+        version = int(version) if version else 0
+
+        if local is not None:
+            local.put(version_key, version, local.timeout, generation)
+        return version
+
+    async def get_etag(self, scope: int | str, key: str) -> tuple[int, str]:
+        """
+        Get a strong ETag for an entry, built from the scope version so no payload needs to be hashed.
+        Args:
+            scope (int | str): User ID or GLOBAL_SCOPE the entry belongs to.
+            key (str): Entry key, unique inside the scope.
+        Returns:
+            tuple[int, str]: The scope version, to load the entry with, and the quoted ETag.
+        """
+
+        version_key = self._version_key(scope)
+        local = self._connected_local()
+        version = epoch = None
+        if local is not None:
+            version, epoch = local.get(version_key), local.get(self.EPOCH_KEY)
+
+        if version is None or epoch is None:
+            generation = local.generation if local is not None else None
+            version, epoch = await self.redis.mget(version_key, self.EPOCH_KEY)
+            if epoch is None:
+                await self.redis.set(self.EPOCH_KEY, uuid4().hex[:8], nx=True)
+                epoch = await self.redis.get(self.EPOCH_KEY)
+
+            version = int(version) if version else 0
+            if local is not None:
+                local.put(version_key, version, local.timeout, generation)
+                local.put(self.EPOCH_KEY, epoch, local.timeout, generation)
+
+        digest = blake2b(f"{self.namespace}:{scope}:{key}".encode(), digest_size=8).hexdigest()
+
+        return version, f'"{epoch}.{version}.{digest}"'
+
+    async def invalidate(self, *user_ids: int | None):
+        """
+        Bump the version counters of the given users and of the global scope.
+        Args:
+            user_ids (int | None): Users whose cached entries must be discarded.
+        """
+
+        scopes = {self.GLOBAL_SCOPE, *(user_id for user_id in user_ids if user_id is not None)}
+        version_keys = [self._version_key(scope) for scope in scopes]
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for version_key in version_keys:
+                pipe.incr(version_key)
+            pipe.publish(INVALIDATION_CHANNEL, orjson.dumps(version_keys))
+            await pipe.execute()
+
+        # This worker's own message arrives later, a read right after the write must already miss
+        if self.local is not None:
+            self.local.invalidate(version_keys)
+
+    async def _read(self, cache_key: str) -> tuple[bytes | None, float | None]:
+        """
+        Get an encoded entry and the seconds left before it goes stale, in one round trip.
+        Returns:
+            tuple[bytes | None, float | None]: The entry and its remaining fresh time, None if it never expires.
+        """
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.execute_command("GET", cache_key, **{NEVER_DECODE: True})
+            pipe.pttl(cache_key)
+            cached, ttl = await pipe.execute()
+
+        return cached, None if ttl == -1 else ttl / 1000 - self.stale_timeout
+
+    async def _lock(self, cache_key: str) -> str | None:
+        token = uuid4().hex
+        locked = await self.redis.set(f"{cache_key}:lock", token, nx=True, px=int(self.lock_timeout * 1000))
+        return token if locked else None
+
+    async def _wait_for_entry(self, cache_key: str) -> bytes | None:
+        """
+        Poll for the entry another worker is loading, None if it doesn't show up within lock_timeout.
+        """
+
+        deadline = monotonic() + self.lock_timeout
+        while monotonic() < deadline:
+            await asyncio.sleep(SETTINGS.CACHE_LOCK_POLL_INTERVAL)
+            cached, _ = await self._read(cache_key)
+            if cached is not None:
+                return cached
+
+        return None
+
+    async def _load(self, cache_key: str, loader: Callable[[], Awaitable[Any]]) -> tuple[bytes, Any]:
+        self.counters["loads"] += 1
+        result = await loader()
+        encoded = self.codec.encode(result)
+        await self.redis.set(cache_key, encoded, ex=self.timeout + self.stale_timeout)
+
+        if (local := self._connected_local()) is not None:
+            local.put(cache_key, encoded, self.timeout)
+        return encoded, result
+
+    async def _load_locked(self, cache_key: str, loader: Callable[[], Awaitable[Any]], token: str):
+        try:
+            return await self._load(cache_key, loader)
+        finally:
+            await self._unlock_script(keys=[f"{cache_key}:lock"], args=[token], client=self.redis)
+
+    async def _lead(self, cache_key: str, loader: Callable[[], Awaitable[Any]]) -> tuple[bytes, Any]:
+        """
+        Load a missing entry on behalf of every identical call of this process.
+        Only the worker holding the Redis lock calls loader, the others wait for its result,
+        and load it themselves if it takes longer than lock_timeout.
+        """
+
+        flight = asyncio.get_running_loop().create_future()
+        self._in_flight[cache_key] = flight
+        try:
+            token = await self._lock(cache_key)
+            if token is not None:
+                encoded, result = await self._load_locked(cache_key, loader, token)
+            else:
+                self.counters["lock_waits"] += 1
+                encoded, result = await self._wait_for_entry(cache_key), None
+                if encoded is None:
+                    encoded, result = await self._load(cache_key, loader)
+
+            flight.set_result(encoded)
+            return encoded, result
+        finally:
+            if not flight.done():
+                flight.set_result(None)
+            if self._in_flight.get(cache_key) is flight:
+                del self._in_flight[cache_key]
+
+    async def _get_or_store(
+        self, scope: int | str, key: str, loader: Callable[[], Awaitable[Any]], version: int | None = None
+    ) -> tuple[bytes, Any]:
+        """
+        Get the encoded entry for key, calling loader and storing its encoded result on a miss.
+        Returns:
+            tuple[bytes, Any]: The encoded entry and the loaded value, which is only set when loaded by this call.
+        """
+
+        if version is None:
+            version = await self.get_version(scope)
+        cache_key = f"cache:{self.namespace}:{scope}:v{version}:{key}"
+
+        local = self._connected_local()
+        if local is not None:
+            if (cached := local.get(cache_key)) is not None:
+                self.counters["local_hits"] += 1
+                return cached, None
+            self.counters["local_misses"] += 1
+
+        cached, fresh_for = await self._read(cache_key)
+        if cached is not None and (fresh_for is None or fresh_for > 0):
+            self.counters["hits"] += 1
+            if local is not None:
+                local.put(cache_key, cached, local.timeout if fresh_for is None else fresh_for)
+            return cached, None
+
+        self.counters["misses"] += 1
+        if cached is not None:
+            # Past its timeout: whoever takes the lock refreshes it, everyone else keeps serving it meanwhile
+            token = None if cache_key in self._in_flight else await self._lock(cache_key)
+            if token is None:
+                self.counters["stale_served"] += 1
+                return cached, None
+            return await self._load_locked(cache_key, loader, token)
+
+        # When the load joined fails, another waiter may already have taken over, join it instead
+        while (flight := self._in_flight.get(cache_key)) is not None:
+            self.counters["coalesced"] += 1
+            encoded = await asyncio.shield(flight)
+            if encoded is not None:
+                return encoded, None
+
+        return await self._lead(cache_key, loader)
+
+    async def get_or_load(
+        self, scope: int | str, key: str, loader: Callable[[], Awaitable[Any]], version: int | None = None
+    ) -> Any:
+        """
+        Return the cached value for key, calling loader and caching its result on a miss.
+        Args:
+            scope (int | str): User ID or GLOBAL_SCOPE the entry belongs to.
+            key (str): Entry key, unique inside the scope.
+            loader (Callable[[], Awaitable[Any]]): Coroutine producing a JSON serializable value.
+            version (int | None): Scope version already read with get_etag, read from Redis when None.
+        Returns:
+            Any: The cached or freshly loaded value.
+        """
+
+        encoded, result = await self._get_or_store(scope, key, loader, version)
+        return result if result is not None else self.codec.decode(encoded)
+
+    async def get_or_load_json(
+        self, scope: int | str, key: str, loader: Callable[[], Awaitable[Any]], version: int | None = None
+    ) -> bytes:
+        """
+        Same as get_or_load, but return the entry as an encoded JSON document ready to be sent
+        in a response. With the orjson codec the cached bytes are returned untouched.
+        Args:
+            scope (int | str): User ID or GLOBAL_SCOPE the entry belongs to.
+            key (str): Entry key, unique inside the scope.
+            loader (Callable[[], Awaitable[Any]]): Coroutine producing a schema-shaped payload.
+            version (int | None): Scope version already read with get_etag, read from Redis when None.
+        Returns:
+            bytes: JSON encoded value.
+        """
+
+        encoded, _ = await self._get_or_store(scope, key, loader, version)
+        return self.codec.to_json(encoded)
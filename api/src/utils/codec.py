@@ -0,0 +1,115 @@
+"""
+Serialization codecs shared by the HTTP layer and the Redis cache.
+
+Every codec turns JSON compatible values (dicts, lists, strings, numbers, bools and None)
+into bytes and back. Payloads are expected to be schema-shaped already, i.e. the output of
+model_dump(mode="json", by_alias=True), so no codec needs to know about models.
+"""
+import json
+from typing import Any, Protocol
+
+import msgpack
+import orjson
+from fastapi.responses import JSONResponse
+from starlette.responses import Response
+
+
+class Codec(Protocol):
+    name: str
+
+    def encode(self, value: Any) -> bytes: ...
+
+    def decode(self, data: bytes) -> Any: ...
+
+    def to_json(self, data: bytes) -> bytes:
+        """
+        Convert encoded data to a JSON document that can be sent as an HTTP response body.
+        """
+
+
+class JsonCodec:
+    """
+    Standard library json, kept as the baseline for benchmarks.
+    """
+
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def to_json(self, data: bytes) -> bytes:
+        return data
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def encode(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def decode(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def to_json(self, data: bytes) -> bytes:
+        return data
+
+
+class MsgpackCodec:
+    """
+    Smaller entries than JSON, at the price of a transcode before they can be sent over HTTP.
+    """
+
+    name = "msgpack"
+
+    def encode(self, value: Any) -> bytes:
+        return msgpack.packb(value)
+
+    def decode(self, data: bytes) -> Any:
+        return msgpack.unpackb(data)
+
+    def to_json(self, data: bytes) -> bytes:
+        return orjson.dumps(self.decode(data))
+
+
+CODECS: dict[str, Codec] = {codec.name: codec for codec in (JsonCodec(), OrjsonCodec(), MsgpackCodec())}
+
+
+def get_codec(name: str) -> Codec:
+    """
+    Get a codec by name.
+    Args:
+        name (str): One of "json", "orjson" or "msgpack".
+    Returns:
+        Codec: The shared codec instance.
+    Raises:
+        ValueError: If there is no codec with that name.
+    """
+
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown codec {name}, expected one of: {', '.join(CODECS)}")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson, for routes returning plain values without a response model.
+
+    Routes with a response model are better left on FastAPI's default response class: only then
+    is the model serialized straight to JSON by pydantic, which beats dumping it to Python
+    objects and encoding those with orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+class EncodedJSONResponse(Response):
+    """
+    Response for a body that is already encoded JSON, such as a cached payload, sent as is.
+    """
+
+    media_type = "application/json"
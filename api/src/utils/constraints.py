@@ -10,20 +10,28 @@ class DatabaseConstraints:
         UNIQUE = "uq_muscle"
         FK_USER = "fk_muscle_user"
         FK_MUSCLE_GROUP = "fk_muscle_muscle_group"
+        IDX_NAME_SEARCH = "idx_muscle_name_search"
+        IDX_CHANGE_VERSION = "idx_muscle_change_version"
 
     class MuscleGroup:
         UNIQUE = "uq_muscle_group"
         FK_USER = "fk_muscle_group_user"
+        PRIMARY_KEY = "muscle_group_pkey"
+        IDX_CHANGE_VERSION = "idx_muscle_group_change_version"
 
     class Equipment:
         UNIQUE = "uq_equipment"
         FK_USER = "fk_equipment_user"
         FK_MUSCLE_GROUP = "fk_equipment_muscle_group"
         IDX_EQUIPMENT_NAME = "idx_equipment_name"
+        IDX_NAME_SEARCH = "idx_equipment_name_search"
+        IDX_CHANGE_VERSION = "idx_equipment_change_version"
 
     class Exercise:
         UNIQUE = "uq_exercise"
         FK_USER = "fk_exercise_user"
+        IDX_NAME_SEARCH = "idx_exercise_name_search"
+        IDX_CHANGE_VERSION = "idx_exercise_change_version"
 
     class ExerciseMuscle:
         FK_EXERCISE = "fk_exercise_muscle_exercise"
@@ -36,20 +44,35 @@ class DatabaseConstraints:
     class WorkoutPlan:
         UNIQUE = "uq_workout_plan"
         FK_USER = "fk_workout_plan_user"
+        IDX_CHANGE_VERSION = "idx_workout_plan_change_version"
 
     class WorkoutSplit:
         FK_WORKOUT_PLAN = "fk_workout_split_workout_plan"
+        IDX_CHANGE_VERSION = "idx_workout_split_change_version"
 
     class SplitExercise:
         FK_WORKOUT_SPLIT = "fk_split_exercise_workout_split"
         FK_EXERCISE = "fk_split_exercise_exercise"
+        IDX_CHANGE_VERSION = "idx_split_exercise_change_version"
 
     class WorkoutReport:
         FK_WORKOUT_PLAN = "fk_workout_report_workout_plan"
         FK_WORKOUT_SPLIT = "fk_workout_report_workout_split"
+        UNIQUE_ID = "uq_workout_report_id"
 
     class SetReport:
         FK_WORKOUT_REPORT = "fk_set_report_workout_report"
         FK_EXERCISE = "fk_set_report_exercise"
         FK_SPLIT = "fk_set_report_split"
-        FK_WORKOUT_PLAN = "fk_set_report_workout_plan"
\ No newline at end of file
+        FK_WORKOUT_PLAN = "fk_set_report_workout_plan"
+
+    class WeeklyVolume:
+        FK_USER = "fk_weekly_volume_user"
+        FK_EXERCISE = "fk_weekly_volume_exercise"
+
+    class PersonalRecord:
+        FK_USER = "fk_personal_record_user"
+        FK_EXERCISE = "fk_personal_record_exercise"
+
+    class IdempotencyKey:
+        IDX_CREATED_AT = "idx_idempotency_key_created_at"
@@ -0,0 +1,37 @@
+from fastapi import Response, status
+
+# Lets the browser keep the body but makes it revalidate with If-None-Match on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against the current ETag of a resource.
+    Uses the weak comparison RFC 9110 requires for If-None-Match, so W/ prefixes are ignored.
+    Args:
+        if_none_match (str | None): Raw header value, a list of ETags or "*".
+        etag (str): Current quoted ETag.
+    Returns:
+        bool: True if the client copy is still current.
+    """
+
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def etag_headers(etag: str) -> dict[str, str]:
+    """
+    Validator headers of a response. The ETag is sent weak because GZipMiddleware may compress
+    the body after it is set, and a strong ETag must change with every byte of the representation.
+    """
+
+    return {"ETag": f"W/{etag}", "Cache-Control": CACHE_CONTROL, "Vary": "Accept-Encoding"}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
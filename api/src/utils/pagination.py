@@ -0,0 +1,81 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+from json import JSONDecodeError, dumps, loads
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.config import SETTINGS
+
+
+def encode_cursor(values: list) -> str:
+    """
+    Encode the ordering column values of the last row of a page as an opaque cursor.
+    Args:
+        values (list): JSON serializable values of the ordering columns.
+    Returns:
+        str: URL safe cursor string.
+    """
+
+    return urlsafe_b64encode(dumps(values, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor: str, types: tuple[type, ...] | None = None) -> list:
+    """
+    Decode a cursor produced by encode_cursor.
+    Args:
+        cursor (str): Cursor received from the client.
+        types (tuple[type, ...] | None): Python types of the ordering columns, checked exactly so
+            that true isn't taken for an int. Any list of values is accepted when None.
+    Returns:
+        list: Values of the ordering columns to continue after.
+    Raises:
+        ValueError: If the cursor is malformed or doesn't match the ordering columns.
+    """
+
+    try:
+        values = loads(urlsafe_b64decode(cursor.encode()))
+    except (Base64Error, JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+
+    if types is not None and (
+        len(values) != len(types) or any(type(value) is not expected for value, expected in zip(values, types))
+    ):
+        raise ValueError("Invalid cursor")
+
+    return values
+
+
+class Pagination:
+    """
+    Query parameters shared by every list route. Routes paginating by keyset depend on
+    Pagination.over(order_columns), so cursors that don't fit the ordering are a 400
+    instead of reaching the database.
+    """
+
+    column_types: tuple[type, ...] | None = None
+
+    def __init__(
+        self,
+        cursor: str | None = Query(default=None),
+        page_size: int = Query(default=SETTINGS.DEFAULT_PAGE_SIZE, ge=1, le=SETTINGS.MAX_PAGE_SIZE),
+    ):
+        self.cursor = cursor
+        self.page_size = page_size
+
+        try:
+            self.after = decode_cursor(cursor, self.column_types) if cursor else None
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    @classmethod
+    def over(cls, order_columns: tuple[InstrumentedAttribute, ...]) -> type["Pagination"]:
+        """
+        Get a Pagination dependency whose cursors must hold one value per ordering column, of its type.
+        """
+
+        column_types = tuple(column.type.python_type for column in order_columns)
+        return type(cls.__name__, (cls,), {"column_types": column_types})
@@ -0,0 +1,63 @@
+from contextvars import ContextVar
+
+
+class RequestMetrics:
+    """
+    Counters of the work done while serving a single request.
+    """
+
+    __slots__ = ("sql_count", "sql_time", "redis_count", "redis_time")
+
+    def __init__(self):
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.redis_count = 0
+        self.redis_time = 0.0
+
+    def record_sql(self, elapsed: float):
+        self.sql_count += 1
+        self.sql_time += elapsed
+
+    def record_redis(self, elapsed: float, commands: int = 1):
+        self.redis_count += commands
+        self.redis_time += elapsed
+
+    def server_timing(self, total: float) -> str:
+        """
+        Format the counters as a Server-Timing header value. Durations are in milliseconds.
+        Args:
+            total (float): Total time spent on the request, in seconds.
+        """
+
+        return (
+            f'total;dur={total * 1000:.2f}, '
+            f'db;dur={self.sql_time * 1000:.2f};desc="{self.sql_count} queries", '
+            f'redis;dur={self.redis_time * 1000:.2f};desc="{self.redis_count} commands", '
+            f'app;dur={max(total - self.sql_time - self.redis_time, 0) * 1000:.2f}'
+        )
+
+
+_CURRENT_METRICS: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default=None)
+
+
+def current_metrics() -> RequestMetrics | None:
+    """
+    Get the metrics of the request being served, None outside of a request.
+    """
+
+    return _CURRENT_METRICS.get()
+
+
+def start_request_metrics():
+    """
+    Start collecting metrics for the current request.
+    Returns:
+        tuple[RequestMetrics, Token]: The metrics and the token to pass to stop_request_metrics.
+    """
+
+    metrics = RequestMetrics()
+    return metrics, _CURRENT_METRICS.set(metrics)
+
+
+def stop_request_metrics(token):
+    _CURRENT_METRICS.reset(token)
@@ -0,0 +1,55 @@
+from datetime import date, timedelta
+
+from sqlalchemy import ColumnElement, Integer, case, cast, func
+
+
+def parse_reps(reps: str) -> int:
+    """
+    Get the number of repetitions of a set report. Reps are free text, so anything that
+    isn't a plain number (like "falha" or "8-10") counts as zero. Only spaces and ASCII digits
+    are accepted, as in parse_reps_sql: str.isdigit also takes "²" or "٣", which int can't read
+    or the SQL pattern doesn't match.
+    """
+
+    reps = reps.strip(" ")
+    return int(reps) if reps.isascii() and reps.isdigit() else 0
+
+
+def parse_reps_sql(reps: ColumnElement) -> ColumnElement:
+    """
+    SQL counterpart of parse_reps, for queries that aggregate set reports in the database.
+    """
+
+    reps = func.btrim(reps)
+    return case((reps.regexp_match("^[0-9]+$"), cast(reps, Integer)), else_=0)
+
+
+def week_start(day: date) -> date:
+    """
+    Get the monday of the ISO week of a date.
+    """
+
+    return day - timedelta(days=day.weekday())
+
+
+def estimate_one_rep_max(weight: float, reps: int, formula: str = "epley") -> float:
+    """
+    Estimate the one repetition maximum of a set. A single is its own 1RM.
+    Args:
+        weight (float): Weight lifted.
+        reps (int): Repetitions done, sets without any count as zero.
+        formula (str): "epley", weight * (1 + reps / 30), or "brzycki", weight * 36 / (37 - reps).
+    Raises:
+        ValueError: If the formula is unknown.
+    """
+
+    if reps < 1:
+        return 0.0
+    if reps == 1:
+        return float(weight)
+    if formula == "epley":
+        return weight * (1 + reps / 30)
+    if formula == "brzycki":
+        # The formula breaks down past 36 reps, where it would divide by zero or go negative
+        return weight * 36 / (37 - min(reps, 36))
+    raise ValueError(f"Unknown 1RM formula {formula}")
@@ -1,12 +1,15 @@
 import random
 import string
 from functools import wraps
-from json import dumps, loads
-from sqlalchemy.engine.row import Row
+from json import dumps
 from typing import Callable, Any
-from src.config import SETTINGS
 
-from src.connections import redis_connection
+from pydantic import TypeAdapter
+from redis.client import NEVER_DECODE
+
+from src.config import SETTINGS
+from src.connections import REDIS_POOL, InstrumentedRedis
+from src.utils.codec import get_codec
 
 def exclude_falsy_from_dict(payload: dict):
     return {
@@ -16,40 +19,40 @@ def exclude_falsy_from_dict(payload: dict):
     }
 
 
-def serialize_sqlalchemy_result(obj: Any) -> dict:
-    """Serialize SQLAlchemy objects to dictionary format"""
-    if isinstance(obj, list):
-        return [serialize_sqlalchemy_result(item) for item in obj]
-    if hasattr(obj, '__dict__'):
-        return {
-            key: value
-            for key, value in obj.__dict__.items()
-            if not key.startswith('_')
-        }
-    if isinstance(obj, Row):
-        return dict(obj._mapping)
-    return obj
+def cached_operation(schema: Any = None, timeout: int = SETTINGS.CACHE_DEFAULT_TIMEOUT):
+    """
+    Cache the result of a coroutine in Redis, keyed on its name and arguments.
+    The result is dumped through the given schema (any type pydantic accepts, like
+    list[MuscleGroupResponseSchema]) and the schema-shaped payload is what gets cached,
+    so the decorated coroutine returns the same value on hits and misses.
+    Args:
+        schema (Any): Type the result is dumped with, None if it is already JSON compatible.
+        timeout (int): Entry TTL in seconds.
+    """
 
+    adapter = TypeAdapter(schema) if schema is not None else None
+    codec = get_codec(SETTINGS.CACHE_CODEC)
 
-def cached_operation(timeout: int = SETTINGS.CACHE_DEFAULT_TIMEOUT):
     def decorator(
         func: Callable,
     ):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            async with redis_connection() as redis:
-                parameters = dumps({"args": args, "kwargs": kwargs}, sort_keys=True)
+            async with InstrumentedRedis(connection_pool=REDIS_POOL) as redis:
+                parameters = dumps({"args": args, "kwargs": kwargs}, sort_keys=True, default=str)
 
                 key = f"{func.__name__}:{parameters}"
-                result = await redis.get(key)
+                cached = await redis.execute_command("GET", key, **{NEVER_DECODE: True})
 
-                if result:
-                    return loads(result)
+                if cached is not None:
+                    return codec.decode(cached)
 
                 result = await func(*args, **kwargs)
+                if adapter is not None:
+                    validated = adapter.validate_python(result, from_attributes=True)
+                    result = adapter.dump_python(validated, mode="json", by_alias=True)
 
-                serialized_result = serialize_sqlalchemy_result(result)
-                await redis.setex(key, timeout, dumps(serialized_result))
+                await redis.set(key, codec.encode(result), ex=timeout)
 
                 return result
 
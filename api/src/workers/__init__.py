@@ -0,0 +1,6 @@
+"""
+OVERLOAD Workers Package
+
+This package contains the background workers that run alongside the API,
+such as the mail queue worker. Each worker is started with `python -m`.
+"""
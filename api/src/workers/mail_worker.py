@@ -0,0 +1,253 @@
+import asyncio
+import logging
+import time
+from email.message import EmailMessage
+from json import dumps, loads
+
+import aiosmtplib
+from jinja2 import TemplateError
+from redis.asyncio import Redis
+
+from src.config import SETTINGS
+from src.email_service import (
+    MAIL_DEAD_LETTER_KEY,
+    MAIL_PROCESSING_KEY,
+    MAIL_QUEUE_KEY,
+    MAIL_RETRY_KEY,
+    build_template_env,
+)
+
+logger = logging.getLogger("overload.mail_worker")
+
+# Moves every retry whose backoff has elapsed back to the mail queue in one atomic step,
+# so two workers can't pick up the same job.
+_PROMOTE_RETRIES_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 100)
+for _, job in ipairs(due) do
+    redis.call('ZREM', KEYS[1], job)
+    redis.call('LPUSH', KEYS[2], job)
+end
+return #due
+"""
+
+
+class PermanentMailError(Exception):
+    """
+    Delivery failure that won't succeed on retry, such as a refused recipient or a broken template.
+    """
+
+
+class MailWorker:
+    """
+    Drains the mail queue: renders each job with the precompiled templates and sends it
+    over a single SMTP connection kept open between jobs. Transient failures are retried
+    with exponential backoff, permanent ones and jobs out of attempts go to the dead-letter list.
+
+    Jobs are delivered at least once: each is moved to the worker's processing list while it is
+    handled, and whatever a crashed worker left there is queued again when it starts.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        smtp: aiosmtplib.SMTP | None = None,
+        max_attempts: int = SETTINGS.MAIL_MAX_ATTEMPTS,
+        backoff: float = SETTINGS.MAIL_RETRY_BACKOFF,
+        backoff_max: float = SETTINGS.MAIL_RETRY_BACKOFF_MAX,
+        worker_id: str = SETTINGS.MAIL_WORKER_ID,
+        dead_letter_max_size: int = SETTINGS.MAIL_DEAD_LETTER_MAX_SIZE,
+    ):
+        self.redis = redis
+        self.smtp = smtp or aiosmtplib.SMTP(
+            hostname=SETTINGS.MAIL_SERVER,
+            port=SETTINGS.MAIL_PORT,
+            username=SETTINGS.MAIL_USERNAME,
+            password=SETTINGS.MAIL_PASSWORD,
+            use_tls=SETTINGS.MAIL_SSL_TLS,
+            start_tls=SETTINGS.MAIL_STARTTLS,
+            timeout=SETTINGS.MAIL_TIMEOUT,
+        )
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.processing_key = f"{MAIL_PROCESSING_KEY}:{worker_id}"
+        self.dead_letter_max_size = dead_letter_max_size
+
+        template_env = build_template_env()
+        self.templates = {name: template_env.get_template(name) for name in template_env.list_templates()}
+        self._promote_retries = redis.register_script(_PROMOTE_RETRIES_SCRIPT)
+
+    def build_message(self, job: dict) -> EmailMessage:
+        """
+        Render the job template into an HTML email.
+        Raises:
+            PermanentMailError: If the template doesn't exist or fails to render.
+        """
+
+        template = self.templates.get(job["template"])
+        if template is None:
+            raise PermanentMailError(f"Template {job['template']} não encontrado")
+
+        try:
+            body = template.render(**job["context"])
+        except TemplateError as e:
+            raise PermanentMailError(str(e)) from e
+
+        message = EmailMessage()
+        message["From"] = f"{SETTINGS.MAIL_FROM_NAME} <{SETTINGS.MAIL_FROM}>"
+        message["To"] = job["recipient"]
+        message["Subject"] = job["subject"]
+        message.set_content(body, subtype="html")
+
+        return message
+
+    async def deliver(self, job: dict):
+        """
+        Send a job over the persistent SMTP connection, connecting first if needed.
+        Raises:
+            PermanentMailError: If the server refuses the message for good.
+            aiosmtplib.SMTPException | OSError: On transient failures.
+        """
+
+        message = self.build_message(job)
+
+        if not self.smtp.is_connected:
+            await self.smtp.connect()
+
+        try:
+            await self.smtp.send_message(message)
+        except aiosmtplib.SMTPRecipientsRefused as e:
+            raise PermanentMailError(str(e)) from e
+        except aiosmtplib.SMTPResponseException as e:
+            if e.code >= 500:
+                raise PermanentMailError(str(e)) from e
+            raise
+
+    def _reset_connection(self):
+        try:
+            self.smtp.close()
+        except Exception:
+            pass
+
+    async def handle(self, raw_job: str):
+        """
+        Deliver a single job taken from the queue, scheduling a retry or dead-lettering it on failure.
+        """
+
+        job = loads(raw_job)
+
+        try:
+            await self.deliver(job)
+        except PermanentMailError as e:
+            await self._dead_letter(job, str(e))
+        except (aiosmtplib.SMTPException, OSError) as e:
+            self._reset_connection()
+            await self._retry(job, str(e))
+
+    async def _retry(self, job: dict, error: str):
+        job["attempts"] += 1
+
+        if job["attempts"] >= self.max_attempts:
+            await self._dead_letter(job, error)
+            return
+
+        delay = min(self.backoff * 2 ** (job["attempts"] - 1), self.backoff_max)
+        await self.redis.zadd(MAIL_RETRY_KEY, {dumps(job): time.time() + delay})
+        logger.warning("Mail job %s failed, retrying in %.0fs: %s", job["id"], delay, error)
+
+    async def _dead_letter(self, job: dict, error: str):
+        # The template context holds verification and reset codes, only its keys are kept
+        context = job.pop("context", None)
+        if isinstance(context, dict):
+            job["context_keys"] = sorted(context)
+        job["error"] = error
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.lpush(MAIL_DEAD_LETTER_KEY, dumps(job))
+            pipe.ltrim(MAIL_DEAD_LETTER_KEY, 0, self.dead_letter_max_size - 1)
+            await pipe.execute()
+        logger.error("Mail job %s moved to dead-letter list: %s", job.get("id"), error)
+
+    async def run_once(self, timeout: float = 1) -> bool:
+        """
+        Promote due retries and process at most one job.
+        Args:
+            timeout (float): Seconds to block waiting for a job.
+        Returns:
+            bool: True if a job was processed.
+        """
+
+        await self._promote_retries(keys=[MAIL_RETRY_KEY, MAIL_QUEUE_KEY], args=[time.time()])
+
+        raw_job = await self.redis.blmove(MAIL_QUEUE_KEY, self.processing_key, timeout, "RIGHT", "LEFT")
+        if raw_job is None:
+            return False
+
+        try:
+            await self.handle(raw_job)
+        except (ValueError, KeyError, TypeError) as e:
+            # A malformed job fails the same way on every attempt. One that isn't even JSON is
+            # dropped rather than kept raw, it may still hold a code.
+            try:
+                job = loads(raw_job)
+            except ValueError:
+                job = None
+            await self._dead_letter(job if isinstance(job, dict) else {}, f"Malformed job: {e!r}")
+        except Exception as e:
+            # Anything else may be transient, the job goes through the same backoff as a failed delivery.
+            # If even that fails (Redis is down) it stays in the processing list for run to requeue.
+            logger.exception("Mail job failed unexpectedly")
+            await self._retry(loads(raw_job), repr(e))
+
+        await self.redis.lrem(self.processing_key, 1, raw_job)
+        return True
+
+    async def requeue_processing(self) -> int:
+        """
+        Queue again the jobs this worker was handling when it stopped, to be processed first.
+        Returns:
+            int: Number of jobs queued again.
+        """
+
+        requeued = 0
+        while await self.redis.lmove(self.processing_key, MAIL_QUEUE_KEY, "LEFT", "RIGHT") is not None:
+            requeued += 1
+
+        if requeued:
+            logger.warning("Requeued %s mail jobs left unfinished by worker %s", requeued, self.processing_key)
+        return requeued
+
+    async def run(self):
+        """
+        Process jobs until cancelled. Errors are logged and retried after a backoff, so a Redis
+        outage or an unexpected failure never stops the worker.
+        """
+
+        recovered = False
+        delay = self.backoff
+        try:
+            while True:
+                try:
+                    if not recovered:
+                        await self.requeue_processing()
+                        recovered = True
+                    await self.run_once()
+                    delay = self.backoff
+                except Exception:
+                    # A job taken just before the failure may be left in the processing list
+                    recovered = False
+                    logger.exception("Mail worker failed, retrying in %.0fs", delay)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self.backoff_max)
+        finally:
+            self._reset_connection()
+
+
+async def main():
+    logging.basicConfig(level=logging.INFO)
+    async with Redis.from_url(SETTINGS.REDIS_URL, decode_responses=True) as redis:
+        await MailWorker(redis).run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,166 @@
+"""
+Microbenchmarks of the repositories against the test database.
+
+They are deselected by default, run them with:
+
+    pytest -m benchmark tests/benchmarks [--benchmark-save PATH] [--benchmark-compare PATH]
+
+The database is seeded once, before the first benchmark, with BENCHMARK_USERS users owning BENCHMARK_GROUPS_PER_USER
+muscle groups and BENCHMARK_MUSCLES_PER_USER muscles each. Every call is timed and summarized as calls/s,
+rows/s and latency percentiles in a table at the end of the run.
+"""
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from benchmarks.load.baseline import find_regressions, load_baseline, save_baseline
+from benchmarks.load.stats import percentile
+from tests.conftest import engine
+
+USERS = int(os.getenv("BENCHMARK_USERS", 10_000))
+GROUPS_PER_USER = int(os.getenv("BENCHMARK_GROUPS_PER_USER", 30))
+MUSCLES_PER_USER = int(os.getenv("BENCHMARK_MUSCLES_PER_USER", 10))
+ROUNDS = int(os.getenv("BENCHMARK_ROUNDS", 200))
+WARMUP_ROUNDS = 5
+REGRESSION_THRESHOLD = 0.15
+
+# One soft-deleted row out of every DELETED_EVERY, like a catalog that has been edited for a while
+DELETED_EVERY = 10
+
+SEED_STATEMENTS = (
+    "INSERT INTO \"user\" (id, email, name, password, deleted, created_at) "
+    "SELECT u, 'bench' || u || '@overload.test', 'Usuário ' || u, 'x', false, now() FROM generate_series(1, :users) u",
+    "INSERT INTO muscle_group (user_id, group_name, deleted, created_at, deleted_at) "
+    "SELECT u, 'Grupo ' || lpad(g::text, 2, '0'), g % :deleted_every = 0, now(), "
+    "CASE WHEN g % :deleted_every = 0 THEN now() END "
+    "FROM generate_series(1, :users) u, generate_series(1, :groups) g",
+    "INSERT INTO muscle (group_name, user_id, muscle_name, deleted, created_at) "
+    "SELECT 'Grupo ' || lpad((m % :groups + 1)::text, 2, '0'), u, 'Músculo ' || u || '.' || m, false, now() "
+    "FROM generate_series(1, :users) u, generate_series(1, :muscles) m",
+)
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Per-call latencies, in seconds, and rows returned by a benchmarked repository call.
+    """
+
+    name: str
+    rows: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        latencies = sorted(self.latencies)
+        total = sum(latencies)
+        return {
+            "calls": len(latencies),
+            "rows": self.rows,
+            "throughput": len(latencies) / total if total else 0.0,
+            "rows_per_sec": self.rows / total if total else 0.0,
+            "p50": percentile(latencies, 50) * 1000,
+            "p95": percentile(latencies, 95) * 1000,
+            "p99": percentile(latencies, 99) * 1000,
+            "max": (latencies[-1] if latencies else 0.0) * 1000,
+        }
+
+
+RESULTS: dict[str, BenchmarkResult] = {}
+
+
+def count_rows(result: Any) -> int:
+    if result is None:
+        return 0
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[0], list):
+        # A keyset page and its next cursor
+        return len(result[0])
+    if hasattr(result, "__len__"):
+        return len(result)
+    return 1
+
+
+@pytest_asyncio.fixture(scope="package", loop_scope="session")
+async def benchmark_data():
+    """
+    Seed the benchmark volumes once for all the benchmarks and empty the tables after the last one.
+    """
+
+    params = {
+        "users": USERS,
+        "groups": GROUPS_PER_USER,
+        "muscles": MUSCLES_PER_USER,
+        "deleted_every": DELETED_EVERY,
+    }
+    async with engine.begin() as conn:
+        for statement in SEED_STATEMENTS:
+            await conn.execute(text(statement), {key: value for key, value in params.items() if f":{key}" in statement})
+        await conn.execute(text("SELECT setval(pg_get_serial_sequence('\"user\"', 'id'), :users)"), params)
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE"))
+
+    yield params
+
+    tables = ", ".join(f'"{table}"' for table in ("muscle", "muscle_group", "user"))
+    async with engine.begin() as conn:
+        await conn.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+
+
+@pytest.fixture
+def bench(benchmark_data):
+    """
+    Time a repository call ROUNDS times after a few unrecorded warmup rounds.
+    The call receives the round number, so writes can target a different row on each round.
+    """
+
+    async def run(
+        name: str, call: Callable[[int], Awaitable[Any]], rounds: int = ROUNDS, warmup: int = WARMUP_ROUNDS
+    ) -> BenchmarkResult:
+        result = BenchmarkResult(name)
+
+        for i in range(-warmup, rounds):
+            start = time.perf_counter()
+            returned = await call(i + warmup)
+            elapsed = time.perf_counter() - start
+
+            if i >= 0:
+                result.latencies.append(elapsed)
+                result.rows += count_rows(returned)
+
+        RESULTS[name] = result
+        return result
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not RESULTS:
+        return
+
+    summaries = {name: RESULTS[name].summary() for name in sorted(RESULTS)}
+
+    terminalreporter.section("repository benchmarks")
+    terminalreporter.write_line(
+        f"{'benchmark':<44}{'calls':>7}{'calls/s':>10}{'rows/s':>12}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    )
+    for name, summary in summaries.items():
+        terminalreporter.write_line(
+            f"{name:<44}{summary['calls']:>7}{summary['throughput']:>10.1f}{summary['rows_per_sec']:>12.0f}"
+            f"{summary['p50']:>9.2f}{summary['p95']:>9.2f}{summary['p99']:>9.2f}"
+        )
+
+    settings = {"users": USERS, "groups_per_user": GROUPS_PER_USER, "muscles_per_user": MUSCLES_PER_USER}
+    if path := config.getoption("benchmark_save"):
+        save_baseline(Path(path), summaries, settings)
+        terminalreporter.write_line(f"Benchmark results saved to {path}")
+
+    if path := config.getoption("benchmark_compare"):
+        for regression in find_regressions(summaries, load_baseline(Path(path)), REGRESSION_THRESHOLD):
+            terminalreporter.write_line(f"REGRESSION {regression}")
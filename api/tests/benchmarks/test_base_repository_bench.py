@@ -0,0 +1,27 @@
+import pytest
+from sqlalchemy import select
+
+from src.models import MuscleGroup
+from src.repository.base_repository import BaseRepository
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("depth", [0.0, 0.5, 0.99])
+async def test_bench_paginate_mapping(mock_async_session, bench, benchmark_data, depth):
+    # Arrange
+    repo = BaseRepository(mock_async_session)
+    query = select(MuscleGroup).where(MuscleGroup.deleted == False).order_by(MuscleGroup.user_id, MuscleGroup.group_name)
+    live_groups = benchmark_data["users"] * benchmark_data["groups"] * 9 // 10
+    page = int(live_groups / 20 * depth) + 1
+
+    # Act
+    result = await bench(
+        f"base.paginate_mapping[depth={depth:.0%}]",
+        lambda i: repo.paginate_mapping(query.subquery(), page=page, page_size=20),
+        rounds=50,
+    )
+
+    # Assert
+    assert result.rows == 20 * len(result.latencies)
@@ -0,0 +1,151 @@
+from datetime import datetime
+
+import pytest
+
+from src.repository.muscle_group_repository import MuscleGroupRepository
+
+pytestmark = pytest.mark.benchmark
+
+
+def group_key(benchmark_data: dict, i: int) -> tuple[str, int]:
+    # Spread the calls over every user, skipping the soft-deleted groups
+    user_id = i * 7919 % benchmark_data["users"] + 1
+    group = i % benchmark_data["groups"] + 1
+    if group % benchmark_data["deleted_every"] == 0:
+        group -= 1
+    return f"Grupo {group:02d}", user_id
+
+
+@pytest.mark.asyncio
+async def test_bench_get_muscle_group_by_name(mock_async_session, bench, benchmark_data):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+
+    # Act
+    result = await bench("muscle_group.get_by_name", lambda i: repo.get_muscle_group_by_name(*group_key(benchmark_data, i)))
+
+    # Assert
+    assert result.rows == len(result.latencies)
+
+
+@pytest.mark.asyncio
+async def test_bench_get_all_muscle_groups(mock_async_session, bench, benchmark_data):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+
+    # Act
+    result = await bench("muscle_group.get_all", lambda i: repo.get_all_muscle_groups(), rounds=5, warmup=1)
+
+    # Assert
+    assert result.rows > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("depth", [0.0, 0.5, 0.99])
+async def test_bench_get_muscle_groups_page(mock_async_session, bench, benchmark_data, depth):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+    after = None if depth == 0 else [int(benchmark_data["users"] * depth), "Grupo 01"]
+
+    # Act
+    result = await bench(
+        f"muscle_group.get_page[depth={depth:.0%}]", lambda i: repo.get_muscle_groups_page(after, page_size=20)
+    )
+
+    # Assert
+    assert result.rows == 20 * len(result.latencies)
+
+
+@pytest.mark.asyncio
+async def test_bench_create_muscle_group(mock_async_session, bench, benchmark_data):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+
+    # Act
+    result = await bench(
+        "muscle_group.create",
+        lambda i: repo.create_muscle_group({"group_name": f"Novo {i}", "user_id": 1, "created_at": datetime.now()}),
+    )
+
+    # Assert
+    assert result.rows == len(result.latencies)
+
+
+@pytest.mark.asyncio
+async def test_bench_update_muscle_group(mock_async_session, bench, benchmark_data):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+
+    # Act
+    result = await bench(
+        "muscle_group.update",
+        lambda i: repo.update_muscle_group(*group_key(benchmark_data, i), {"deleted_at": None}),
+    )
+
+    # Assert
+    assert result.rows == len(result.latencies)
+
+
+@pytest.mark.asyncio
+async def test_bench_delete_muscle_group(mock_async_session, bench, benchmark_data):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+
+    # Act
+    result = await bench("muscle_group.delete", lambda i: repo.delete_muscle_group("Grupo 01", i + 1))
+
+    # Assert
+    assert result.rows == len(result.latencies)
+
+
+@pytest.mark.asyncio
+async def test_bench_bulk_create_muscle_groups(mock_async_session, bench, benchmark_data):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+
+    # Act
+    result = await bench(
+        "muscle_group.bulk_create[100]",
+        lambda i: repo.bulk_create_muscle_groups([{"group_name": f"Lote {i}.{j}", "user_id": 1} for j in range(100)]),
+        rounds=50,
+    )
+
+    # Assert
+    assert result.rows == 100 * len(result.latencies)
+
+
+@pytest.mark.asyncio
+async def test_bench_bulk_update_muscle_groups(mock_async_session, bench, benchmark_data):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+
+    def changes(i: int) -> list[dict]:
+        # Move every group of user i + 1 to a user past the seeded ones, each round moves a distinct user
+        user_id = i + 1
+        return [
+            {"group_name": f"Grupo {g:02d}", "current_user_id": user_id, "user_id": benchmark_data["users"] + user_id}
+            for g in range(1, benchmark_data["groups"] + 1)
+        ]
+
+    # Act
+    result = await bench(
+        "muscle_group.bulk_update[user]", lambda i: repo.bulk_update_muscle_groups(changes(i)), rounds=50
+    )
+
+    # Assert
+    assert result.rows > 0
+
+
+@pytest.mark.asyncio
+async def test_bench_bulk_delete_muscle_groups(mock_async_session, bench, benchmark_data):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+
+    def keys(i: int) -> list[tuple[int, str]]:
+        return [(i + 1, f"Grupo {g:02d}") for g in range(1, benchmark_data["groups"] + 1)]
+
+    # Act
+    result = await bench("muscle_group.bulk_delete[user]", lambda i: repo.bulk_delete_muscle_groups(keys(i)), rounds=50)
+
+    # Assert
+    assert result.rows > 0
@@ -0,0 +1,63 @@
+from datetime import datetime
+
+import pytest
+
+from src.repository.muscle_repository import MuscleRepository
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.asyncio
+async def test_bench_get_muscle_by_id(mock_async_session, bench, benchmark_data):
+    # Arrange
+    repo = MuscleRepository(mock_async_session)
+    muscles = benchmark_data["users"] * benchmark_data["muscles"]
+
+    # Act
+    result = await bench("muscle.get_by_id", lambda i: repo.get_muscle_by_id(i * 7919 % muscles + 1))
+
+    # Assert
+    assert result.rows == len(result.latencies)
+
+
+@pytest.mark.asyncio
+async def test_bench_get_all_muscles(mock_async_session, bench, benchmark_data):
+    # Arrange
+    repo = MuscleRepository(mock_async_session)
+
+    # Act
+    result = await bench("muscle.get_all", lambda i: repo.get_all_muscles(), rounds=5, warmup=1)
+
+    # Assert
+    assert result.rows > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("depth", [0.0, 0.5, 0.99])
+async def test_bench_get_muscles_page(mock_async_session, bench, benchmark_data, depth):
+    # Arrange
+    repo = MuscleRepository(mock_async_session)
+    after = None if depth == 0 else [int(benchmark_data["users"] * benchmark_data["muscles"] * depth)]
+
+    # Act
+    result = await bench(f"muscle.get_page[depth={depth:.0%}]", lambda i: repo.get_muscles_page(after, page_size=20))
+
+    # Assert
+    assert result.rows == 20 * len(result.latencies)
+
+
+@pytest.mark.asyncio
+async def test_bench_create_muscle(mock_async_session, bench, benchmark_data):
+    # Arrange
+    repo = MuscleRepository(mock_async_session)
+
+    # Act
+    result = await bench(
+        "muscle.create",
+        lambda i: repo.create_muscle(
+            {"group_name": "Grupo 01", "user_id": 1, "muscle_name": f"Novo {i}", "created_at": datetime.now()}
+        ),
+    )
+
+    # Assert
+    assert result.rows == len(result.latencies)
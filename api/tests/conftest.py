@@ -1,6 +1,8 @@
 import asyncio
 import pytest
 import pytest_asyncio
+from redis.asyncio import Redis
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from src.models.base_models import BaseOrmModel
 from typing import AsyncGenerator
@@ -8,6 +10,11 @@ from src.config import SETTINGS
 
 engine = create_async_engine(SETTINGS.POSTGRES_TEST_URL, echo=False)
 
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark", "repository benchmarks, see tests/benchmarks")
+    group.addoption("--benchmark-save", metavar="PATH", help="save the benchmark results as a JSON baseline")
+    group.addoption("--benchmark-compare", metavar="PATH", help="report benchmarks slower than this baseline")
+
 @pytest.fixture(scope="session")
 def event_loop():
     """
@@ -35,7 +42,32 @@ async def mock_async_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Fixture que cria e injeta AsyncSessions para os testes. Cada teste recebe uma sessão isolada que é descartada após o teste.
     """
-    async with AsyncSession(bind=engine) as session:
-        transaction = await session.begin()
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        # Commits issued by the code under test only release a savepoint, the outer transaction is always rolled back
+        async with AsyncSession(bind=conn, join_transaction_mode="create_savepoint") as session:
+            yield session
+        await transaction.rollback()
+
+@pytest_asyncio.fixture
+async def committed_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Fixture que injeta uma AsyncSession cujos commits são reais, para testes que dependem de outras
+    transações enxergarem os dados. As tabelas são esvaziadas após o teste.
+    """
+    async with AsyncSession(engine, expire_on_commit=False) as session:
         yield session
-        await transaction.rollback()
\ No newline at end of file
+
+    tables = ", ".join(f'"{table.name}"' for table in BaseOrmModel.metadata.sorted_tables)
+    async with engine.begin() as conn:
+        await conn.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+
+@pytest_asyncio.fixture
+async def mock_redis() -> AsyncGenerator[Redis, None]:
+    """
+    Fixture que injeta um cliente Redis apontando para o banco de testes. O banco é limpo após cada teste.
+    """
+    redis = Redis.from_url(SETTINGS.REDIS_TEST_URL, decode_responses=True)
+    yield redis
+    await redis.flushdb()
+    await redis.aclose()
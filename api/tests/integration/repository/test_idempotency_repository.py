@@ -0,0 +1,37 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import update
+
+from src.models import IdempotencyKey
+from src.repository.idempotency_repository import IdempotencyRepository
+
+@pytest.mark.asyncio
+async def test_claim_only_succeeds_once(mock_async_session):
+    # Arrange
+    repo = IdempotencyRepository(mock_async_session)
+
+    # Act
+    first = await repo.claim("key", "hash")
+    second = await repo.claim("key", "other-hash")
+
+    # Assert
+    assert (first, second) == (True, False)
+    assert (await repo.get("key")).request_hash == "hash"
+
+@pytest.mark.asyncio
+async def test_purge_deletes_only_expired_keys(mock_async_session):
+    # Arrange
+    repo = IdempotencyRepository(mock_async_session)
+    await repo.claim("old", "hash")
+    await repo.claim("new", "hash")
+    await mock_async_session.execute(
+        update(IdempotencyKey).where(IdempotencyKey.key == "old").values(created_at=datetime.now() - timedelta(days=3))
+    )
+
+    # Act
+    deleted = await repo.purge(datetime.now() - timedelta(days=2))
+
+    # Assert
+    assert deleted == 1
+    assert await repo.get("old") is None
+    assert await repo.get("new") is not None
@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy import text
+
+from src.repository.muscle_group_repository import MuscleGroupRepository
+from src.utils.constraints import DatabaseConstraints
+from tests.factories.muscle_group_factory import MuscleGroupFactory
+from tests.query_plans import explain_call
+
+async def seed_muscle_groups(session):
+    # Enough rows for the planner to prefer an index, a few of them soft-deleted
+    await session.execute(
+        text(
+            "INSERT INTO muscle_group (user_id, group_name, deleted, created_at, deleted_at) "
+            "SELECT i % 50, 'Grupo extra ' || i, i % 10 = 0, now(), NULL FROM generate_series(1, 5000) i"
+        )
+    )
+    for i in range(5):
+        session.add(MuscleGroupFactory.build(user_id=1, group_name=f"Grupo {i}", deleted=False))
+    await session.flush()
+    await session.execute(text("ANALYZE muscle_group"))
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+
+@pytest.mark.asyncio
+async def test_get_muscle_group_by_name_uses_primary_key(mock_async_session):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+    await seed_muscle_groups(mock_async_session)
+
+    # Act
+    plan = await explain_call(mock_async_session, lambda: repo.get_muscle_group_by_name("Grupo 1", 1))
+
+    # Assert
+    assert DatabaseConstraints.MuscleGroup.PRIMARY_KEY in plan
+
+@pytest.mark.asyncio
+async def test_get_muscle_groups_page_uses_primary_key(mock_async_session):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+    await seed_muscle_groups(mock_async_session)
+
+    # Act
+    first_page = await explain_call(mock_async_session, lambda: repo.get_muscle_groups_page(page_size=2))
+    next_page = await explain_call(
+        mock_async_session, lambda: repo.get_muscle_groups_page(after=[1, "Grupo 1"], page_size=2)
+    )
+
+    # Assert
+    assert DatabaseConstraints.MuscleGroup.PRIMARY_KEY in first_page
+    assert DatabaseConstraints.MuscleGroup.PRIMARY_KEY in next_page
+    assert "Sort" not in next_page
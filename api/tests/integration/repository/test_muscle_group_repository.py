@@ -1,8 +1,11 @@
 import pytest
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from datetime import datetime
 
+from src.models import MuscleGroup
 from src.repository.muscle_group_repository import MuscleGroupRepository
+from src.utils.pagination import decode_cursor
 from tests.factories.muscle_group_factory import MuscleGroupFactory
 
 @pytest.mark.asyncio
@@ -29,6 +32,27 @@ async def test_get_all_muscle_groups(mock_async_session):
     assert any(mg.group_name == groups[0].group_name for mg in muscle_groups)
     assert not any(mg.group_name == groups[1].group_name for mg in muscle_groups)
 
+@pytest.mark.asyncio
+async def test_get_muscle_groups_page_walks_all_pages(mock_async_session):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+    names = [f"Grupo {i:02d}" for i in range(5)]
+    for name in names:
+        mock_async_session.add(MuscleGroupFactory.build(user_id=1, group_name=name, deleted=False))
+    await mock_async_session.flush()
+
+    # Act
+    seen, after = [], None
+    while True:
+        page, cursor = await repo.get_muscle_groups_page(after, page_size=2)
+        seen.extend(mg.group_name for mg in page if mg.user_id == 1)
+        if cursor is None:
+            break
+        after = decode_cursor(cursor)
+
+    # Assert
+    assert seen == names
+
 @pytest.mark.asyncio
 async def test_create_muscle_group_success(mock_async_session):
     # Arrange
@@ -160,3 +184,121 @@ async def test_delete_muscle_group_not_found(mock_async_session):
 
     # Assert
     assert result is None
+
+@pytest.mark.asyncio
+async def test_bulk_create_muscle_groups_skips_conflicts(mock_async_session):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+    mock_async_session.add(MuscleGroupFactory.build(user_id=1, group_name="Peito", deleted=False))
+    await mock_async_session.flush()
+
+    data = [
+        {"user_id": 1, "group_name": "Peito"},
+        {"user_id": 1, "group_name": "Costas"},
+        {"user_id": 1, "group_name": "Pernas"},
+    ]
+
+    # Act
+    result = await repo.bulk_create_muscle_groups(data)
+
+    # Assert
+    assert sorted(mg.group_name for mg in result) == ["Costas", "Pernas"]
+
+@pytest.mark.asyncio
+async def test_bulk_create_muscle_groups_restores_soft_deleted(mock_async_session):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+    mock_async_session.add(
+        MuscleGroupFactory.build(user_id=1, group_name="Peito", deleted=True, deleted_at=datetime(2024, 1, 1))
+    )
+    await mock_async_session.flush()
+
+    # Act
+    result = await repo.bulk_create_muscle_groups(
+        [{"user_id": 1, "group_name": "Peito"}, {"user_id": 1, "group_name": "Peito"}]
+    )
+
+    # Assert
+    assert len(result) == 1
+    assert result[0].deleted is False
+    assert result[0].deleted_at is None
+
+@pytest.mark.asyncio
+async def test_bulk_update_muscle_groups_returns_matched_rows(mock_async_session):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+    mock_async_session.add(MuscleGroupFactory.build(user_id=1, group_name="Ombros", deleted=False))
+    await mock_async_session.flush()
+
+    data = [
+        {"group_name": "Ombros", "current_user_id": 1, "user_id": 2},
+        {"group_name": "Nonexistent", "current_user_id": 1, "user_id": 2},
+    ]
+
+    # Act
+    result = await repo.bulk_update_muscle_groups(data)
+
+    # Assert
+    assert len(result) == 1
+    assert result[0].group_name == "Ombros"
+    assert result[0].current_user_id == 1
+    assert result[0].user_id == 2
+
+@pytest.mark.asyncio
+async def test_bulk_update_muscle_groups_skips_taken_keys(mock_async_session):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+    mock_async_session.add_all([
+        MuscleGroupFactory.build(user_id=1, group_name="Ombros", deleted=False),
+        MuscleGroupFactory.build(user_id=1, group_name="Peito", deleted=False),
+        MuscleGroupFactory.build(user_id=2, group_name="Ombros", deleted=False),
+    ])
+    await mock_async_session.flush()
+
+    data = [
+        {"group_name": "Ombros", "current_user_id": 1, "user_id": 2},
+        {"group_name": "Peito", "current_user_id": 1, "user_id": 1},
+    ]
+
+    # Act
+    result = await repo.bulk_update_muscle_groups(data)
+
+    # Assert
+    assert [(row.group_name, row.user_id) for row in result] == [("Peito", 1)]
+    assert await repo.get_live_keys([(1, "Ombros"), (2, "Ombros"), (1, "Peito")]) == {(1, "Ombros"), (2, "Ombros"), (1, "Peito")}
+
+@pytest.mark.asyncio
+async def test_bulk_update_muscle_groups_leaves_old_key_soft_deleted(mock_async_session):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+    mock_async_session.add_all([
+        MuscleGroupFactory.build(user_id=1, group_name="Ombros", deleted=False),
+        MuscleGroupFactory.build(user_id=2, group_name="Ombros", deleted=True),
+    ])
+    await mock_async_session.flush()
+
+    # Act
+    result = await repo.bulk_update_muscle_groups([{"group_name": "Ombros", "current_user_id": 1, "user_id": 2}])
+
+    # Assert
+    assert [(row.user_id, row.deleted, row.current_user_id) for row in result] == [(2, False, 1)]
+    rows = await mock_async_session.execute(
+        select(MuscleGroup.user_id, MuscleGroup.deleted).where(MuscleGroup.group_name == "Ombros").order_by(MuscleGroup.user_id)
+    )
+    assert rows.all() == [(1, True), (2, False)]
+
+@pytest.mark.asyncio
+async def test_bulk_delete_muscle_groups_soft_deletes(mock_async_session):
+    # Arrange
+    repo = MuscleGroupRepository(mock_async_session)
+    mock_async_session.add(MuscleGroupFactory.build(user_id=1, group_name="Cardio", deleted=False))
+    mock_async_session.add(MuscleGroupFactory.build(user_id=1, group_name="Abdômen", deleted=True))
+    await mock_async_session.flush()
+
+    # Act
+    result = await repo.bulk_delete_muscle_groups([(1, "Cardio"), (1, "Abdômen")])
+
+    # Assert
+    assert [mg.group_name for mg in result] == ["Cardio"]
+    assert result[0].deleted is True
+    assert isinstance(result[0].deleted_at, datetime)
@@ -0,0 +1,147 @@
+import pytest
+from datetime import date
+from sqlalchemy import select
+
+from src.models import Exercise, PersonalRecord, SplitSetReport, User, WorkoutPlan, WorkoutReport, WorkoutSplit
+from src.repository.personal_record_repository import PersonalRecordRepository
+from src.repository.set_report_repository import SetReportRepository
+
+async def create_workout_reports(session, *report_dates: date):
+    user = User(email="records@test.com", name="Recordes", password="hash")
+    session.add(user)
+    await session.flush()
+
+    bench = Exercise(user_id=user.id, exercise_name="Supino")
+    squat = Exercise(user_id=user.id, exercise_name="Agachamento")
+    plan = WorkoutPlan(user_id=user.id, workout_plan_name="Plano", workout_plan_goal="Força")
+    session.add_all([bench, squat, plan])
+    await session.flush()
+
+    session.add(WorkoutSplit(split="A", workout_plan_id=plan.id))
+    await session.flush()
+
+    reports = [WorkoutReport(report_date=day, workout_plan_id=plan.id, split="A") for day in report_dates]
+    session.add_all(reports)
+    await session.flush()
+
+    return user, (bench, squat), reports
+
+def set_report(report, exercise, set_number, reps, weight):
+    return {
+        "workout_report_id": report.id,
+        "exercise_id": exercise.id,
+        "split": "A",
+        "execution_order": 1,
+        "set_number": set_number,
+        "reps": reps,
+        "weight": weight,
+        "notes": None,
+    }
+
+def columns(record: PersonalRecord) -> dict:
+    return {column.key: getattr(record, column.key) for column in PersonalRecord.__table__.columns}
+
+async def get_records(session, user_id):
+    result = await session.execute(
+        select(PersonalRecord).where(PersonalRecord.user_id == user_id).order_by(PersonalRecord.exercise_id)
+    )
+    return [columns(record) for record in result.scalars().all()]
+
+@pytest.mark.asyncio
+async def test_create_set_reports_keeps_best_sets(mock_async_session):
+    # Arrange
+    repo = SetReportRepository(mock_async_session)
+    user, (bench, squat), (first, second) = await create_workout_reports(
+        mock_async_session, date(2026, 10, 12), date(2026, 10, 19)
+    )
+
+    # Act
+    await repo.create_set_reports(
+        [
+            set_report(first, bench, 1, "10", 80),
+            set_report(first, bench, 2, "3", 95),
+            set_report(first, bench, 3, "falha", 120),
+            set_report(first, squat, 1, "5", 100),
+        ]
+    )
+    await repo.create_set_reports([set_report(second, bench, 1, "1", 100), set_report(second, bench, 2, "12", 70)])
+
+    # Assert
+    bench_record, squat_record = await get_records(mock_async_session, user.id)
+    assert (bench_record["max_weight"], bench_record["max_weight_reps"]) == (100, 1)
+    assert bench_record["max_weight_report_id"] == second.id
+    # 80 x 10 estimates 106.7, more than the single at 100 and 95 x 3 (104.5)
+    assert bench_record["best_one_rep_max"] == pytest.approx(80 * (1 + 10 / 30))
+    assert bench_record["best_one_rep_max_report_id"] == first.id
+    # 70 x 12 = 840 beats 80 x 10 = 800
+    assert (bench_record["best_set_volume"], bench_record["best_set_volume_weight"]) == (840, 70)
+    assert bench_record["best_set_volume_report_id"] == second.id
+    assert (squat_record["max_weight"], squat_record["best_set_volume"]) == (100, 500)
+
+@pytest.mark.asyncio
+async def test_weaker_sets_leave_records_untouched(mock_async_session):
+    # Arrange
+    repo = SetReportRepository(mock_async_session)
+    user, (bench, _), (first, second) = await create_workout_reports(
+        mock_async_session, date(2026, 10, 12), date(2026, 10, 19)
+    )
+    await repo.create_set_reports([set_report(first, bench, 1, "5", 100)])
+    before = await get_records(mock_async_session, user.id)
+    mock_async_session.expunge_all()
+
+    # Act
+    await repo.create_set_reports([set_report(second, bench, 1, "5", 100), set_report(second, bench, 2, "8", 60)])
+
+    # Assert
+    assert await get_records(mock_async_session, user.id) == before
+
+@pytest.mark.asyncio
+async def test_rebuild_matches_incremental_records(mock_async_session):
+    # Arrange
+    repo = SetReportRepository(mock_async_session)
+    record_repo = PersonalRecordRepository(mock_async_session)
+    user, (bench, squat), (first, second) = await create_workout_reports(
+        mock_async_session, date(2026, 10, 12), date(2026, 10, 19)
+    )
+    await repo.create_set_reports(
+        [
+            set_report(first, bench, 1, "8", 82.5),
+            set_report(first, squat, 1, " 6 ", 120),
+            set_report(first, squat, 2, "8-10", 140),
+        ]
+    )
+    await repo.create_set_reports([set_report(second, bench, 1, "2", 95), set_report(second, squat, 1, "3", 130)])
+    incremental = await get_records(mock_async_session, user.id)
+    mock_async_session.expunge_all()
+
+    # Act
+    rows = await record_repo.rebuild(user.id)
+
+    # Assert
+    rebuilt = await get_records(mock_async_session, user.id)
+    assert rows == 2
+    assert rebuilt == incremental
+
+@pytest.mark.asyncio
+async def test_rebuild_one_exercise_after_report_deleted(mock_async_session):
+    # Arrange
+    repo = SetReportRepository(mock_async_session)
+    record_repo = PersonalRecordRepository(mock_async_session)
+    user, (bench, squat), (first, second) = await create_workout_reports(
+        mock_async_session, date(2026, 10, 12), date(2026, 10, 19)
+    )
+    await repo.create_set_reports([set_report(first, bench, 1, "5", 100), set_report(first, squat, 1, "5", 140)])
+    await repo.create_set_reports([set_report(second, bench, 1, "5", 110)])
+    await mock_async_session.execute(
+        SplitSetReport.__table__.delete().where(SplitSetReport.workout_report_id == second.id)
+    )
+    mock_async_session.expunge_all()
+
+    # Act
+    rows = await record_repo.rebuild(user.id, {bench.id})
+
+    # Assert
+    bench_record, squat_record = await get_records(mock_async_session, user.id)
+    assert rows == 1
+    assert (bench_record["max_weight"], bench_record["max_weight_report_id"]) == (100, first.id)
+    assert squat_record["max_weight"] == 140
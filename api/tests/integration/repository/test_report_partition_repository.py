@@ -0,0 +1,169 @@
+import pytest
+from datetime import date
+from sqlalchemy import delete, select, text
+
+from src.models import Exercise, PersonalRecord, SplitSetReport, User, WeeklyVolume, WorkoutPlan, WorkoutReport, WorkoutSplit
+from src.repository.personal_record_repository import PersonalRecordRepository
+from src.repository.report_partition_repository import ReportPartitionRepository, month_start
+from src.repository.set_report_repository import SetReportRepository
+from src.repository.weekly_volume_repository import WeeklyVolumeRepository
+
+async def create_workout_reports(session, *report_dates: date):
+    user = User(email="partitions@test.com", name="Partições", password="hash")
+    session.add(user)
+    await session.flush()
+
+    exercise = Exercise(user_id=user.id, exercise_name="Supino")
+    plan = WorkoutPlan(user_id=user.id, workout_plan_name="Plano", workout_plan_goal="Força")
+    session.add_all([exercise, plan])
+    await session.flush()
+
+    session.add(WorkoutSplit(split="A", workout_plan_id=plan.id))
+    await session.flush()
+
+    reports = [WorkoutReport(report_date=day, workout_plan_id=plan.id, split="A") for day in report_dates]
+    session.add_all(reports)
+    await session.flush()
+
+    await SetReportRepository(session).create_set_reports(
+        [
+            {
+                "workout_report_id": report.id,
+                "exercise_id": exercise.id,
+                "split": "A",
+                "execution_order": 1,
+                "set_number": 1,
+                "reps": "10",
+                "weight": 50,
+                "notes": None,
+            }
+            for report in reports
+        ]
+    )
+    return [report.id for report in reports]
+
+async def partitions_of(session, table: str) -> dict[int, str]:
+    """
+    Partition holding each workout report ID of a table, or the table itself once detached.
+    """
+
+    column = "workout_report_id" if table.startswith("split_set_report") else "id"
+    result = await session.execute(text(f"SELECT {column}, tableoid::regclass::text FROM {table}"))
+    return dict(result.all())
+
+async def explain(session, query) -> str:
+    compiled = query.compile(compile_kwargs={"literal_binds": True})
+    result = await session.execute(text(f"EXPLAIN (COSTS OFF) {compiled}"))
+    return "\n".join(result.scalars().all())
+
+def test_month_start():
+    assert month_start(date(2026, 10, 17)) == date(2026, 10, 1)
+    assert month_start(date(2026, 12, 31), 1) == date(2027, 1, 1)
+    assert month_start(date(2026, 1, 15), -1) == date(2025, 12, 1)
+
+@pytest.mark.asyncio
+async def test_create_partitions_moves_rows_out_of_default(mock_async_session):
+    # Arrange
+    repo = ReportPartitionRepository(mock_async_session)
+    september, october = await create_workout_reports(mock_async_session, date(2026, 9, 30), date(2026, 10, 1))
+
+    # Act
+    created = await repo.create_partitions(date(2026, 9, 15), 2)
+    again = await repo.create_partitions(date(2026, 9, 1), 2)
+
+    # Assert
+    assert (created, again) == (2, 0)
+    assert await repo.get_partitions() == [date(2026, 9, 1), date(2026, 10, 1)]
+    assert await partitions_of(mock_async_session, "workout_report") == {
+        september: "workout_report_y2026m09",
+        october: "workout_report_y2026m10",
+    }
+    assert await partitions_of(mock_async_session, "split_set_report") == {
+        september: "split_set_report_y2026m09",
+        october: "split_set_report_y2026m10",
+    }
+
+@pytest.mark.asyncio
+async def test_date_bounded_queries_only_scan_their_partitions(mock_async_session):
+    # Arrange
+    repo = ReportPartitionRepository(mock_async_session)
+    await repo.create_partitions(date(2026, 8, 1), 3)
+    query = (
+        select(SplitSetReport.weight)
+        .join(
+            WorkoutReport,
+            (WorkoutReport.id == SplitSetReport.workout_report_id)
+            & (WorkoutReport.report_date == SplitSetReport.report_date),
+        )
+        .where(
+            WorkoutReport.report_date >= date(2026, 10, 5),
+            SplitSetReport.report_date >= date(2026, 10, 5),
+            WorkoutReport.report_date < date(2026, 10, 19),
+            SplitSetReport.report_date < date(2026, 10, 19),
+        )
+    )
+
+    # Act
+    plan = await explain(mock_async_session, query)
+
+    # Assert
+    assert "workout_report_y2026m10" in plan
+    assert "split_set_report_y2026m10" in plan
+    assert "y2026m08" not in plan
+    assert "y2026m09" not in plan
+    assert "_default" not in plan
+
+@pytest.mark.asyncio
+async def test_detach_partitions_keeps_old_months_as_standalone_tables(mock_async_session):
+    # Arrange
+    repo = ReportPartitionRepository(mock_async_session)
+    september, october = await create_workout_reports(mock_async_session, date(2026, 9, 10), date(2026, 10, 10))
+    await repo.create_partitions(date(2026, 9, 1), 2)
+
+    # Act
+    detached = await repo.detach_partitions(date(2026, 10, 15))
+
+    # Assert
+    assert detached == [date(2026, 9, 1)]
+    assert await repo.get_partitions() == [date(2026, 10, 1)]
+    assert set(await partitions_of(mock_async_session, "workout_report")) == {october}
+    assert set(await partitions_of(mock_async_session, "split_set_report")) == {october}
+    assert set(await partitions_of(mock_async_session, "workout_report_y2026m09")) == {september}
+    assert set(await partitions_of(mock_async_session, "split_set_report_y2026m09")) == {september}
+
+@pytest.mark.asyncio
+async def test_rebuilds_keep_rollups_of_detached_months(mock_async_session):
+    # Arrange
+    repo = ReportPartitionRepository(mock_async_session)
+    september, october = await create_workout_reports(mock_async_session, date(2026, 9, 10), date(2026, 10, 13))
+    await repo.create_partitions(date(2026, 9, 1), 2)
+    await repo.detach_partitions(date(2026, 10, 5))
+    await mock_async_session.execute(delete(SplitSetReport).where(SplitSetReport.workout_report_id == october))
+    mock_async_session.expunge_all()
+
+    # Act
+    record_rows = await PersonalRecordRepository(mock_async_session).rebuild()
+    volume_rows = await WeeklyVolumeRepository(mock_async_session).rebuild()
+
+    # Assert
+    record = (await mock_async_session.execute(select(PersonalRecord))).scalar_one()
+    assert record_rows == 1
+    assert (record.max_weight_report_id, record.max_weight_report_date) == (september, date(2026, 9, 10))
+    assert record.best_set_volume_report_id == september
+    weeks = (await mock_async_session.execute(select(WeeklyVolume.week_start).order_by(WeeklyVolume.week_start)))
+    assert volume_rows == 0
+    assert weeks.scalars().all() == [date(2026, 9, 7)]
+
+@pytest.mark.asyncio
+async def test_get_report_owners_filters_on_report_dates(mock_async_session):
+    # Arrange
+    repo = SetReportRepository(mock_async_session)
+    september, october = await create_workout_reports(mock_async_session, date(2026, 9, 10), date(2026, 10, 13))
+    await ReportPartitionRepository(mock_async_session).create_partitions(date(2026, 9, 1), 2)
+
+    # Act
+    owners = await repo.get_report_owners({september, october}, {date(2026, 10, 13)})
+
+    # Assert
+    assert list(owners) == [october]
+    assert owners[october][1] == date(2026, 10, 13)
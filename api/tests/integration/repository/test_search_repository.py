@@ -0,0 +1,91 @@
+import pytest
+from sqlalchemy import text
+
+from src.models import Exercise, User
+from src.repository.search_repository import SearchRepository
+from src.utils.constraints import DatabaseConstraints
+from tests.query_plans import explain_call
+
+async def seed_exercises(session, *names, user_id=None, deleted=False):
+    exercises = [Exercise(user_id=user_id, exercise_name=name, deleted=deleted) for name in names]
+    session.add_all(exercises)
+    await session.flush()
+    return exercises
+
+@pytest.mark.asyncio
+async def test_search_catalog_ignores_accents_and_case(mock_async_session):
+    # Arrange
+    repo = SearchRepository(mock_async_session)
+    await seed_exercises(mock_async_session, "Supino Inclinação", "Rosca Direta")
+
+    # Act
+    results = await repo.search_catalog("INCLINACAO", user_id=1)
+
+    # Assert
+    assert [row["name"] for row in results] == ["Supino Inclinação"]
+    assert results[0]["kind"] == "exercise"
+
+@pytest.mark.asyncio
+async def test_search_catalog_tolerates_typos(mock_async_session):
+    # Arrange
+    repo = SearchRepository(mock_async_session)
+    await seed_exercises(mock_async_session, "Agachamento Livre", "Puxada Frontal")
+
+    # Act
+    results = await repo.search_catalog("agachamneto", user_id=1)
+
+    # Assert
+    assert [row["name"] for row in results] == ["Agachamento Livre"]
+
+@pytest.mark.asyncio
+async def test_search_catalog_ranks_closest_matches_first(mock_async_session):
+    # Arrange
+    repo = SearchRepository(mock_async_session)
+    await seed_exercises(mock_async_session, "Remada Baixa", "Remada Curvada", "Rosca Curvada")
+
+    # Act
+    results = await repo.search_catalog("remada curv", user_id=1)
+
+    # Assert
+    assert results[0]["name"] == "Remada Curvada"
+    assert [row["score"] for row in results] == sorted((row["score"] for row in results), reverse=True)
+
+@pytest.mark.asyncio
+async def test_search_catalog_only_returns_visible_live_rows(mock_async_session):
+    # Arrange
+    repo = SearchRepository(mock_async_session)
+    owner = User(email="dono@test.com", name="Dono", password="hash")
+    other = User(email="outro@test.com", name="Outro", password="hash")
+    mock_async_session.add_all([owner, other])
+    await mock_async_session.flush()
+
+    await seed_exercises(mock_async_session, "Stiff Global")
+    await seed_exercises(mock_async_session, "Stiff do Dono", user_id=owner.id)
+    await seed_exercises(mock_async_session, "Stiff de Outro", user_id=other.id)
+    await seed_exercises(mock_async_session, "Stiff Removido", deleted=True)
+
+    # Act
+    results = await repo.search_catalog("stiff", user_id=owner.id)
+
+    # Assert
+    assert {row["name"] for row in results} == {"Stiff Global", "Stiff do Dono"}
+
+@pytest.mark.asyncio
+async def test_search_catalog_uses_trigram_index(mock_async_session):
+    # Arrange
+    repo = SearchRepository(mock_async_session)
+    await seed_exercises(mock_async_session, "Exercício 42")
+    # A catalog big enough that scanning it costs more than the index lookup
+    await mock_async_session.execute(
+        text(
+            "INSERT INTO exercise (exercise_name, deleted, created_at) "
+            "SELECT md5(i::text), false, now() FROM generate_series(1, 20000) i"
+        )
+    )
+    await mock_async_session.execute(text("ANALYZE exercise"))
+
+    # Act
+    plan = await explain_call(mock_async_session, lambda: repo.search_catalog("exercicio 42", user_id=1))
+
+    # Assert
+    assert DatabaseConstraints.Exercise.IDX_NAME_SEARCH in plan
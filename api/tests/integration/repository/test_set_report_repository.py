@@ -0,0 +1,138 @@
+import pytest
+from datetime import date
+from sqlalchemy import delete, select
+
+from src.models import Exercise, SplitSetReport, User, WeeklyVolume, WorkoutPlan, WorkoutReport, WorkoutSplit
+from src.repository.set_report_repository import SetReportRepository
+from src.repository.weekly_volume_repository import WeeklyVolumeRepository
+
+async def create_workout_reports(session, *report_dates: date):
+    user = User(email="volume@test.com", name="Volume", password="hash")
+    session.add(user)
+    await session.flush()
+
+    exercise = Exercise(user_id=user.id, exercise_name="Supino")
+    plan = WorkoutPlan(user_id=user.id, workout_plan_name="Plano", workout_plan_goal="Hipertrofia")
+    session.add_all([exercise, plan])
+    await session.flush()
+
+    session.add(WorkoutSplit(split="A", workout_plan_id=plan.id))
+    await session.flush()
+
+    reports = [WorkoutReport(report_date=day, workout_plan_id=plan.id, split="A") for day in report_dates]
+    session.add_all(reports)
+    await session.flush()
+
+    return user, exercise, reports
+
+def set_report(report, exercise, set_number, reps, weight):
+    return {
+        "workout_report_id": report.id,
+        "exercise_id": exercise.id,
+        "split": "A",
+        "execution_order": 1,
+        "set_number": set_number,
+        "reps": reps,
+        "weight": weight,
+        "notes": None,
+    }
+
+async def get_volume(session, user_id):
+    result = await session.execute(
+        select(WeeklyVolume).where(WeeklyVolume.user_id == user_id).order_by(WeeklyVolume.week_start)
+    )
+    return result.scalars().all()
+
+@pytest.mark.asyncio
+async def test_create_set_reports_updates_weekly_volume_incrementally(mock_async_session):
+    # Arrange
+    repo = SetReportRepository(mock_async_session)
+    # Segunda e sexta da mesma semana, e a segunda seguinte
+    user, exercise, (monday, friday, next_week) = await create_workout_reports(
+        mock_async_session, date(2026, 10, 12), date(2026, 10, 16), date(2026, 10, 19)
+    )
+
+    # Act
+    await repo.create_set_reports([set_report(monday, exercise, 1, "10", 60), set_report(monday, exercise, 2, "8", 70)])
+    await repo.create_set_reports(
+        [set_report(friday, exercise, 1, "falha", 80), set_report(next_week, exercise, 1, "5", 100)]
+    )
+
+    # Assert
+    first_week, second_week = await get_volume(mock_async_session, user.id)
+    assert first_week.week_start == date(2026, 10, 12)
+    assert (first_week.total_sets, first_week.total_reps) == (3, 18)
+    assert first_week.tonnage == 10 * 60 + 8 * 70
+    assert first_week.top_weight == 80
+    assert second_week.week_start == date(2026, 10, 19)
+    assert (second_week.total_sets, second_week.total_reps, second_week.tonnage) == (1, 5, 500)
+
+@pytest.mark.asyncio
+async def test_rebuild_matches_incremental_rollup(mock_async_session):
+    # Arrange
+    repo = SetReportRepository(mock_async_session)
+    volume_repo = WeeklyVolumeRepository(mock_async_session)
+    user, exercise, (monday, next_week) = await create_workout_reports(
+        mock_async_session, date(2026, 10, 12), date(2026, 10, 19)
+    )
+    await repo.create_set_reports(
+        [
+            set_report(monday, exercise, 1, "12", 40),
+            set_report(monday, exercise, 2, " 10 ", 45.5),
+            set_report(next_week, exercise, 1, "8-10", 50),
+        ]
+    )
+    incremental = [
+        (row.week_start, row.total_sets, row.total_reps, row.tonnage, row.top_weight)
+        for row in await get_volume(mock_async_session, user.id)
+    ]
+    mock_async_session.expunge_all()
+
+    # Act
+    rows = await volume_repo.rebuild(user.id)
+
+    # Assert
+    rebuilt = [
+        (row.week_start, row.total_sets, row.total_reps, row.tonnage, row.top_weight)
+        for row in await get_volume(mock_async_session, user.id)
+    ]
+    assert rows == 2
+    assert rebuilt == incremental
+
+@pytest.mark.asyncio
+async def test_get_weekly_volume_only_reads_requested_weeks(mock_async_session):
+    # Arrange
+    repo = SetReportRepository(mock_async_session)
+    volume_repo = WeeklyVolumeRepository(mock_async_session)
+    user, exercise, (old, recent) = await create_workout_reports(
+        mock_async_session, date(2025, 1, 6), date(2026, 10, 12)
+    )
+    await repo.create_set_reports([set_report(old, exercise, 1, "10", 50), set_report(recent, exercise, 1, "10", 60)])
+
+    # Act
+    volume = await volume_repo.get_weekly_volume(user.id, since=date(2026, 10, 5), exercise_id=exercise.id)
+
+    # Assert
+    assert [row.week_start for row in volume] == [date(2026, 10, 12)]
+
+@pytest.mark.asyncio
+async def test_rebuild_since_keeps_older_weeks(mock_async_session):
+    # Arrange
+    repo = SetReportRepository(mock_async_session)
+    volume_repo = WeeklyVolumeRepository(mock_async_session)
+    user, exercise, (old, recent) = await create_workout_reports(
+        mock_async_session, date(2025, 1, 6), date(2026, 10, 12)
+    )
+    await repo.create_set_reports([set_report(old, exercise, 1, "10", 50), set_report(recent, exercise, 1, "10", 60)])
+    await mock_async_session.execute(delete(SplitSetReport).where(SplitSetReport.workout_report_id == old.id))
+    mock_async_session.expunge_all()
+
+    # Act
+    rows = await volume_repo.rebuild(user.id, since=date(2026, 10, 14))
+
+    # Assert
+    assert rows == 1
+    assert [row.week_start for row in await get_volume(mock_async_session, user.id)] == [
+        date(2025, 1, 6),
+        date(2026, 10, 12),
+    ]
@@ -0,0 +1,132 @@
+import pytest
+from sqlalchemy import event, insert, update
+
+from src.models import (
+    Equipment,
+    Exercise,
+    Muscle,
+    MuscleGroup,
+    User,
+    WorkoutPlan,
+    WorkoutSplit,
+    assoc_exercise_equipment,
+    assoc_exercise_muscle,
+    assoc_split_exercise,
+)
+from src.repository.workout_plan_repository import WorkoutPlanRepository
+from tests.conftest import engine
+
+async def create_plan(session):
+    user = User(email="plan@test.com", name="Plano", password="hash")
+    session.add(user)
+    await session.flush()
+
+    session.add(MuscleGroup(user_id=user.id, group_name="Peito"))
+    await session.flush()
+
+    bench = Exercise(user_id=user.id, exercise_name="Supino")
+    fly = Exercise(user_id=user.id, exercise_name="Crucifixo")
+    chest = Muscle(group_name="Peito", user_id=user.id, muscle_name="Peitoral maior")
+    barbell = Equipment(user_id=user.id, group_name="Peito", equipment_name="Barra")
+    plan = WorkoutPlan(user_id=user.id, workout_plan_name="Plano", workout_plan_goal="Força")
+    session.add_all([bench, fly, chest, barbell, plan])
+    await session.flush()
+
+    session.add_all([WorkoutSplit(split="A", workout_plan_id=plan.id), WorkoutSplit(split="B", workout_plan_id=plan.id)])
+    await session.flush()
+
+    await session.execute(insert(assoc_exercise_muscle).values(exercise_id=bench.id, muscle_id=chest.id))
+    await session.execute(insert(assoc_exercise_equipment).values(exercise_id=bench.id, equipment_id=barbell.id))
+    await session.execute(
+        insert(assoc_split_exercise),
+        [
+            {"workout_plan_id": plan.id, "split": "A", "exercise_id": fly.id, "execution_order": 2, "sets": 3, "reps": "12", "rest_time": 60},
+            {"workout_plan_id": plan.id, "split": "A", "exercise_id": bench.id, "execution_order": 1, "sets": 4, "reps": "8", "rest_time": 90},
+        ],
+    )
+
+    return plan.id, bench.id, fly.id, chest.id, barbell.id
+
+@pytest.mark.asyncio
+async def test_get_plan_tree_builds_whole_plan_in_order(mock_async_session):
+    # Arrange
+    repo = WorkoutPlanRepository(mock_async_session)
+    plan_id, bench_id, fly_id, chest_id, barbell_id = await create_plan(mock_async_session)
+
+    # Act
+    tree = await repo.get_plan_tree(plan_id)
+
+    # Assert
+    assert tree["id"] == plan_id
+    assert tree["workoutPlanName"] == "Plano"
+    assert [split["split"] for split in tree["splits"]] == ["A", "B"]
+    first, second = tree["splits"][0]["exercises"]
+    assert (first["executionOrder"], first["exerciseId"], first["sets"], first["reps"], first["restTime"]) == (1, bench_id, 4, "8", 90)
+    assert first["muscles"] == [{"id": chest_id, "muscleName": "Peitoral maior", "groupName": "Peito"}]
+    assert first["equipment"] == [{"id": barbell_id, "equipmentName": "Barra"}]
+    assert (second["exerciseId"], second["muscles"], second["equipment"]) == (fly_id, [], [])
+    assert tree["splits"][1]["exercises"] == []
+
+@pytest.mark.asyncio
+async def test_get_plan_tree_runs_a_single_query(mock_async_session):
+    # Arrange
+    repo = WorkoutPlanRepository(mock_async_session)
+    plan_id, *_ = await create_plan(mock_async_session)
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+
+    # Act
+    try:
+        await repo.get_plan_tree(plan_id)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+
+    # Assert
+    assert len(statements) == 1
+
+@pytest.mark.asyncio
+async def test_get_plan_tree_skips_deleted_rows(mock_async_session):
+    # Arrange
+    repo = WorkoutPlanRepository(mock_async_session)
+    plan_id, bench_id, *_ = await create_plan(mock_async_session)
+    await mock_async_session.execute(
+        update(assoc_split_exercise).where(assoc_split_exercise.c.exercise_id == bench_id).values(deleted=1)
+    )
+    await mock_async_session.execute(
+        update(WorkoutSplit).where(WorkoutSplit.workout_plan_id == plan_id, WorkoutSplit.split == "B").values(deleted=True)
+    )
+
+    # Act
+    tree = await repo.get_plan_tree(plan_id)
+    await mock_async_session.execute(update(WorkoutPlan).where(WorkoutPlan.id == plan_id).values(deleted=True))
+    deleted = await repo.get_plan_tree(plan_id)
+
+    # Assert
+    assert [split["split"] for split in tree["splits"]] == ["A"]
+    assert [exercise["exerciseName"] for exercise in tree["splits"][0]["exercises"]] == ["Crucifixo"]
+    assert deleted is None
+
+@pytest.mark.asyncio
+async def test_get_plan_tree_version_changes_with_split_exercises(committed_session):
+    # Arrange
+    repo = WorkoutPlanRepository(committed_session)
+    plan_id, bench_id, *_ = await create_plan(committed_session)
+    await committed_session.commit()
+    before = await repo.get_plan_tree_version(plan_id)
+    await committed_session.commit()
+
+    # Act
+    await committed_session.execute(
+        update(assoc_split_exercise).where(assoc_split_exercise.c.exercise_id == bench_id).values(sets=5)
+    )
+    await committed_session.commit()
+    after = await repo.get_plan_tree_version(plan_id)
+
+    # Assert
+    assert before[1] == after[1] == 7
+    assert after[0] != before[0]
+    assert await repo.get_plan_tree_version(0) == (0, 0)
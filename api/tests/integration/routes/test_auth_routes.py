@@ -0,0 +1,139 @@
+import pytest
+from argon2 import PasswordHasher
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event, select
+from main import app
+from src.connections import db_connection, redis_connection
+from src.config import SETTINGS
+from src.exceptions import PasswordHashingBusy
+from src.models import User
+from src.security.passwords import PASSWORD_SERVICE
+
+@pytest.fixture
+def override_db(mock_async_session, mock_redis):
+    async def _db_connection_override():
+        yield mock_async_session
+
+    async def _redis_connection_override():
+        yield mock_redis
+
+    app.dependency_overrides[db_connection] = _db_connection_override
+    app.dependency_overrides[redis_connection] = _redis_connection_override
+    yield
+    app.dependency_overrides.clear()
+
+async def create_user(session, password_hash: str) -> int:
+    user = User(email="login@test.com", name="Login", password=password_hash)
+    session.add(user)
+    await session.flush()
+    user_id = user.id
+    await session.commit()
+    return user_id
+
+async def login(password: str, keep_login: bool = False):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.post(
+            "/auth/login", json={"email": "login@test.com", "password": password, "keep_login": keep_login}
+        )
+
+@pytest.mark.asyncio
+async def test_login_returns_session_token(override_db, mock_async_session):
+    # Arrange
+    await create_user(mock_async_session, await PASSWORD_SERVICE.hash("segredo"))
+
+    # Act
+    response = await login("segredo", keep_login=True)
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["access_token"]
+    assert "refresh_token" in response.cookies or "refresh_token" in response.headers.get("set-cookie", "")
+
+@pytest.mark.asyncio
+async def test_login_wrong_password(override_db, mock_async_session):
+    # Arrange
+    await create_user(mock_async_session, await PASSWORD_SERVICE.hash("segredo"))
+
+    # Act
+    response = await login("errado")
+
+    # Assert
+    assert response.status_code == 401
+
+@pytest.mark.asyncio
+async def test_login_unknown_email(override_db):
+    # Act
+    response = await login("segredo")
+
+    # Assert
+    assert response.status_code == 401
+
+@pytest.mark.asyncio
+async def test_login_upgrades_outdated_hash(override_db, mock_async_session):
+    # Arrange
+    old_hash = PasswordHasher(time_cost=1, memory_cost=8, parallelism=1).hash("segredo")
+    user_id = await create_user(mock_async_session, old_hash)
+
+    # Act
+    response = await login("segredo")
+
+    # Assert
+    assert response.status_code == 200
+    stored = (await mock_async_session.execute(select(User.password).where(User.id == user_id))).scalar_one()
+    assert stored != old_hash
+    assert PASSWORD_SERVICE.hasher.check_needs_rehash(stored) is False
+
+@pytest.mark.asyncio
+async def test_locked_account_is_rejected_before_database(override_db, mock_async_session):
+    # Arrange
+    await create_user(mock_async_session, await PASSWORD_SERVICE.hash("segredo"))
+    for _ in range(SETTINGS.MAX_LOGIN_ATTEMPTS):
+        assert (await login("errado")).status_code == 401
+
+    queries = []
+    sync_engine = mock_async_session.bind.sync_engine
+    listener = lambda *args: queries.append(args[2])
+    event.listen(sync_engine, "before_cursor_execute", listener)
+
+    # Act
+    try:
+        response = await login("segredo")
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    # Assert
+    assert response.status_code == 429
+    assert "Retry-After" in response.headers
+    assert queries == []
+
+@pytest.mark.asyncio
+async def test_successful_login_resets_account_failures(override_db, mock_async_session, mock_redis):
+    # Arrange
+    await create_user(mock_async_session, await PASSWORD_SERVICE.hash("segredo"))
+    for _ in range(SETTINGS.MAX_LOGIN_ATTEMPTS - 1):
+        await login("errado")
+
+    # Act
+    response = await login("segredo")
+
+    # Assert
+    assert response.status_code == 200
+    assert await mock_redis.exists("login_failures:account:login@test.com") == 0
+    assert (await login("errado")).status_code == 401
+
+@pytest.mark.asyncio
+async def test_attempt_that_could_not_be_checked_is_not_counted(override_db, mock_async_session, mock_redis, monkeypatch):
+    # Arrange
+    await create_user(mock_async_session, await PASSWORD_SERVICE.hash("segredo"))
+
+    async def busy_verify(*args):
+        raise PasswordHashingBusy()
+
+    monkeypatch.setattr(PASSWORD_SERVICE, "verify", busy_verify)
+
+    # Act
+    response = await login("segredo")
+
+    # Assert
+    assert response.status_code == 503
+    assert int(await mock_redis.get("login_failures:account:login@test.com")) == 0
@@ -0,0 +1,32 @@
+import jwt
+import pytest
+from datetime import datetime, timedelta
+from httpx import AsyncClient, ASGITransport
+from main import app
+from src.config import SETTINGS
+from src.connections import redis_connection
+
+@pytest.fixture
+def override_redis(mock_redis):
+    async def _redis_connection_override():
+        yield mock_redis
+
+    app.dependency_overrides[redis_connection] = _redis_connection_override
+    yield
+    app.dependency_overrides.clear()
+
+def session_token(user_id: int = 1) -> str:
+    payload = {"sub": str(user_id), "exp": datetime.now() + timedelta(minutes=5)}
+    return jwt.encode(payload, key=SETTINGS.JWT_SESSION_KEY, algorithm=SETTINGS.JWT_ALGORITHM)
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/metrics/pool", "/metrics/password-hasher", "/metrics/cache", "/metrics/local-cache"])
+async def test_metrics_routes_require_session_token(override_redis, path):
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        anonymous = await client.get(path)
+        signed_in = await client.get(path, headers={"Authorization": f"Bearer {session_token()}"})
+
+    # Assert
+    assert anonymous.status_code in (401, 403)
+    assert signed_in.status_code == 200
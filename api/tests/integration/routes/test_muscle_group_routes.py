@@ -1,18 +1,51 @@
 import pytest
+from unittest.mock import patch
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from main import app
-from src.connections import db_connection
+from src.connections import db_connection, redis_connection
+from src.models import MuscleGroup
+from src.services.muscle_group_service import MuscleGroupService
+from src.utils.cache import VersionedCache
+from src.utils.pagination import encode_cursor
+from tests.conftest import engine
 from tests.factories.muscle_group_factory import MuscleGroupFactory
 
 @pytest.fixture
-def override_db(mock_async_session):
+def override_db(mock_async_session, mock_redis):
     async def _db_connection_override():
         yield mock_async_session
 
+    async def _redis_connection_override():
+        yield mock_redis
+
     app.dependency_overrides[db_connection] = _db_connection_override
+    app.dependency_overrides[redis_connection] = _redis_connection_override
     yield
     app.dependency_overrides.clear()
 
+@pytest.fixture
+def override_committed_db(committed_session, mock_redis):
+    async def _db_connection_override():
+        yield committed_session
+
+    async def _redis_connection_override():
+        yield mock_redis
+
+    app.dependency_overrides[db_connection] = _db_connection_override
+    app.dependency_overrides[redis_connection] = _redis_connection_override
+    yield
+    app.dependency_overrides.clear()
+
+async def get_live_groups(user_id: int) -> list[str]:
+    # A separate session only sees what the route committed
+    async with AsyncSession(engine) as session:
+        result = await session.execute(
+            select(MuscleGroup.group_name).where(MuscleGroup.user_id == user_id, MuscleGroup.deleted == False)
+        )
+        return sorted(result.scalars().all())
+
 @pytest.mark.asyncio
 async def test_get_all_muscle_groups_route(override_db, mock_async_session):
     # Arrange
@@ -27,8 +60,122 @@ async def test_get_all_muscle_groups_route(override_db, mock_async_session):
     # Assert
     assert response.status_code == 200
     data = response.json()
-    assert isinstance(data, list)
-    assert any(item["group_name"] == "Peito" for item in data)
+    assert isinstance(data["items"], list)
+    assert any(item["group_name"] == "Peito" for item in data["items"])
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor([1]), encode_cursor(["1", "Peito"]), encode_cursor([1, 2])])
+async def test_get_all_muscle_groups_route_invalid_cursor(override_db, cursor):
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/groups/", params={"cursor": cursor})
+
+    # Assert
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_get_all_muscle_groups_route_serves_cached_page(override_db, mock_async_session):
+    # Arrange
+    mock_async_session.add(MuscleGroupFactory.build(group_name="Costas", user_id=1, deleted=False))
+    await mock_async_session.flush()
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get("/groups/")
+        cached = await client.get("/groups/")
+
+    # Assert
+    assert cached.status_code == 200
+    assert cached.headers["content-type"] == "application/json"
+    assert cached.content == first.content
+    assert {"groupName": "Costas", "userId": 1, "deleted": False} in cached.json()["items"]
+    assert "nextCursor" in cached.json()
+
+@pytest.mark.asyncio
+async def test_get_all_muscle_groups_route_answers_matching_etag_without_database(override_db, mock_async_session):
+    # Arrange
+    mock_async_session.add(MuscleGroupFactory.build(group_name="Ombros", user_id=1, deleted=False))
+    await mock_async_session.flush()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        etag = (await client.get("/groups/")).headers["etag"]
+
+        async def _no_database():
+            yield None
+
+        app.dependency_overrides[db_connection] = _no_database
+
+        # Act
+        response = await client.get("/groups/", headers={"If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+@pytest.mark.asyncio
+async def test_get_all_muscle_groups_route_sends_weak_etag_for_compressed_bodies(override_db, mock_async_session):
+    # Arrange
+    mock_async_session.add_all(
+        MuscleGroupFactory.build(group_name=f"Grupo {i}", user_id=1, deleted=False) for i in range(50)
+    )
+    await mock_async_session.flush()
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        gzipped = await client.get("/groups/", headers={"Accept-Encoding": "gzip"})
+        identity = await client.get("/groups/", headers={"Accept-Encoding": "identity"})
+
+    # Assert
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in identity.headers
+    assert gzipped.headers["etag"] == identity.headers["etag"]
+    assert gzipped.headers["etag"].startswith('W/"')
+    assert "Accept-Encoding" in identity.headers["vary"]
+
+@pytest.mark.asyncio
+async def test_get_all_muscle_groups_route_sends_rate_limit_headers(override_db):
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/groups/")
+        revalidated = await client.get("/groups/", headers={"If-None-Match": response.headers["etag"]})
+
+    # Assert
+    assert response.status_code == 200
+    assert revalidated.status_code == 304
+    assert int(response.headers["RateLimit-Remaining"]) > int(revalidated.headers["RateLimit-Remaining"])
+    assert "RateLimit-Policy" in revalidated.headers
+
+@pytest.mark.asyncio
+async def test_get_muscle_group_by_name_route_not_modified_keeps_validator_headers(override_db, mock_async_session):
+    # Arrange
+    mock_async_session.add(MuscleGroupFactory.build(group_name="Trapézio", user_id=1, deleted=False))
+    await mock_async_session.flush()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get("/groups/Trapézio", params={"user_id": 1})
+
+        # Act
+        response = await client.get("/groups/Trapézio", params={"user_id": 1}, headers={"If-None-Match": first.headers["etag"]})
+
+    # Assert
+    assert response.status_code == 304
+    assert response.headers["etag"] == first.headers["etag"]
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "RateLimit-Remaining" in response.headers
+
+@pytest.mark.asyncio
+async def test_get_all_muscle_groups_route_etag_changes_after_write(override_db):
+    # Arrange
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        etag = (await client.get("/groups/")).headers["etag"]
+        await client.post("/groups/bulk", json=[{"groupName": "Glúteos", "userId": 1}])
+
+        # Act
+        response = await client.get("/groups/", headers={"If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert any(item["groupName"] == "Glúteos" for item in response.json()["items"])
 
 @pytest.mark.asyncio
 async def test_create_muscle_group_route_success(override_db):
@@ -147,3 +294,117 @@ async def test_delete_muscle_group_route_not_found(override_db):
 
     # Assert
     assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_bulk_create_muscle_groups_route_reports_each_item(override_db, mock_async_session):
+    # Arrange
+    group = MuscleGroupFactory.build(user_id=1, group_name="Peito", deleted=False)
+    mock_async_session.add(group)
+    await mock_async_session.flush()
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/groups/bulk",
+            json=[
+                {"groupName": "Peito", "userId": 1},
+                {"groupName": "Costas", "userId": 1},
+                {"groupName": "Costas", "userId": 1},
+            ]
+        )
+
+    # Assert
+    assert response.status_code == 200
+    assert [item["status"] for item in response.json()] == ["conflict", "created", "conflict"]
+
+@pytest.mark.asyncio
+async def test_bulk_delete_muscle_groups_route_reports_not_found(override_db):
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.request(
+            "DELETE",
+            "/groups/bulk",
+            json=[{"groupName": "Nonexistent", "userId": 1}]
+        )
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()[0]["status"] == "not_found"
+
+@pytest.mark.asyncio
+async def test_bulk_update_muscle_groups_route_reports_live_keys_as_conflicts(override_committed_db, committed_session):
+    # Arrange
+    committed_session.add_all([
+        MuscleGroupFactory.build(user_id=1, group_name="Peito", deleted=False),
+        MuscleGroupFactory.build(user_id=1, group_name="Costas", deleted=False),
+        MuscleGroupFactory.build(user_id=1, group_name="Ombros", deleted=False),
+        MuscleGroupFactory.build(user_id=2, group_name="Peito", deleted=False),
+        MuscleGroupFactory.build(user_id=2, group_name="Costas", deleted=True),
+        MuscleGroupFactory.build(user_id=3, group_name="Ombros", deleted=False),
+    ])
+    await committed_session.commit()
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.put(
+            "/groups/bulk",
+            json=[
+                {"groupName": "Peito", "currentUserId": 1, "userId": 2},
+                {"groupName": "Costas", "currentUserId": 1, "userId": 2},
+                {"groupName": "Ombros", "currentUserId": 3, "userId": 4},
+                {"groupName": "Ombros", "currentUserId": 1, "userId": 4},
+                {"groupName": "Braços", "currentUserId": 1, "userId": 2},
+            ],
+        )
+
+    # Assert
+    assert response.status_code == 200
+    assert [item["status"] for item in response.json()] == ["conflict", "updated", "updated", "conflict", "not_found"]
+    assert await get_live_groups(1) == ["Ombros", "Peito"]
+    assert await get_live_groups(2) == ["Costas", "Peito"]
+    assert await get_live_groups(4) == ["Ombros"]
+
+@pytest.mark.asyncio
+async def test_bulk_routes_commit_their_writes(override_committed_db, committed_session):
+    # Arrange
+    committed_session.add(MuscleGroupFactory.build(user_id=1, group_name="Peito", deleted=False))
+    await committed_session.commit()
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        deleted = await client.request("DELETE", "/groups/bulk", json=[{"groupName": "Peito", "userId": 1}])
+        after_delete = await get_live_groups(1)
+        created = await client.post(
+            "/groups/bulk", json=[{"groupName": "Peito", "userId": 1}, {"groupName": "Costas", "userId": 1}]
+        )
+
+    # Assert
+    assert deleted.json()[0]["status"] == "deleted"
+    assert after_delete == []
+    assert [item["status"] for item in created.json()] == ["created", "created"]
+    assert await get_live_groups(1) == ["Costas", "Peito"]
+
+@pytest.mark.asyncio
+async def test_reader_right_after_invalidation_sees_the_write(override_committed_db, mock_redis):
+    # Arrange
+    invalidate = VersionedCache.invalidate
+    seen_by_reader = []
+
+    async def invalidate_then_read(self, *user_ids):
+        await invalidate(self, *user_ids)
+        # Another request reading between the version bump and the end of the write
+        async with AsyncSession(engine) as session:
+            page = await MuscleGroupService(session, mock_redis).get_all_muscle_groups()
+        seen_by_reader.append(page)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/groups/")
+
+        # Act
+        with patch.object(VersionedCache, "invalidate", invalidate_then_read):
+            await client.post("/groups/bulk", json=[{"groupName": "Trapézio", "userId": 1}])
+        response = await client.get("/groups/")
+
+    # Assert
+    assert b"Trap" in seen_by_reader[0]
+    assert any(item["groupName"] == "Trapézio" for item in response.json()["items"])
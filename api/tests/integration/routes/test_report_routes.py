@@ -0,0 +1,203 @@
+import pytest
+from datetime import date
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import func, select
+from main import app
+from src.connections import db_connection, redis_connection
+from src.models import Exercise, SplitSetReport, User, WeeklyVolume, WorkoutPlan, WorkoutReport, WorkoutSplit
+
+@pytest.fixture
+def override_db(mock_async_session, mock_redis):
+    async def _db_connection_override():
+        yield mock_async_session
+
+    async def _redis_connection_override():
+        yield mock_redis
+
+    app.dependency_overrides[db_connection] = _db_connection_override
+    app.dependency_overrides[redis_connection] = _redis_connection_override
+    yield
+    app.dependency_overrides.clear()
+
+async def create_plan(session):
+    user = User(email="session@test.com", name="Sessão", password="hash")
+    session.add(user)
+    await session.flush()
+
+    exercise = Exercise(user_id=user.id, exercise_name="Agachamento")
+    plan = WorkoutPlan(user_id=user.id, workout_plan_name="Plano", workout_plan_goal="Força")
+    session.add_all([exercise, plan])
+    await session.flush()
+
+    session.add(WorkoutSplit(split="A", workout_plan_id=plan.id))
+    await session.flush()
+
+    return user, exercise, plan
+
+def session_payload(plan, exercise, sets: int = 3):
+    return {
+        "report_date": "2026-10-14",
+        "split": "A",
+        "workout_plan_id": plan.id,
+        "sets": [
+            {"exercise_id": exercise.id, "execution_order": 1, "set_number": n, "reps": "5", "weight": 100}
+            for n in range(1, sets + 1)
+        ],
+    }
+
+async def count(session, model):
+    return (await session.execute(select(func.count()).select_from(model))).scalar_one()
+
+@pytest.mark.asyncio
+async def test_ingest_session_writes_report_sets_and_volume(override_db, mock_async_session):
+    # Arrange
+    user, exercise, plan = await create_plan(mock_async_session)
+    user_id = user.id
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/reports/sessions", json=session_payload(plan, exercise), headers={"Idempotency-Key": "k-1"}
+        )
+
+    # Assert
+    assert response.status_code == 201
+    assert response.json()["sets"] == 3
+    assert "Idempotent-Replayed" not in response.headers
+    assert await count(mock_async_session, SplitSetReport) == 3
+    volume = (await mock_async_session.execute(select(WeeklyVolume).where(WeeklyVolume.user_id == user_id))).scalar_one()
+    assert (volume.total_sets, volume.total_reps, volume.tonnage) == (3, 15, 1500)
+
+@pytest.mark.asyncio
+async def test_ingest_session_keeps_fractional_weights(override_db, mock_async_session):
+    # Arrange
+    user, exercise, plan = await create_plan(mock_async_session)
+    user_id, payload = user.id, session_payload(plan, exercise, sets=2)
+    for item in payload["sets"]:
+        item["weight"] = 22.5
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/reports/sessions", json=payload, headers={"Idempotency-Key": "k-fracao"})
+
+    # Assert
+    assert response.status_code == 201
+    weights = (await mock_async_session.execute(select(SplitSetReport.weight))).scalars().all()
+    assert weights == [22.5, 22.5]
+    volume = (await mock_async_session.execute(select(WeeklyVolume).where(WeeklyVolume.user_id == user_id))).scalar_one()
+    assert volume.tonnage == 225
+
+def set_reports_payload(plan, exercise, workout_report_id: int, weight: float = 22.5):
+    return [
+        {
+            "split": "A",
+            "workout_plan_id": plan.id,
+            "exercise_id": exercise.id,
+            "execution_order": 1,
+            "set_number": 1,
+            "workout_report_id": workout_report_id,
+            "reps": "10",
+            "weight": weight,
+            "notes": "",
+        }
+    ]
+
+@pytest.mark.asyncio
+async def test_create_set_reports_keeps_fractional_weights(override_db, mock_async_session):
+    # Arrange
+    user, exercise, plan = await create_plan(mock_async_session)
+    report = WorkoutReport(split="A", workout_plan_id=plan.id, report_date=date(2026, 10, 14))
+    mock_async_session.add(report)
+    await mock_async_session.flush()
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/reports/sets", json=set_reports_payload(plan, exercise, report.id))
+
+    # Assert
+    assert response.status_code == 201
+    assert (await mock_async_session.execute(select(SplitSetReport.weight))).scalar_one() == 22.5
+
+@pytest.mark.asyncio
+async def test_create_set_reports_rejects_empty_and_unknown_reports(override_db, mock_async_session):
+    # Arrange
+    user, exercise, plan = await create_plan(mock_async_session)
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        empty = await client.post("/reports/sets", json=[])
+        unknown = await client.post("/reports/sets", json=set_reports_payload(plan, exercise, 999_999))
+
+    # Assert
+    assert empty.status_code == 422
+    assert unknown.status_code == 404
+    assert await count(mock_async_session, SplitSetReport) == 0
+
+@pytest.mark.asyncio
+async def test_ingest_session_retry_replays_first_response(override_db, mock_async_session):
+    # Arrange
+    _, exercise, plan = await create_plan(mock_async_session)
+    payload = session_payload(plan, exercise)
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.post("/reports/sessions", json=payload, headers={"Idempotency-Key": "k-2"})
+        retry = await client.post("/reports/sessions", json=payload, headers={"Idempotency-Key": "k-2"})
+
+    # Assert
+    assert retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert await count(mock_async_session, WorkoutReport) == 1
+    assert await count(mock_async_session, SplitSetReport) == 3
+
+@pytest.mark.asyncio
+async def test_ingest_session_rejects_key_reused_with_other_payload(override_db, mock_async_session):
+    # Arrange
+    _, exercise, plan = await create_plan(mock_async_session)
+    payload, other_payload = session_payload(plan, exercise), session_payload(plan, exercise, sets=4)
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.post("/reports/sessions", json=payload, headers={"Idempotency-Key": "k-3"})
+        response = await client.post("/reports/sessions", json=other_payload, headers={"Idempotency-Key": "k-3"})
+
+    # Assert
+    assert response.status_code == 422
+    assert await count(mock_async_session, SplitSetReport) == 3
+
+@pytest.mark.asyncio
+async def test_ingest_session_rejects_repeated_sets(override_db, mock_async_session):
+    # Arrange
+    _, exercise, plan = await create_plan(mock_async_session)
+    payload = session_payload(plan, exercise)
+    payload["sets"].append(payload["sets"][0])
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/reports/sessions", json=payload, headers={"Idempotency-Key": "k-4"})
+
+    # Assert
+    assert response.status_code == 422
+    assert await count(mock_async_session, WorkoutReport) == 0
+
+@pytest.mark.asyncio
+async def test_get_personal_records_after_session(override_db, mock_async_session):
+    # Arrange
+    user, exercise, plan = await create_plan(mock_async_session)
+    user_id, exercise_id, payload = user.id, exercise.id, session_payload(plan, exercise)
+    payload["sets"][1]["weight"] = 110
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        created = await client.post("/reports/sessions", json=payload, headers={"Idempotency-Key": "k-records"})
+        response = await client.get("/reports/records", params={"user_id": user_id})
+
+    # Assert
+    assert response.status_code == 200
+    (record,) = response.json()
+    assert record["exerciseId"] == exercise_id
+    assert (record["maxWeight"], record["maxWeightReps"]) == (110, 5)
+    assert record["maxWeightReportId"] == created.json()["workout_report_id"]
+    assert record["bestOneRepMax"] == pytest.approx(110 * (1 + 5 / 30))
+    assert record["bestSetVolume"] == 550
@@ -0,0 +1,86 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from main import app
+from src.connections import db_connection, redis_connection
+from src.config import SETTINGS
+from src.models import Exercise
+from src.services.search_service import SEARCH_CACHE_NAMESPACE, SearchService
+
+@pytest.fixture
+def override_db(mock_async_session, mock_redis):
+    async def _db_connection_override():
+        yield mock_async_session
+
+    async def _redis_connection_override():
+        yield mock_redis
+
+    app.dependency_overrides[db_connection] = _db_connection_override
+    app.dependency_overrides[redis_connection] = _redis_connection_override
+    yield
+    app.dependency_overrides.clear()
+
+@pytest.mark.asyncio
+async def test_search_route_returns_ranked_matches(override_db, mock_async_session):
+    # Arrange
+    mock_async_session.add_all([Exercise(user_id=None, exercise_name="Leg Press 45°"), Exercise(user_id=None, exercise_name="Stiff")])
+    await mock_async_session.flush()
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/search/", params={"q": "leg pres", "user_id": 1})
+
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["name"] for item in data] == ["Leg Press 45°"]
+    assert data[0]["kind"] == "exercise"
+
+@pytest.mark.asyncio
+async def test_search_route_caches_short_prefixes_until_invalidated(override_db, mock_async_session, mock_redis):
+    # Arrange
+    exercise = Exercise(user_id=None, exercise_name="Remada Curvada")
+    mock_async_session.add(exercise)
+    await mock_async_session.flush()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get("/search/", params={"q": "Rem", "user_id": 1})
+
+        exercise.deleted = True
+        await mock_async_session.flush()
+
+        # Act
+        cached = await client.get("/search/", params={"q": "rém ", "user_id": 1})
+        uncached = await client.get("/search/", params={"q": "remada curvada", "user_id": 1})
+        await SearchService(mock_async_session, mock_redis).invalidate()
+        invalidated = await client.get("/search/", params={"q": "rem", "user_id": 1})
+
+    # Assert
+    assert cached.json() == first.json()
+    assert [item["name"] for item in cached.json()] == ["Remada Curvada"]
+    assert uncached.json() == []
+    assert invalidated.json() == []
+
+@pytest.mark.asyncio
+async def test_search_cache_entries_expire_quickly(override_db, mock_async_session, mock_redis):
+    # Arrange
+    mock_async_session.add(Exercise(user_id=None, exercise_name="Remada Curvada"))
+    await mock_async_session.flush()
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/search/", params={"q": "rem", "user_id": 1})
+
+    # Assert
+    keys = await mock_redis.keys(f"cache:{SEARCH_CACHE_NAMESPACE}:*:v*")
+    assert len(keys) == 1
+    ttl = await mock_redis.ttl(keys[0])
+    assert 0 < ttl <= SETTINGS.SEARCH_CACHE_TIMEOUT + SETTINGS.CACHE_STALE_TIMEOUT
+
+@pytest.mark.asyncio
+async def test_search_route_rejects_empty_term(override_db):
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/search/", params={"q": "", "user_id": 1})
+
+    # Assert
+    assert response.status_code == 422
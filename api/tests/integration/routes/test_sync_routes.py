@@ -0,0 +1,157 @@
+import pytest
+from datetime import datetime
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from main import app
+from src.connections import db_connection, redis_connection
+from src.models import Exercise, MuscleGroup, User, WorkoutPlan, WorkoutSplit
+from src.utils.pagination import encode_cursor
+from tests.conftest import engine
+
+@pytest.fixture
+def override_db(committed_session, mock_redis):
+    async def _db_connection_override():
+        yield committed_session
+
+    async def _redis_connection_override():
+        yield mock_redis
+
+    app.dependency_overrides[db_connection] = _db_connection_override
+    app.dependency_overrides[redis_connection] = _redis_connection_override
+    yield
+    app.dependency_overrides.clear()
+
+async def sync(params):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get("/sync/", params=params)
+
+async def create_catalog(session):
+    owner, other = User(email="sync@test.com", name="Sync", password="hash"), User(email="other@test.com", name="Other", password="hash")
+    session.add_all([owner, other])
+    await session.flush()
+
+    plan = WorkoutPlan(user_id=owner.id, workout_plan_name="Plano", workout_plan_goal="Força")
+    session.add_all(
+        [
+            MuscleGroup(user_id=owner.id, group_name="Peito"),
+            Exercise(user_id=None, exercise_name="Supino"),
+            Exercise(user_id=owner.id, exercise_name="Crucifixo"),
+            Exercise(user_id=owner.id, exercise_name="Apagado", deleted=True),
+            Exercise(user_id=other.id, exercise_name="Alheio"),
+            plan,
+        ]
+    )
+    await session.flush()
+    session.add(WorkoutSplit(split="A", workout_plan_id=plan.id))
+    await session.commit()
+
+    return owner
+
+@pytest.mark.asyncio
+async def test_full_sync_returns_live_rows_visible_to_user(override_db, committed_session):
+    # Arrange
+    owner = await create_catalog(committed_session)
+
+    # Act
+    response = await sync({"user_id": owner.id})
+
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    assert sorted(item["exerciseName"] for item in data["exercises"]["upserted"]) == ["Crucifixo", "Supino"]
+    assert data["exercises"]["deleted"] == []
+    assert data["muscleGroups"]["upserted"] == [{"userId": owner.id, "groupName": "Peito"}]
+    assert data["workoutSplits"]["upserted"][0]["split"] == "A"
+    assert data["cursor"]
+
+@pytest.mark.asyncio
+async def test_delta_sync_returns_only_changes_and_tombstones(override_db, committed_session):
+    # Arrange
+    owner = await create_catalog(committed_session)
+    cursor = (await sync({"user_id": owner.id})).json()["cursor"]
+    await committed_session.execute(
+        update(Exercise).where(Exercise.exercise_name == "Crucifixo").values(description="Com halteres")
+    )
+    await committed_session.execute(
+        update(Exercise).where(Exercise.exercise_name == "Supino").values(deleted=True, deleted_at=datetime.now())
+    )
+    await committed_session.commit()
+
+    # Act
+    delta = (await sync({"user_id": owner.id, "cursor": cursor})).json()
+    unchanged = (await sync({"user_id": owner.id, "cursor": delta["cursor"]})).json()
+
+    # Assert
+    assert [item["description"] for item in delta["exercises"]["upserted"]] == ["Com halteres"]
+    assert len(delta["exercises"]["deleted"]) == 1 and set(delta["exercises"]["deleted"][0]) == {"id"}
+    assert delta["muscleGroups"] == {"upserted": [], "deleted": []}
+    assert all(changes == {"upserted": [], "deleted": []} for name, changes in unchanged.items() if name != "cursor")
+
+@pytest.mark.asyncio
+async def test_delta_sync_sends_tombstone_to_previous_owner(override_db, committed_session):
+    # Arrange
+    owner = await create_catalog(committed_session)
+    owner_id = owner.id
+    other_id = (await committed_session.execute(select(User.id).where(User.email == "other@test.com"))).scalar_one()
+    owner_cursor = (await sync({"user_id": owner_id})).json()["cursor"]
+    other_cursor = (await sync({"user_id": other_id})).json()["cursor"]
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        moved = await client.put("/groups/bulk", json=[{"groupName": "Peito", "currentUserId": owner_id, "userId": other_id}])
+
+    # Act
+    previous = (await sync({"user_id": owner_id, "cursor": owner_cursor})).json()
+    current = (await sync({"user_id": other_id, "cursor": other_cursor})).json()
+
+    # Assert
+    assert moved.json()[0]["status"] == "updated"
+    assert previous["muscleGroups"] == {"upserted": [], "deleted": [{"userId": owner_id, "groupName": "Peito"}]}
+    assert current["muscleGroups"] == {"upserted": [{"userId": other_id, "groupName": "Peito"}], "deleted": []}
+
+@pytest.mark.asyncio
+async def test_sync_does_not_skip_transactions_committed_late(override_db, committed_session):
+    # Arrange
+    owner = await create_catalog(committed_session)
+    owner_id = owner.id
+
+    async with AsyncSession(engine) as slow:
+        # Starts writing first but only commits after the sync has run
+        slow.add(Exercise(user_id=owner_id, exercise_name="Remada"))
+        await slow.flush()
+
+        committed_session.add(Exercise(user_id=owner_id, exercise_name="Rosca"))
+        await committed_session.commit()
+        first = (await sync({"user_id": owner_id})).json()
+
+        await slow.commit()
+
+    # Act
+    second = (await sync({"user_id": owner_id, "cursor": first["cursor"]})).json()
+
+    # Assert
+    assert "Remada" not in [item["exerciseName"] for item in first["exercises"]["upserted"]]
+    assert "Remada" in [item["exerciseName"] for item in second["exercises"]["upserted"]]
+
+@pytest.mark.asyncio
+async def test_sync_response_is_gzipped(override_db, committed_session):
+    # Arrange
+    owner = await create_catalog(committed_session)
+    committed_session.add_all([Exercise(user_id=None, exercise_name=f"Exercício {i}") for i in range(50)])
+    await committed_session.commit()
+
+    # Act
+    response = await sync({"user_id": owner.id})
+
+    # Assert
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["exercises"]["upserted"]) == 52
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor([True]), encode_cursor([-1]), encode_cursor([1, 2])])
+async def test_sync_rejects_invalid_cursor(override_db, cursor):
+    # Act
+    response = await sync({"user_id": 1, "cursor": cursor})
+
+    # Assert
+    assert response.status_code == 400
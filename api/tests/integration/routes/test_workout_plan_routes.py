@@ -0,0 +1,64 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import update
+from main import app
+from src.connections import db_connection, redis_connection
+from src.models import assoc_split_exercise
+from src.repository.workout_plan_repository import WorkoutPlanRepository
+from tests.integration.repository.test_workout_plan_repository import create_plan
+
+@pytest.fixture
+def override_db(committed_session, mock_redis):
+    async def _db_connection_override():
+        yield committed_session
+
+    async def _redis_connection_override():
+        yield mock_redis
+
+    app.dependency_overrides[db_connection] = _db_connection_override
+    app.dependency_overrides[redis_connection] = _redis_connection_override
+    yield
+    app.dependency_overrides.clear()
+
+async def get_plan(plan_id):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(f"/plans/{plan_id}")
+
+@pytest.mark.asyncio
+async def test_get_plan_is_served_from_cache_until_it_changes(override_db, committed_session, monkeypatch):
+    # Arrange
+    plan_id, bench_id, *_ = await create_plan(committed_session)
+    await committed_session.commit()
+    loads = 0
+    get_plan_tree = WorkoutPlanRepository.get_plan_tree
+
+    async def counting_get_plan_tree(self, plan_id):
+        nonlocal loads
+        loads += 1
+        return await get_plan_tree(self, plan_id)
+
+    monkeypatch.setattr(WorkoutPlanRepository, "get_plan_tree", counting_get_plan_tree)
+
+    # Act
+    first = await get_plan(plan_id)
+    cached = await get_plan(plan_id)
+    await committed_session.execute(
+        update(assoc_split_exercise).where(assoc_split_exercise.c.exercise_id == bench_id).values(sets=5)
+    )
+    await committed_session.commit()
+    changed = await get_plan(plan_id)
+
+    # Assert
+    assert first.status_code == cached.status_code == changed.status_code == 200
+    assert cached.json() == first.json()
+    assert first.json()["splits"][0]["exercises"][0]["sets"] == 4
+    assert changed.json()["splits"][0]["exercises"][0]["sets"] == 5
+    assert loads == 2
+
+@pytest.mark.asyncio
+async def test_get_missing_plan_returns_404(override_db):
+    # Act
+    response = await get_plan(0)
+
+    # Assert
+    assert response.status_code == 404
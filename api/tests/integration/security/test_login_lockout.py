@@ -0,0 +1,105 @@
+import asyncio
+import pytest
+from datetime import timedelta
+
+from src.exceptions import LoginLocked
+from src.security.security import LoginLockout
+
+@pytest.mark.asyncio
+async def test_reserve_allows_attempts_under_limit(mock_redis):
+    # Arrange
+    lockout = LoginLockout(max_attempts=3, max_attempts_per_address=10, lockout_time=timedelta(minutes=1))
+    for _ in range(2):
+        await lockout.reserve(mock_redis, "atleta@test.com", "10.0.0.1")
+
+    # Act
+    attempts = await lockout.reserve(mock_redis, "atleta@test.com", "10.0.0.1")
+
+    # Assert
+    assert attempts == 3
+
+@pytest.mark.asyncio
+async def test_reserve_locks_account_from_any_address(mock_redis):
+    # Arrange
+    lockout = LoginLockout(max_attempts=3, max_attempts_per_address=10, lockout_time=timedelta(minutes=1))
+    for i in range(3):
+        await lockout.reserve(mock_redis, "Atleta@test.com", f"10.0.0.{i}")
+
+    # Act
+    with pytest.raises(LoginLocked) as exc:
+        await lockout.reserve(mock_redis, "atleta@test.com", "10.0.0.99")
+
+    # Assert
+    assert exc.value.status_code == 429
+    assert 0 < int(exc.value.headers["Retry-After"]) <= 60
+
+@pytest.mark.asyncio
+async def test_reserve_locks_address_across_accounts(mock_redis):
+    # Arrange
+    lockout = LoginLockout(max_attempts=3, max_attempts_per_address=5, lockout_time=timedelta(minutes=1))
+    for i in range(5):
+        await lockout.reserve(mock_redis, f"alvo{i}@test.com", "10.0.0.1")
+
+    # Act / Assert
+    with pytest.raises(LoginLocked):
+        await lockout.reserve(mock_redis, "outro@test.com", "10.0.0.1")
+    await lockout.reserve(mock_redis, "outro@test.com", "10.0.0.2")
+
+@pytest.mark.asyncio
+async def test_concurrent_attempts_cannot_exceed_limit(mock_redis):
+    # Arrange
+    lockout = LoginLockout(max_attempts=3, max_attempts_per_address=100, lockout_time=timedelta(minutes=1))
+
+    # Act
+    results = await asyncio.gather(
+        *(lockout.reserve(mock_redis, "atleta@test.com", f"10.0.0.{i}") for i in range(10)),
+        return_exceptions=True,
+    )
+
+    # Assert
+    assert sorted(result for result in results if isinstance(result, int)) == [1, 2, 3]
+    assert sum(isinstance(result, LoginLocked) for result in results) == 7
+
+@pytest.mark.asyncio
+async def test_attempts_expire_after_lockout_time(mock_redis):
+    # Arrange
+    lockout = LoginLockout(max_attempts=3, max_attempts_per_address=10, lockout_time=timedelta(minutes=15))
+
+    # Act
+    attempts = await lockout.reserve(mock_redis, "atleta@test.com", "10.0.0.1")
+
+    # Assert
+    assert attempts == 1
+    assert 0 < await mock_redis.pttl("login_failures:account:atleta@test.com") <= 15 * 60 * 1000
+    assert 0 < await mock_redis.pttl("login_failures:address:10.0.0.1") <= 15 * 60 * 1000
+
+@pytest.mark.asyncio
+async def test_release_gives_back_the_attempt(mock_redis):
+    # Arrange
+    lockout = LoginLockout(max_attempts=2, max_attempts_per_address=2, lockout_time=timedelta(minutes=1))
+    await lockout.reserve(mock_redis, "atleta@test.com", "10.0.0.1")
+    await lockout.reserve(mock_redis, "atleta@test.com", "10.0.0.1")
+
+    # Act
+    await lockout.release(mock_redis, "atleta@test.com", "10.0.0.1")
+
+    # Assert
+    assert await lockout.reserve(mock_redis, "atleta@test.com", "10.0.0.1") == 2
+
+@pytest.mark.asyncio
+async def test_reset_clears_account_but_not_address(mock_redis):
+    # Arrange
+    lockout = LoginLockout(max_attempts=3, max_attempts_per_address=3, lockout_time=timedelta(minutes=1))
+    for _ in range(3):
+        await lockout.reserve(mock_redis, "atleta@test.com", "10.0.0.1")
+
+    # Act
+    await lockout.reset(mock_redis, "atleta@test.com", "10.0.0.1")
+
+    # Assert
+    assert await mock_redis.get("login_failures:account:atleta@test.com") is None
+    assert int(await mock_redis.get("login_failures:address:10.0.0.1")) == 2
+    await lockout.reserve(mock_redis, "atleta@test.com", "10.0.0.2")
+    await lockout.reserve(mock_redis, "outro@test.com", "10.0.0.1")
+    with pytest.raises(LoginLocked):
+        await lockout.reserve(mock_redis, "atleta@test.com", "10.0.0.1")
@@ -0,0 +1,67 @@
+import pytest
+from datetime import timedelta
+from fastapi import Request
+
+from src.exceptions import RequestLimitExceeded
+from src.security.security import RateLimiter
+
+@pytest.mark.asyncio
+async def test_check_allows_requests_inside_limit(mock_redis):
+    # Arrange
+    limiter = RateLimiter(max_requests=3, time_window=timedelta(minutes=1), scope="test")
+
+    # Act
+    results = [await limiter.check(mock_redis, "10.0.0.1") for _ in range(3)]
+
+    # Assert
+    assert all(result.allowed for result in results)
+    assert [result.remaining for result in results] == [2, 1, 0]
+
+@pytest.mark.asyncio
+async def test_check_blocks_requests_over_limit(mock_redis):
+    # Arrange
+    limiter = RateLimiter(max_requests=2, time_window=timedelta(minutes=1), scope="test")
+    for _ in range(2):
+        await limiter.check(mock_redis, "10.0.0.1")
+
+    # Act
+    result = await limiter.check(mock_redis, "10.0.0.1")
+
+    # Assert
+    assert result.allowed is False
+    assert result.remaining == 0
+    assert 0 < result.reset_ms <= 60_000
+
+@pytest.mark.asyncio
+async def test_check_counts_clients_and_scopes_separately(mock_redis):
+    # Arrange
+    limiter = RateLimiter(max_requests=1, time_window=timedelta(minutes=1), scope="test")
+    other_scope = RateLimiter(max_requests=1, time_window=timedelta(minutes=1), scope="other")
+    await limiter.check(mock_redis, "10.0.0.1")
+
+    # Act
+    other_client = await limiter.check(mock_redis, "10.0.0.2")
+    same_client_other_scope = await other_scope.check(mock_redis, "10.0.0.1")
+
+    # Assert
+    assert other_client.allowed is True
+    assert same_client_other_scope.allowed is True
+
+@pytest.mark.asyncio
+async def test_rejected_request_carries_retry_after(mock_redis):
+    # Arrange
+    limiter = RateLimiter(max_requests=1, time_window=timedelta(minutes=1), scope="test")
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": [], "client": ("10.0.0.1", 1234)})
+    await limiter(request, mock_redis)
+
+    # Act
+    with pytest.raises(RequestLimitExceeded) as exc:
+        await limiter(request, mock_redis)
+
+    # Assert
+    headers = exc.value.headers
+    assert exc.value.status_code == 429
+    assert headers["RateLimit-Limit"] == "1"
+    assert headers["RateLimit-Remaining"] == "0"
+    assert 0 < int(headers["Retry-After"]) <= 60
+    assert headers["Retry-After"] == headers["RateLimit-Reset"]
@@ -0,0 +1,60 @@
+import pytest
+from time import time
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from starlette.requests import Request
+
+from src import connections
+from src.config import SETTINGS
+from src.connections import InstrumentedAsyncPool
+from src.middlewares.primary_pin import PRIMARY_PIN_COOKIE
+from tests.conftest import engine
+
+@pytest.mark.asyncio
+async def test_pool_stats_track_checkouts():
+    # Arrange
+    engine = create_async_engine(SETTINGS.POSTGRES_TEST_URL, poolclass=InstrumentedAsyncPool, pool_size=2)
+
+    # Act
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        during = engine.pool.stats()
+    after = engine.pool.stats()
+    await engine.dispose()
+
+    # Assert
+    assert during["checked_out"] == 1
+    assert after["checked_out"] == 0
+    assert after["checked_in"] == 1
+    assert after["checkouts"] == 1
+    assert after["wait_time_max_ms"] >= after["wait_time_avg_ms"] >= 0
+
+async def read_session(monkeypatch, replica, cookies: dict[str, str]):
+    """
+    Session read_connection hands out for a request with these cookies.
+    """
+
+    monkeypatch.setattr(connections, "read_session_maker", replica)
+    header = "; ".join(f"{name}={value}" for name, value in cookies.items())
+    request = Request({"type": "http", "headers": [(b"cookie", header.encode())]})
+    primary = AsyncSession(engine)
+
+    generator = connections.read_connection(request, primary)
+    session = await anext(generator)
+    await generator.aclose()
+    return session, primary
+
+@pytest.mark.asyncio
+async def test_read_connection_uses_replica_unless_pinned(monkeypatch):
+    # Arrange
+    replica = async_sessionmaker(engine, info={"replica": True})
+
+    # Act
+    unpinned, _ = await read_session(monkeypatch, replica, {})
+    pinned, primary = await read_session(monkeypatch, replica, {PRIMARY_PIN_COOKIE: str(time() + 5)})
+    without_replica, other_primary = await read_session(monkeypatch, None, {})
+
+    # Assert
+    assert unpinned.info == {"replica": True}
+    assert pinned is primary
+    assert without_replica is other_primary
@@ -0,0 +1,370 @@
+import asyncio
+import pytest
+from contextlib import suppress
+from unittest.mock import AsyncMock
+
+from src.config import SETTINGS
+from src.utils.cache import LocalCache, VersionedCache, listen_for_invalidations
+from src.utils.codec import get_codec
+
+@pytest.mark.asyncio
+async def test_get_or_load_caches_result(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "test")
+    loader = AsyncMock(return_value=[{"group_name": "Peito"}])
+
+    # Act
+    first = await cache.get_or_load(1, "all", loader)
+    second = await cache.get_or_load(1, "all", loader)
+
+    # Assert
+    loader.assert_awaited_once()
+    assert first == second == [{"group_name": "Peito"}]
+
+@pytest.mark.asyncio
+async def test_get_or_load_caches_none(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "test")
+    loader = AsyncMock(return_value=None)
+
+    # Act
+    await cache.get_or_load(1, "name:Nonexistent", loader)
+    result = await cache.get_or_load(1, "name:Nonexistent", loader)
+
+    # Assert
+    loader.assert_awaited_once()
+    assert result is None
+
+@pytest.mark.asyncio
+async def test_invalidate_discards_user_entries(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "test")
+    loader = AsyncMock(side_effect=["old", "new"])
+    await cache.get_or_load(1, "name:Costas", loader)
+
+    # Act
+    await cache.invalidate(1)
+    result = await cache.get_or_load(1, "name:Costas", loader)
+
+    # Assert
+    assert loader.await_count == 2
+    assert result == "new"
+
+@pytest.mark.asyncio
+async def test_invalidate_keeps_other_users_entries(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "test")
+    loader = AsyncMock(return_value="cached")
+    await cache.get_or_load(2, "name:Costas", loader)
+
+    # Act
+    await cache.invalidate(1)
+    await cache.get_or_load(2, "name:Costas", loader)
+
+    # Assert
+    loader.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_invalidate_always_bumps_global_scope(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "test")
+
+    # Act
+    await cache.invalidate(None)
+
+    # Assert
+    assert await cache.get_version(VersionedCache.GLOBAL_SCOPE) == 1
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("codec_name", ["orjson", "msgpack"])
+async def test_get_or_load_round_trips_with_codec(mock_redis, codec_name):
+    # Arrange
+    cache = VersionedCache(mock_redis, "test", codec=get_codec(codec_name))
+    loader = AsyncMock(return_value={"items": [{"groupName": "Peito", "userId": None}], "nextCursor": None})
+
+    # Act
+    first = await cache.get_or_load(1, "page", loader)
+    second = await cache.get_or_load(1, "page", loader)
+
+    # Assert
+    loader.assert_awaited_once()
+    assert first == second == {"items": [{"groupName": "Peito", "userId": None}], "nextCursor": None}
+
+@pytest.mark.asyncio
+async def test_get_or_load_json_returns_cached_bytes(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "test", codec=get_codec("orjson"))
+    loader = AsyncMock(return_value=[{"groupName": "Tríceps"}])
+
+    # Act
+    first = await cache.get_or_load_json(1, "all", loader)
+    second = await cache.get_or_load_json(1, "all", loader)
+
+    # Assert
+    loader.assert_awaited_once()
+    assert first == second == '[{"groupName":"Tríceps"}]'.encode()
+
+@pytest.mark.asyncio
+async def test_get_or_load_json_transcodes_msgpack(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "test", codec=get_codec("msgpack"))
+    loader = AsyncMock(return_value=[{"groupName": "Costas"}])
+    await cache.get_or_load_json(1, "all", loader)
+
+    # Act
+    result = await cache.get_or_load_json(1, "all", loader)
+
+    # Assert
+    loader.assert_awaited_once()
+    assert result == b'[{"groupName":"Costas"}]'
+
+@pytest.mark.asyncio
+async def test_get_etag_changes_only_when_scope_is_invalidated(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "test")
+    _, first = await cache.get_etag(1, "name:Peito")
+    _, same = await cache.get_etag(1, "name:Peito")
+    _, other_key = await cache.get_etag(1, "name:Costas")
+
+    # Act
+    await cache.invalidate(1)
+    version, after_write = await cache.get_etag(1, "name:Peito")
+
+    # Assert
+    assert first == same
+    assert first != other_key
+    assert after_write != first
+    assert version == 1
+
+@pytest.mark.asyncio
+async def test_get_etag_changes_when_redis_loses_its_data(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "test")
+    _, before = await cache.get_etag(1, "all")
+
+    # Act
+    await mock_redis.flushdb()
+    _, after = await cache.get_etag(1, "all")
+
+    # Assert
+    assert before != after
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_call_loader_once(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "coalesce")
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return ["Peito"]
+
+    # Act
+    results = await asyncio.gather(*(cache.get_or_load(1, "all", loader) for _ in range(10)))
+
+    # Assert
+    assert calls == 1
+    assert results == [["Peito"]] * 10
+    assert VersionedCache.stats()["coalesce"]["coalesced"] >= 9
+
+@pytest.mark.asyncio
+async def test_failed_load_lets_waiters_load(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "failed-load")
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        if calls == 1:
+            raise RuntimeError("banco indisponível")
+        return "Costas"
+
+    # Act
+    results = await asyncio.gather(
+        cache.get_or_load(1, "all", loader), cache.get_or_load(1, "all", loader), return_exceptions=True
+    )
+
+    # Assert
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] == "Costas"
+
+@pytest.mark.asyncio
+async def test_failed_load_is_retried_once_for_all_waiters(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "failed-load-many")
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        if calls == 1:
+            raise RuntimeError("banco indisponível")
+        return "Costas"
+
+    # Act
+    results = await asyncio.gather(
+        *(cache.get_or_load(1, "all", loader) for _ in range(4)), return_exceptions=True
+    )
+
+    # Assert
+    assert isinstance(results[0], RuntimeError)
+    assert results[1:] == ["Costas"] * 3
+    assert calls == 2
+    assert VersionedCache._in_flight == {}
+
+@pytest.mark.asyncio
+async def test_waits_for_entry_loaded_by_lock_holder(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "locked", lock_timeout=2)
+    cache_key = "cache:locked:1:v0:all"
+    await mock_redis.set(f"{cache_key}:lock", "outro-worker")
+    loader = AsyncMock(return_value="local")
+
+    async def other_worker():
+        await asyncio.sleep(0.1)
+        await mock_redis.set(cache_key, cache.codec.encode("remoto"))
+
+    # Act
+    result, _ = await asyncio.gather(cache.get_or_load(1, "all", loader, version=0), other_worker())
+
+    # Assert
+    loader.assert_not_awaited()
+    assert result == "remoto"
+
+@pytest.mark.asyncio
+async def test_loads_when_lock_holder_takes_too_long(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "slow-lock", lock_timeout=0.2)
+    await mock_redis.set("cache:slow-lock:1:v0:all:lock", "outro-worker")
+    loader = AsyncMock(return_value="local")
+
+    # Act
+    result = await cache.get_or_load(1, "all", loader, version=0)
+
+    # Assert
+    loader.assert_awaited_once()
+    assert result == "local"
+
+@pytest.mark.asyncio
+async def test_serves_stale_entry_while_another_worker_refreshes(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "stale", timeout=60, stale_timeout=30)
+    cache_key = "cache:stale:1:v0:all"
+    await mock_redis.set(cache_key, cache.codec.encode("antigo"), ex=10)
+    await mock_redis.set(f"{cache_key}:lock", "outro-worker")
+    loader = AsyncMock(return_value="novo")
+
+    # Act
+    result = await cache.get_or_load(1, "all", loader, version=0)
+
+    # Assert
+    loader.assert_not_awaited()
+    assert result == "antigo"
+    assert VersionedCache.stats()["stale"]["stale_served"] == 1
+
+@pytest.mark.asyncio
+async def test_refreshes_stale_entry_when_lock_is_free(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "refresh", timeout=60, stale_timeout=30)
+    cache_key = "cache:refresh:1:v0:all"
+    await mock_redis.set(cache_key, cache.codec.encode("antigo"), ex=10)
+    loader = AsyncMock(return_value="novo")
+
+    # Act
+    result = await cache.get_or_load(1, "all", loader, version=0)
+
+    # Assert
+    loader.assert_awaited_once()
+    assert result == "novo"
+    assert await mock_redis.ttl(cache_key) > 60
+    assert not await mock_redis.exists(f"{cache_key}:lock")
+
+def connected_local_cache() -> LocalCache:
+    local = LocalCache(max_bytes=1024 * 1024, timeout=30)
+    local.connected = True
+    return local
+
+@pytest.mark.asyncio
+async def test_local_hit_skips_redis(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "local-hit", local=connected_local_cache())
+    loader = AsyncMock(return_value=["Peito"])
+    await cache.get_or_load(1, "all", loader)
+    await mock_redis.flushdb()
+
+    # Act
+    result = await cache.get_or_load(1, "all", loader)
+
+    # Assert
+    loader.assert_awaited_once()
+    assert result == ["Peito"]
+    stats = VersionedCache.stats()["local-hit"]
+    assert stats["local_hits"] == 1
+    assert stats["local_hit_ratio"] == 0.5
+
+@pytest.mark.asyncio
+async def test_disconnected_local_cache_is_bypassed(mock_redis):
+    # Arrange
+    local = connected_local_cache()
+    local.connected = False
+    cache = VersionedCache(mock_redis, "local-down", local=local)
+    loader = AsyncMock(side_effect=["old", "new"])
+    await cache.get_or_load(1, "all", loader)
+
+    # Act
+    await mock_redis.flushdb()
+    result = await cache.get_or_load(1, "all", loader)
+
+    # Assert
+    assert result == "new"
+    assert local.stats()["entries"] == 0
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_local_entries_of_writing_worker(mock_redis):
+    # Arrange
+    cache = VersionedCache(mock_redis, "local-write", local=connected_local_cache())
+    loader = AsyncMock(side_effect=["old", "new"])
+    await cache.get_or_load(1, "name:Costas", loader)
+
+    # Act
+    await cache.invalidate(1)
+    result = await cache.get_or_load(1, "name:Costas", loader)
+
+    # Assert
+    assert result == "new"
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_other_workers(mock_redis):
+    # Arrange
+    other_worker = LocalCache(max_bytes=1024 * 1024, timeout=30)
+    listener = asyncio.create_task(listen_for_invalidations(other_worker, SETTINGS.REDIS_TEST_URL, 0.5))
+    for _ in range(50):
+        if other_worker.connected:
+            break
+        await asyncio.sleep(0.01)
+    assert other_worker.connected
+
+    reader = VersionedCache(mock_redis, "local-pubsub", local=other_worker)
+    writer = VersionedCache(mock_redis, "local-pubsub", local=None)
+    loader = AsyncMock(side_effect=["old", "new"])
+    await reader.get_or_load(1, "name:Costas", loader)
+
+    # Act
+    await writer.invalidate(1)
+    for _ in range(50):
+        if other_worker.get("cache:local-pubsub:version:1") is None:
+            break
+        await asyncio.sleep(0.01)
+    result = await reader.get_or_load(1, "name:Costas", loader)
+    listener.cancel()
+    with suppress(asyncio.CancelledError):
+        await listener
+
+    # Assert
+    assert result == "new"
+    assert not other_worker.connected
@@ -0,0 +1,15 @@
+import pytest
+from sqlalchemy import literal, select
+
+from src.utils.training import parse_reps, parse_reps_sql
+
+@pytest.mark.asyncio
+async def test_parse_reps_agrees_with_sql(mock_async_session):
+    # Arrange
+    samples = ["12", " 8 ", "falha", "8-10", "", "²", "١٢", "１２", "3.5"]
+
+    # Act
+    parsed = [(await mock_async_session.execute(select(parse_reps_sql(literal(reps))))).scalar_one() for reps in samples]
+
+    # Assert
+    assert parsed == [parse_reps(reps) for reps in samples]
@@ -0,0 +1,246 @@
+import asyncio
+import pytest
+import pytest_asyncio
+import socket
+from json import dumps, loads
+
+import aiosmtplib
+from aiosmtpd.controller import Controller
+
+from src.email_service import MAIL_DEAD_LETTER_KEY, MAIL_QUEUE_KEY, MAIL_RETRY_KEY, EmailClient
+from src.workers.mail_worker import MailWorker
+
+class _RecordingHandler:
+    """
+    Servidor SMTP local que guarda as mensagens recebidas e recusa destinatários do domínio "refused.test".
+    """
+
+    def __init__(self):
+        self.messages = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.endswith("@refused.test"):
+            return "550 Mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        return "250 Message accepted"
+
+@pytest.fixture
+def smtp_server():
+    handler = _RecordingHandler()
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    yield handler, port
+    controller.stop()
+
+@pytest_asyncio.fixture
+async def worker(mock_redis, smtp_server):
+    _, port = smtp_server
+    smtp = aiosmtplib.SMTP(hostname="127.0.0.1", port=port, start_tls=False)
+    yield MailWorker(mock_redis, smtp=smtp, max_attempts=2, backoff=60)
+    smtp.close()
+
+@pytest.mark.asyncio
+async def test_send_register_verify_mail_only_queues_job(mock_redis):
+    # Act
+    result = await EmailClient(mock_redis).send_register_verify_mail("user@example.com", "abc123", "Luiz")
+
+    # Assert
+    assert result is True
+    job = loads(await mock_redis.rpop(MAIL_QUEUE_KEY))
+    assert job["template"] == "confirm_register.html"
+    assert job["context"] == {"nome": "Luiz", "prot": "abc123"}
+
+@pytest.mark.asyncio
+async def test_worker_delivers_queued_jobs_over_one_connection(mock_redis, worker, smtp_server):
+    # Arrange
+    handler, _ = smtp_server
+    client = EmailClient(mock_redis)
+    await client.send_register_verify_mail("first@example.com", "abc123", "Luiz")
+    await client.send_pwd_change_mail("second@example.com", "Luiz", "XYZ789")
+
+    # Act
+    processed = [await worker.run_once(timeout=0.1) for _ in range(2)]
+
+    # Assert
+    assert processed == [True, True]
+    assert [message.rcpt_tos for message in handler.messages] == [["first@example.com"], ["second@example.com"]]
+    assert b"XYZ789" in handler.messages[1].content
+    assert worker.smtp.is_connected
+
+@pytest.mark.asyncio
+async def test_worker_dead_letters_refused_recipients(mock_redis, worker):
+    # Arrange
+    await EmailClient(mock_redis).send_register_verify_mail("user@refused.test", "abc123", "Luiz")
+
+    # Act
+    await worker.run_once(timeout=0.1)
+
+    # Assert
+    dead = loads(await mock_redis.rpop(MAIL_DEAD_LETTER_KEY))
+    assert dead["recipient"] == "user@refused.test"
+    assert "550" in dead["error"]
+
+@pytest.mark.asyncio
+async def test_worker_retries_transient_failures_with_backoff(mock_redis):
+    # Arrange
+    unreachable = aiosmtplib.SMTP(hostname="127.0.0.1", port=1, start_tls=False, timeout=1)
+    worker = MailWorker(mock_redis, smtp=unreachable, max_attempts=2, backoff=60)
+    await EmailClient(mock_redis).send_register_verify_mail("user@example.com", "abc123", "Luiz")
+
+    # Act
+    await worker.run_once(timeout=0.1)
+
+    # Assert
+    retries = await mock_redis.zrange(MAIL_RETRY_KEY, 0, -1, withscores=True)
+    assert len(retries) == 1
+    assert loads(retries[0][0])["attempts"] == 1
+    assert await mock_redis.llen(MAIL_DEAD_LETTER_KEY) == 0
+
+@pytest.mark.asyncio
+async def test_worker_dead_letters_jobs_out_of_attempts(mock_redis):
+    # Arrange
+    unreachable = aiosmtplib.SMTP(hostname="127.0.0.1", port=1, start_tls=False, timeout=1)
+    worker = MailWorker(mock_redis, smtp=unreachable, max_attempts=1)
+    await EmailClient(mock_redis).send_register_verify_mail("user@example.com", "abc123", "Luiz")
+
+    # Act
+    await worker.run_once(timeout=0.1)
+
+    # Assert
+    assert await mock_redis.zcard(MAIL_RETRY_KEY) == 0
+    assert await mock_redis.llen(MAIL_DEAD_LETTER_KEY) == 1
+
+@pytest.mark.asyncio
+async def test_worker_removes_job_from_processing_list_once_handled(mock_redis, worker):
+    # Arrange
+    await EmailClient(mock_redis).send_register_verify_mail("user@example.com", "abc123", "Luiz")
+
+    # Act
+    await worker.run_once(timeout=0.1)
+
+    # Assert
+    assert await mock_redis.llen(worker.processing_key) == 0
+    assert await mock_redis.llen(MAIL_QUEUE_KEY) == 0
+
+@pytest.mark.asyncio
+async def test_worker_requeues_jobs_left_by_a_crash(mock_redis, worker, smtp_server):
+    # Arrange
+    handler, _ = smtp_server
+    await EmailClient(mock_redis).send_register_verify_mail("user@example.com", "abc123", "Luiz")
+    await mock_redis.lmove(MAIL_QUEUE_KEY, worker.processing_key, "RIGHT", "LEFT")
+
+    # Act
+    requeued = await worker.requeue_processing()
+    await worker.run_once(timeout=0.1)
+
+    # Assert
+    assert requeued == 1
+    assert [message.rcpt_tos for message in handler.messages] == [["user@example.com"]]
+    assert await mock_redis.llen(worker.processing_key) == 0
+
+@pytest.mark.asyncio
+async def test_worker_dead_letters_malformed_jobs(mock_redis, worker):
+    # Arrange
+    await mock_redis.lpush(MAIL_QUEUE_KEY, "not-json", dumps({"id": "1", "context": {"prot": "abc123"}}))
+
+    # Act
+    processed = [await worker.run_once(timeout=0.1) for _ in range(2)]
+
+    # Assert
+    assert processed == [True, True]
+    dead = [loads(job) for job in await mock_redis.lrange(MAIL_DEAD_LETTER_KEY, 0, -1)]
+    assert all("Malformed job" in job["error"] for job in dead)
+    assert dead[0] == {"id": "1", "context_keys": ["prot"], "error": dead[0]["error"]}
+    assert "abc123" not in str(dead)
+    assert await mock_redis.llen(worker.processing_key) == 0
+
+@pytest.mark.asyncio
+async def test_dead_letter_list_is_capped(mock_redis, smtp_server):
+    # Arrange
+    _, port = smtp_server
+    worker = MailWorker(mock_redis, smtp=aiosmtplib.SMTP(hostname="127.0.0.1", port=port), dead_letter_max_size=2)
+    client = EmailClient(mock_redis)
+    for number in range(3):
+        await client.send_register_verify_mail(f"user{number}@refused.test", "abc123", "Luiz")
+
+    # Act
+    for _ in range(3):
+        await worker.run_once(timeout=0.1)
+
+    # Assert
+    dead = [loads(job) for job in await mock_redis.lrange(MAIL_DEAD_LETTER_KEY, 0, -1)]
+    assert [job["recipient"] for job in dead] == ["user2@refused.test", "user1@refused.test"]
+    assert all("context" not in job for job in dead)
+
+@pytest.mark.asyncio
+async def test_run_keeps_going_after_redis_errors(mock_redis, worker):
+    # Arrange
+    calls = 0
+
+    async def run_once():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ConnectionError("Redis indisponível")
+        raise asyncio.CancelledError()
+
+    worker.backoff = 0
+    worker.run_once = run_once
+
+    # Act
+    with pytest.raises(asyncio.CancelledError):
+        await worker.run()
+
+    # Assert
+    assert calls == 2
+
+@pytest.mark.asyncio
+async def test_worker_retries_jobs_failing_unexpectedly(mock_redis, worker, monkeypatch):
+    # Arrange
+    def broken_message(job):
+        raise RuntimeError("template quebrado")
+
+    monkeypatch.setattr(worker, "build_message", broken_message)
+    worker.backoff = 60
+    await EmailClient(mock_redis).send_register_verify_mail("user@example.com", "abc123", "Luiz")
+
+    # Act
+    processed = await worker.run_once(timeout=0.1)
+
+    # Assert
+    assert processed is True
+    retries = await mock_redis.zrange(MAIL_RETRY_KEY, 0, -1)
+    assert [loads(job)["attempts"] for job in retries] == [1]
+    assert await mock_redis.llen(worker.processing_key) == 0
+
+@pytest.mark.asyncio
+async def test_run_requeues_job_left_by_a_failed_iteration(mock_redis, worker):
+    # Arrange
+    await EmailClient(mock_redis).send_register_verify_mail("user@example.com", "abc123", "Luiz")
+    queued_on_retry = []
+
+    async def run_once():
+        if not queued_on_retry:
+            await mock_redis.lmove(MAIL_QUEUE_KEY, worker.processing_key, "RIGHT", "LEFT")
+            queued_on_retry.append(None)
+            raise ConnectionError("Redis indisponível")
+        queued_on_retry[0] = await mock_redis.llen(MAIL_QUEUE_KEY)
+        raise asyncio.CancelledError()
+
+    worker.backoff = 0
+    worker.run_once = run_once
+
+    # Act
+    with pytest.raises(asyncio.CancelledError):
+        await worker.run()
+
+    # Assert
+    assert queued_on_retry == [1]
+    assert await mock_redis.llen(worker.processing_key) == 0
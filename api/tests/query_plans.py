@@ -0,0 +1,24 @@
+from sqlalchemy import event
+
+
+async def explain_call(session, call) -> str:
+    """
+    Run a repository call, capturing the SQL it sends, and return the EXPLAIN plan of its last statement.
+    """
+
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    sync_engine = session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        await call()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    statement, parameters = captured[-1]
+    conn = await session.connection()
+    result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    return "\n".join(row[0] for row in result)
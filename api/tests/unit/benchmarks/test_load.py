@@ -0,0 +1,85 @@
+import httpx
+import pytest
+
+from benchmarks.load.baseline import find_regressions, load_baseline, save_baseline
+from benchmarks.load.driver import run_scenario
+from benchmarks.load.scenarios import Scenario
+from benchmarks.load.stats import ScenarioResult, percentile
+
+SUMMARY = {"requests": 1000, "errors": 0, "throughput": 100.0, "p50": 10.0, "p95": 20.0, "p99": 30.0, "max": 50.0}
+
+
+def test_percentile_nearest_rank():
+    # Arrange
+    values = [float(i) for i in range(1, 101)]
+
+    # Act / Assert
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([7.0], 95) == 7.0
+    assert percentile([], 95) == 0.0
+
+
+def test_scenario_result_summary():
+    # Arrange
+    result = ScenarioResult("groups.list", duration=2)
+    for ms in range(1, 11):
+        result.record(ms / 1000, 200 if ms < 10 else 500, ms < 10)
+
+    # Act
+    summary = result.summary()
+
+    # Assert
+    assert summary["requests"] == 10
+    assert summary["errors"] == 1
+    assert summary["throughput"] == 5
+    assert summary["p50"] == pytest.approx(5)
+    assert summary["max"] == pytest.approx(10)
+    assert result.statuses == {200: 9, 500: 1}
+
+
+def test_find_regressions_within_threshold(tmp_path):
+    # Arrange
+    path = tmp_path / "baseline.json"
+    save_baseline(path, {"groups.list": SUMMARY}, {"concurrency": 16})
+    current = {**SUMMARY, "p95": 22.0, "throughput": 95.0}
+
+    # Act
+    regressions = find_regressions({"groups.list": current}, load_baseline(path), 0.15)
+
+    # Assert
+    assert regressions == []
+
+
+def test_find_regressions_flags_latency_and_throughput():
+    # Arrange
+    baseline = {"scenarios": {"groups.list": SUMMARY}}
+    current = {**SUMMARY, "p99": 40.0, "throughput": 80.0}
+
+    # Act
+    regressions = find_regressions({"groups.list": current, "groups.new": SUMMARY}, baseline, 0.15)
+
+    # Assert
+    assert len(regressions) == 2
+    assert regressions[0].startswith("groups.list throughput")
+    assert regressions[1].startswith("groups.list p99")
+
+
+@pytest.mark.asyncio
+async def test_run_scenario_skips_warmup():
+    # Arrange
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+    calls = []
+
+    async def request(client, context, sequence):
+        calls.append(sequence)
+        return await client.get("/")
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # Act
+        result = await run_scenario(client, Scenario("test", request), concurrency=2, duration=0.05, warmup=0.05)
+
+    # Assert
+    assert result.errors == 0
+    assert 0 < len(result.latencies) < len(calls)
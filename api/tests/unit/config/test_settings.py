@@ -0,0 +1,13 @@
+from src.config import Settings
+
+def test_metrics_are_disabled_in_production():
+    # Act
+    settings = Settings(ENVIRONMENT="production")
+
+    # Assert
+    assert settings.METRICS_ENABLED is False
+
+def test_metrics_are_enabled_outside_production_unless_disabled():
+    # Act / Assert
+    assert Settings(ENVIRONMENT="development").METRICS_ENABLED is True
+    assert Settings(ENVIRONMENT="development", METRICS_ENABLED=False).METRICS_ENABLED is False
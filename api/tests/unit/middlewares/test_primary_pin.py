@@ -0,0 +1,48 @@
+import pytest
+from datetime import timedelta
+from time import time
+from httpx import AsyncClient, ASGITransport
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from src.middlewares.primary_pin import PRIMARY_PIN_COOKIE, PrimaryPinMiddleware, is_pinned_to_primary
+
+async def _endpoint(request):
+    status_code = 400 if request.query_params.get("fail") else 200
+    return PlainTextResponse("ok", status_code=status_code)
+
+@pytest.fixture
+def pinned_app():
+    app = Starlette(routes=[Route("/", _endpoint, methods=["GET", "POST", "DELETE"])])
+    return PrimaryPinMiddleware(app, pin_time=timedelta(seconds=5))
+
+async def request(app, method, params=None):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.request(method, "/", params=params)
+
+@pytest.mark.asyncio
+async def test_successful_write_pins_client_to_primary(pinned_app):
+    # Act
+    response = await request(pinned_app, "POST")
+
+    # Assert
+    assert "Max-Age=5" in response.headers["Set-Cookie"]
+    assert is_pinned_to_primary(response.cookies)
+
+@pytest.mark.asyncio
+async def test_reads_and_failed_writes_do_not_pin(pinned_app):
+    # Act
+    read = await request(pinned_app, "GET")
+    failed = await request(pinned_app, "DELETE", {"fail": "1"})
+
+    # Assert
+    assert "Set-Cookie" not in read.headers
+    assert "Set-Cookie" not in failed.headers
+
+def test_is_pinned_to_primary():
+    # Act & Assert
+    assert is_pinned_to_primary({PRIMARY_PIN_COOKIE: str(time() + 5)})
+    assert not is_pinned_to_primary({PRIMARY_PIN_COOKIE: str(time() - 1)})
+    assert not is_pinned_to_primary({PRIMARY_PIN_COOKIE: "invalido"})
+    assert not is_pinned_to_primary({})
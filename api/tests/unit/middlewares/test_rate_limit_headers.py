@@ -0,0 +1,34 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from src.middlewares.rate_limit_headers import RATE_LIMIT_HEADERS_STATE, RateLimitHeadersMiddleware
+
+async def _endpoint(request):
+    if request.query_params.get("limited"):
+        setattr(request.state, RATE_LIMIT_HEADERS_STATE, {"RateLimit-Remaining": "4", "Retry-After": "9"})
+    return PlainTextResponse("ok", headers={"Retry-After": "1"})
+
+async def request(params=None):
+    app = RateLimitHeadersMiddleware(Starlette(routes=[Route("/", _endpoint)]))
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get("/", params=params)
+
+@pytest.mark.asyncio
+async def test_adds_headers_left_in_request_state():
+    # Act
+    response = await request({"limited": "1"})
+
+    # Assert
+    assert response.headers["RateLimit-Remaining"] == "4"
+    assert response.headers["Retry-After"] == "1"
+
+@pytest.mark.asyncio
+async def test_leaves_responses_without_rate_limit_alone():
+    # Act
+    response = await request()
+
+    # Assert
+    assert "RateLimit-Remaining" not in response.headers
@@ -0,0 +1,49 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from src.middlewares.server_timing import ServerTimingMiddleware
+from src.utils.request_metrics import RequestMetrics, current_metrics
+
+async def _endpoint(request):
+    metrics = current_metrics()
+    metrics.record_sql(0.002)
+    metrics.record_sql(0.001)
+    metrics.record_redis(0.0005)
+    return PlainTextResponse("ok")
+
+@pytest.fixture
+def timed_app():
+    return ServerTimingMiddleware(Starlette(routes=[Route("/", _endpoint)]))
+
+def test_server_timing_format():
+    # Arrange
+    metrics = RequestMetrics()
+    metrics.record_sql(0.004)
+    metrics.record_redis(0.001, commands=2)
+
+    # Act
+    header = metrics.server_timing(0.010)
+
+    # Assert
+    assert header == (
+        'total;dur=10.00, db;dur=4.00;desc="1 queries", '
+        'redis;dur=1.00;desc="2 commands", app;dur=5.00'
+    )
+
+@pytest.mark.asyncio
+async def test_middleware_adds_server_timing_header(timed_app):
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=timed_app), base_url="http://test") as client:
+        response = await client.get("/")
+
+    # Assert
+    assert response.status_code == 200
+    assert 'db;dur=3.00;desc="2 queries"' in response.headers["Server-Timing"]
+    assert 'redis;dur=0.50;desc="1 commands"' in response.headers["Server-Timing"]
+
+def test_current_metrics_is_none_outside_requests():
+    # Act & Assert
+    assert current_metrics() is None
@@ -0,0 +1,30 @@
+from datetime import datetime, timezone
+
+from src.schemas import workout_report_split_schemas
+from src.schemas.workout_report_split_schemas import WorkoutSessionReport
+
+def frozen_datetime(now: datetime) -> type[datetime]:
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now.astimezone(tz)
+
+    return FrozenDatetime
+
+def test_report_date_defaults_to_the_current_utc_day(monkeypatch):
+    # Arrange
+    payload = {
+        "split": "A",
+        "workout_plan_id": 1,
+        "sets": [{"exercise_id": 1, "execution_order": 1, "set_number": 1, "reps": "5", "weight": 100}],
+    }
+
+    # Act
+    monkeypatch.setattr(workout_report_split_schemas, "datetime", frozen_datetime(datetime(2026, 10, 31, 23, 59, tzinfo=timezone.utc)))
+    before_midnight = WorkoutSessionReport.model_validate(payload)
+    monkeypatch.setattr(workout_report_split_schemas, "datetime", frozen_datetime(datetime(2026, 11, 1, 0, 1, tzinfo=timezone.utc)))
+    after_midnight = WorkoutSessionReport.model_validate(payload)
+
+    # Assert
+    assert str(before_midnight.report_date) == "2026-10-31"
+    assert str(after_midnight.report_date) == "2026-11-01"
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from argon2 import PasswordHasher
+
+from src.exceptions import PasswordHashingBusy
+from src.security.passwords import PasswordService
+
+# Cheapest parameters argon2 accepts, the tests check the plumbing and not the cost
+FAST = {"time_cost": 1, "memory_cost": 8, "parallelism": 1}
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify():
+    # Arrange
+    service = PasswordService(**FAST, workers=2, queue_limit=2)
+
+    # Act
+    password_hash = await service.hash("segredo")
+    valid = await service.verify(password_hash, "segredo")
+    invalid = await service.verify(password_hash, "errado")
+
+    # Assert
+    assert password_hash.startswith("$argon2id$")
+    assert valid == (True, None)
+    assert invalid == (False, None)
+    assert service.stats()["verifications"] == 2
+
+
+@pytest.mark.asyncio
+async def test_verify_rehashes_when_parameters_change():
+    # Arrange
+    old_hash = PasswordHasher(**FAST).hash("segredo")
+    service = PasswordService(time_cost=2, memory_cost=16, parallelism=1, workers=1, queue_limit=1)
+
+    # Act
+    valid, new_hash = await service.verify(old_hash, "segredo")
+
+    # Assert
+    assert valid
+    assert "m=16,t=2,p=1" in new_hash
+    assert await service.verify(new_hash, "segredo") == (True, None)
+    assert service.stats()["rehashes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_verify_invalid_hash():
+    # Arrange
+    service = PasswordService(**FAST, workers=1, queue_limit=1)
+
+    # Act
+    result = await service.verify("nao-e-um-hash", "segredo")
+
+    # Assert
+    assert result == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected():
+    # Arrange
+    service = PasswordService(time_cost=2, memory_cost=65536, parallelism=1, workers=1, queue_limit=1)
+
+    # Act
+    results = await asyncio.gather(*(service.hash("segredo") for _ in range(4)), return_exceptions=True)
+
+    # Assert
+    rejected = [result for result in results if isinstance(result, PasswordHashingBusy)]
+    assert len(rejected) == 2
+    assert service.stats()["rejected"] == 2
+    assert service.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_hashing_does_not_block_the_event_loop():
+    # Arrange
+    service = PasswordService(time_cost=3, memory_cost=65536, parallelism=1, workers=2, queue_limit=8)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.001)
+            ticks += 1
+
+    # Act
+    task = asyncio.create_task(ticker())
+    await asyncio.gather(*(service.hash("segredo") for _ in range(4)))
+    task.cancel()
+
+    # Assert
+    assert ticks > 10
@@ -0,0 +1,91 @@
+import time
+import jwt
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.config import SETTINGS
+from src.security.authentication import TokenClaimCache, TokenService
+
+def _credentials(payload: dict, key: str = SETTINGS.JWT_SESSION_KEY) -> HTTPAuthorizationCredentials:
+    token = jwt.encode(payload, key=key, algorithm=SETTINGS.JWT_ALGORITHM)
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+@pytest.fixture
+def claim_cache(monkeypatch):
+    cache = TokenClaimCache(max_size=2)
+    monkeypatch.setattr(TokenService, "claim_cache", cache)
+    return cache
+
+def test_get_returns_cached_user_id():
+    # Arrange
+    cache = TokenClaimCache()
+    cache.put("token", 1, time.time() + 60)
+
+    # Act
+    result = cache.get("token")
+
+    # Assert
+    assert result == 1
+    assert cache.stats()["hits"] == 1
+
+def test_get_evicts_expired_entries():
+    # Arrange
+    cache = TokenClaimCache()
+    cache.put("token", 1, time.time() - 1)
+
+    # Act
+    result = cache.get("token")
+
+    # Assert
+    assert result is None
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["misses"] == 1
+
+def test_put_evicts_least_recently_used():
+    # Arrange
+    cache = TokenClaimCache(max_size=2)
+    cache.put("first", 1, time.time() + 60)
+    cache.put("second", 2, time.time() + 60)
+    cache.get("first")
+
+    # Act
+    cache.put("third", 3, time.time() + 60)
+
+    # Assert
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+
+@pytest.mark.asyncio
+async def test_validate_token_caches_verified_tokens(claim_cache):
+    # Arrange
+    credentials = _credentials({"sub": "7", "exp": int(time.time()) + 60})
+
+    # Act
+    first = await TokenService.validate_token(credentials)
+    second = await TokenService.validate_token(credentials)
+
+    # Assert
+    assert first == second == 7
+    assert claim_cache.stats() == {"size": 1, "max_size": 2, "hits": 1, "misses": 1}
+
+@pytest.mark.asyncio
+async def test_validate_token_never_caches_invalid_tokens(claim_cache):
+    # Arrange
+    credentials = _credentials({"sub": "7", "exp": int(time.time()) + 60}, key="wrong-key")
+
+    # Act & Assert
+    for _ in range(2):
+        with pytest.raises(Exception):
+            await TokenService.validate_token(credentials)
+    assert claim_cache.stats()["size"] == 0
+
+@pytest.mark.asyncio
+async def test_validate_token_never_caches_expired_tokens(claim_cache):
+    # Arrange
+    credentials = _credentials({"sub": "7", "exp": int(time.time()) - 60})
+
+    # Act & Assert
+    with pytest.raises(Exception):
+        await TokenService.validate_token(credentials)
+    assert claim_cache.stats()["size"] == 0
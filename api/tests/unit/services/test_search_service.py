@@ -0,0 +1,10 @@
+from src.services.search_service import SearchService
+
+def test_normalize_term_folds_case_accents_and_spaces():
+    # Act / Assert
+    assert SearchService.normalize_term("  Supino   INCLINAÇÃO ") == "supino inclinacao"
+    assert SearchService.normalize_term("Flexão") == SearchService.normalize_term("flexao")
+
+def test_normalize_term_of_blank_input_is_empty():
+    # Act / Assert
+    assert SearchService.normalize_term("   ") == ""
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from src.utils.codec import CODECS, FastJSONResponse, get_codec
+
+PAYLOAD = [
+    {"groupName": "Tríceps", "userId": None, "deleted": False},
+    {"groupName": "Peito", "userId": 1, "deleted": True, "score": 0.5},
+]
+
+@pytest.mark.parametrize("name", CODECS)
+def test_codec_round_trip(name):
+    # Arrange
+    codec = get_codec(name)
+
+    # Act
+    decoded = codec.decode(codec.encode(PAYLOAD))
+
+    # Assert
+    assert decoded == PAYLOAD
+
+@pytest.mark.parametrize("name", CODECS)
+def test_codec_to_json_gives_json_document(name):
+    # Arrange
+    codec = get_codec(name)
+
+    # Act
+    body = codec.to_json(codec.encode(PAYLOAD))
+
+    # Assert
+    assert json.loads(body) == PAYLOAD
+
+def test_json_codecs_store_the_response_body():
+    # Arrange
+    encoded = get_codec("orjson").encode(PAYLOAD)
+
+    # Act / Assert
+    assert get_codec("orjson").to_json(encoded) is encoded
+    assert get_codec("json").encode(PAYLOAD) == encoded
+
+def test_get_codec_unknown_name():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        get_codec("pickle")
+
+def test_fast_json_response_renders_compact_utf8():
+    # Act
+    response = FastJSONResponse({"groupName": "Tríceps"})
+
+    # Assert
+    assert response.body == '{"groupName":"Tríceps"}'.encode()
+    assert response.headers["content-type"] == "application/json"
@@ -0,0 +1,22 @@
+from src.utils.etag import etag_headers, etag_matches
+
+def test_etag_matches_listed_tag():
+    # Act / Assert
+    assert etag_matches('"a", "b.1"', '"b.1"')
+    assert etag_matches('W/"b.1"', '"b.1"')
+    assert etag_matches("*", '"b.1"')
+
+def test_etag_does_not_match_other_or_missing_tag():
+    # Act / Assert
+    assert not etag_matches('"b.0"', '"b.1"')
+    assert not etag_matches(None, '"b.1"')
+    assert not etag_matches("", '"b.1"')
+
+def test_etag_headers_send_weak_etag_varying_on_encoding():
+    # Act
+    headers = etag_headers('"b.1"')
+
+    # Assert
+    assert headers["ETag"] == 'W/"b.1"'
+    assert headers["Vary"] == "Accept-Encoding"
+    assert etag_matches(headers["ETag"], '"b.1"')
@@ -0,0 +1,94 @@
+from unittest.mock import patch
+
+from src.utils.cache import LocalCache
+
+
+def test_get_returns_stored_value():
+    # Arrange
+    cache = LocalCache(max_bytes=1000, timeout=30)
+
+    # Act
+    cache.put("cache:test:all:v0:all", b"[1,2]", 30)
+
+    # Assert
+    assert cache.get("cache:test:all:v0:all") == b"[1,2]"
+
+def test_entry_expires_after_its_timeout():
+    # Arrange
+    cache = LocalCache(max_bytes=1000, timeout=30)
+    with patch("src.utils.cache.monotonic", return_value=100):
+        cache.put("key", b"value", 10)
+
+    # Act
+    with patch("src.utils.cache.monotonic", return_value=111):
+        result = cache.get("key")
+
+    # Assert
+    assert result is None
+    assert cache.size == 0
+
+def test_timeout_is_capped_at_local_timeout():
+    # Arrange
+    cache = LocalCache(max_bytes=1000, timeout=5)
+    with patch("src.utils.cache.monotonic", return_value=100):
+        cache.put("key", b"value", 300)
+
+    # Act
+    with patch("src.utils.cache.monotonic", return_value=106):
+        result = cache.get("key")
+
+    # Assert
+    assert result is None
+
+def test_evicts_least_recently_used_beyond_max_bytes():
+    # Arrange
+    cache = LocalCache(max_bytes=30, timeout=30)
+    cache.put("a", b"0123456789", 30)
+    cache.put("b", b"0123456789", 30)
+    cache.get("a")
+
+    # Act
+    cache.put("c", b"0123456789", 30)
+
+    # Assert
+    assert cache.get("a") == b"0123456789"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"0123456789"
+    assert cache.size <= 30
+    assert cache.stats()["evictions"] == 1
+
+def test_skips_values_larger_than_max_bytes():
+    # Arrange
+    cache = LocalCache(max_bytes=10, timeout=30)
+
+    # Act
+    cache.put("key", b"0123456789", 30)
+
+    # Assert
+    assert cache.get("key") is None
+    assert cache.size == 0
+
+def test_value_read_before_an_invalidation_is_not_stored():
+    # Arrange
+    cache = LocalCache(max_bytes=1000, timeout=30)
+    generation = cache.generation
+
+    # Act
+    cache.invalidate(["cache:test:version:1"])
+    cache.put("cache:test:version:1", 3, 30, generation)
+
+    # Assert
+    assert cache.get("cache:test:version:1") is None
+
+def test_invalidate_drops_keys():
+    # Arrange
+    cache = LocalCache(max_bytes=1000, timeout=30)
+    cache.put("cache:test:version:1", 3, 30)
+    cache.put("cache:test:version:2", 5, 30)
+
+    # Act
+    cache.invalidate(["cache:test:version:1"])
+
+    # Assert
+    assert cache.get("cache:test:version:1") is None
+    assert cache.get("cache:test:version:2") == 5
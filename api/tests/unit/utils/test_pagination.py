@@ -0,0 +1,32 @@
+import pytest
+
+from src.utils.pagination import decode_cursor, encode_cursor
+
+def test_cursor_round_trip():
+    # Arrange
+    values = [1, "Peito"]
+
+    # Act
+    result = decode_cursor(encode_cursor(values))
+
+    # Assert
+    assert result == values
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30=", "!!!"])
+def test_decode_cursor_rejects_malformed_cursor(cursor):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+@pytest.mark.parametrize("values", [[1], [1, "Peito", 2], ["1", "Peito"], [True, "Peito"], [1, None]])
+def test_decode_cursor_rejects_values_not_matching_columns(values):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor(values), (int, str))
+
+def test_decode_cursor_accepts_values_matching_columns():
+    # Act
+    result = decode_cursor(encode_cursor([1, "Peito"]), (int, str))
+
+    # Assert
+    assert result == [1, "Peito"]
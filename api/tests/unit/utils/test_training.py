@@ -0,0 +1,43 @@
+from datetime import date
+
+import pytest
+
+from src.utils.training import estimate_one_rep_max, parse_reps, week_start
+
+def test_parse_reps_reads_plain_numbers():
+    # Act / Assert
+    assert parse_reps("12") == 12
+    assert parse_reps(" 8 ") == 8
+
+def test_parse_reps_counts_free_text_as_zero():
+    # Act / Assert
+    assert parse_reps("falha") == 0
+    assert parse_reps("8-10") == 0
+    assert parse_reps("") == 0
+
+def test_parse_reps_counts_non_ascii_digits_as_zero():
+    # Act / Assert
+    assert parse_reps("²") == 0
+    assert parse_reps("١٢") == 0
+    assert parse_reps("１２") == 0
+
+def test_week_start_is_the_iso_monday():
+    # Act / Assert
+    assert week_start(date(2026, 10, 12)) == date(2026, 10, 12)  # segunda
+    assert week_start(date(2026, 10, 18)) == date(2026, 10, 12)  # domingo
+    assert week_start(date(2026, 1, 1)) == date(2025, 12, 29)  # semana ISO atravessando o ano
+
+def test_estimate_one_rep_max_formulas():
+    # Act / Assert
+    assert estimate_one_rep_max(100, 10, "epley") == pytest.approx(133.33, abs=0.01)
+    assert estimate_one_rep_max(100, 10, "brzycki") == pytest.approx(133.33, abs=0.01)
+    assert estimate_one_rep_max(100, 5, "epley") == pytest.approx(116.67, abs=0.01)
+    assert estimate_one_rep_max(100, 5, "brzycki") == pytest.approx(112.5)
+
+def test_estimate_one_rep_max_edge_cases():
+    # Act / Assert
+    assert estimate_one_rep_max(140, 1) == 140
+    assert estimate_one_rep_max(140, 0) == 0
+    assert estimate_one_rep_max(20, 50, "brzycki") == 720
+    with pytest.raises(ValueError):
+        estimate_one_rep_max(100, 5, "lombardi")
@@ -0,0 +1,5 @@
+#!/bin/bash
+set -e
+
+# Lets the db-replica service stream the WAL with the database credentials
+echo "host replication $POSTGRES_USER all scram-sha-256" >> "$PGDATA/pg_hba.conf"
@@ -0,0 +1,14 @@
+#!/bin/bash
+set -e
+
+# Hot standby of the db service: clones it on first start, then follows its WAL
+export PGPASSWORD="$POSTGRES_PASSWORD"
+if [ ! -s "$PGDATA/PG_VERSION" ]; then
+    until pg_basebackup --host=db --username="$POSTGRES_USER" --pgdata="$PGDATA" --write-recovery-conf --wal-method=stream; do
+        echo "Waiting for the primary"
+        sleep 2
+    done
+    chmod 0700 "$PGDATA"
+fi
+
+exec postgres